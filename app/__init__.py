@@ -7,8 +7,12 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 
-from app.api.router import register_blueprints, register_sockets
+from app.api.router import register_blueprints, register_commands, register_sockets
+from app.extensions.activity_log import init_activity_log
+from app.extensions.compression import init_compression
 from app.extensions.db import db, init_db
+from app.extensions.password_hashing import init_password_hashing
+from app.extensions.response_cache import init_response_cache
 from app.extensions.socketio import socketio
 
 
@@ -47,6 +51,8 @@ def create_app():
         print("SQLALCHEMY_DB_HOST:", app.config["DB_HOST"])
 
     init_db(app)
+    init_response_cache(app)
+    init_activity_log(app)
     Migrate(app, db)
 
     CORS(
@@ -79,11 +85,15 @@ def create_app():
 
         return response
 
+    init_compression(app)
+
     JWTManager(app)
 
     register_blueprints(app)
+    register_commands(app)
 
-    socketio.init_app(app)
+    socketio.init_app(app, async_mode=app.config["SOCKETIO_ASYNC_MODE"])
     register_sockets(socketio)
+    init_password_hashing(app, socketio.async_mode)
 
     return app
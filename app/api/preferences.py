@@ -0,0 +1,31 @@
+from flask import jsonify, request
+
+
+RETURN_MINIMAL = "minimal"
+RETURN_REPRESENTATION = "representation"
+
+
+def requested_return():
+    """The RFC 7240 `return` preference of the request, or None when absent."""
+    for header in request.headers.getlist("Prefer"):
+        for preference in header.split(","):
+            token = preference.split(";", 1)[0].strip()
+            name, _, value = token.partition("=")
+            if name.strip().lower() != "return":
+                continue
+            value = value.strip().strip('"').lower()
+            if value in (RETURN_MINIMAL, RETURN_REPRESENTATION):
+                return value
+    return None
+
+
+def prefers_minimal():
+    return requested_return() == RETURN_MINIMAL
+
+
+def minimal_response(body, status):
+    response = jsonify(body)
+    response.status_code = status
+    response.headers["Preference-Applied"] = f"return={RETURN_MINIMAL}"
+    response.vary.add("Prefer")
+    return response
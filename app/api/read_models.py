@@ -0,0 +1,106 @@
+import base64
+from datetime import datetime
+from decimal import Decimal
+from math import ceil
+
+from flask import current_app, request
+from sqlalchemy import and_, func, or_, select
+
+from db import db
+from utils.datetime_utils import to_local
+
+
+DEFAULT_PER_PAGE = 20
+MAX_KEYSET_LIMIT = 200
+
+
+def read_model_enabled():
+    """Endpoints listed in READ_MODEL_ENDPOINTS serve lists from plain Core rows."""
+    return request.endpoint in current_app.config.get("READ_MODEL_ENDPOINTS", ())
+
+
+def local_isoformat(value):
+    # Same output as a schema DateTime field passed through LocalDateTimeMixin.
+    if value is None:
+        return None
+    return to_local(value).isoformat()
+
+
+def decimal_string(value):
+    # Same output as fields.Decimal(as_string=True).
+    if value is None:
+        return None
+    return format(value, "f")
+
+
+def money_string(value):
+    # Same output as fields.Decimal(as_string=True, places=2).
+    if value is None:
+        return None
+    return format(Decimal(value).quantize(Decimal("0.01")), "f")
+
+
+def paginate_rows(stmt, page, per_page, mapper):
+    """Paginate a select() of plain rows with Query.paginate(error_out=False) semantics."""
+    page = page if page and page >= 1 else 1
+    per_page = per_page if per_page and per_page >= 1 else DEFAULT_PER_PAGE
+
+    total = db.session.execute(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    ).scalar_one()
+    rows = db.session.execute(stmt.limit(per_page).offset((page - 1) * per_page))
+    return {
+        "items": [mapper(row) for row in rows],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": ceil(total / per_page) if total else 0,
+    }
+
+
+def encode_cursor(created_at, row_id):
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """(created_at, id) from an encode_cursor token; ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def keyset_page(stmt, created_column, id_column, cursor, limit, mapper):
+    """Newest-first page of `stmt` after `cursor`, ordered by (created_at, id).
+
+    Unlike paginate_rows there is no COUNT and no OFFSET: each page is an
+    index range scan starting where the previous one stopped.
+    """
+    limit = min(limit if limit and limit >= 1 else DEFAULT_PER_PAGE, MAX_KEYSET_LIMIT)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # Spelled as OR rather than a row-value comparison so MySQL plans it
+        # as a range on the (..., created_at) index.
+        stmt = stmt.where(
+            or_(
+                created_column < created_at,
+                and_(created_column == created_at, id_column < row_id),
+            )
+        )
+    rows = db.session.execute(
+        stmt.order_by(created_column.desc(), id_column.desc()).limit(limit + 1)
+    ).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    last = rows[-1] if rows else None
+    return {
+        "items": [mapper(row) for row in rows],
+        "limit": limit,
+        "next_cursor": (
+            encode_cursor(last._mapping[created_column.key], last._mapping[id_column.key])
+            if has_more else None
+        ),
+    }
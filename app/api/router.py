@@ -18,6 +18,7 @@ from app.modules.clients.service_type_surcharge_rule_routes import (
 from app.modules.laundry.services.routes import laundry_service_bp
 from app.modules.laundry.service_extras.routes import laundry_service_extra_bp
 from app.modules.laundry.deliveries.routes import laundry_delivery_bp
+from app.modules.laundry.logs.routes import laundry_activity_log_bp
 from app.modules.laundry.garment_types.routes import garment_type_bp
 from app.modules.laundry.v2.garment_types.routes import garment_type_v2_bp
 from app.modules.laundry.v2.services.routes import laundry_service_v2_bp
@@ -29,7 +30,12 @@ from app.modules.catalogs.legacy.routes import (
     catalog_services_bp,
     service_variants_bp,
 )
+from app.modules.catalogs.bundle.routes import catalog_bundle_bp
+from app.modules.batch.routes import batch_bp
 
+from app.modules.auth.commands import auth_cli
+from app.modules.clients.commands import clients_cli
+from app.modules.laundry.services.commands import laundry_services_cli
 from app.modules.laundry.queue.socket import register_laundry_queue_socket
 
 
@@ -52,6 +58,7 @@ def register_blueprints(app):
     app.register_blueprint(laundry_service_bp)
     app.register_blueprint(laundry_service_extra_bp)
     app.register_blueprint(laundry_delivery_bp)
+    app.register_blueprint(laundry_activity_log_bp)
     app.register_blueprint(garment_type_bp)
     app.register_blueprint(garment_type_v2_bp)
     app.register_blueprint(laundry_service_v2_bp)
@@ -61,6 +68,14 @@ def register_blueprints(app):
     app.register_blueprint(service_categories_bp)
     app.register_blueprint(catalog_services_bp)
     app.register_blueprint(service_variants_bp)
+    app.register_blueprint(catalog_bundle_bp)
+    app.register_blueprint(batch_bp)
+
+
+def register_commands(app):
+    app.cli.add_command(auth_cli)
+    app.cli.add_command(clients_cli)
+    app.cli.add_command(laundry_services_cli)
 
 
 def register_sockets(socketio):
@@ -0,0 +1,79 @@
+from flask import Response, current_app, request, stream_with_context
+
+
+STREAM_FORMATS = ("json", "ndjson")
+STREAM_BATCH_SIZE = 500
+
+
+def requested_stream_format():
+    """Streaming is opt-in: ?stream=json|ndjson or Accept: application/x-ndjson."""
+    value = (request.args.get("stream") or "").strip().lower()
+    if value in STREAM_FORMATS:
+        return value
+    if "application/x-ndjson" in request.headers.get("Accept", ""):
+        return "ndjson"
+    return None
+
+
+def iter_query(query, batch_size=STREAM_BATCH_SIZE):
+    # yield_per reads through a server-side cursor. The rows must not trigger
+    # lazy/selectin loads: MySQL cannot run a second query on that connection
+    # until the cursor is drained.
+    return query.yield_per(batch_size)
+
+
+def iter_query_by_key(query, key_column, batch_size=STREAM_BATCH_SIZE, descending=False):
+    # Keyset batches for rows whose relationships need their own queries.
+    # `query` must not be ordered; ordering comes from `key_column`.
+    last_key = None
+    while True:
+        batch_query = query
+        if last_key is not None:
+            batch_query = batch_query.filter(key_column < last_key if descending else key_column > last_key)
+        order = key_column.desc() if descending else key_column.asc()
+        rows = batch_query.order_by(order).limit(batch_size).all()
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        last_key = getattr(rows[-1], key_column.key)
+
+
+def stream_items(rows, dump, stream_format, envelope=None, batch_size=STREAM_BATCH_SIZE):
+    """Serialize `rows` one at a time into a chunked response.
+
+    `json` keeps the buffered response shape: a bare array, or `envelope` with
+    the rows under "items" and the final count under "total". `ndjson` writes
+    one item per line.
+    """
+    json_provider = current_app.json
+
+    def dumps(value):
+        return json_provider.dumps(value, separators=(",", ":"))
+
+    def generate():
+        chunk = []
+        total = 0
+        if stream_format == "json":
+            if envelope is None:
+                chunk.append("[")
+            else:
+                head = dumps(dict(envelope))
+                chunk.append(head[:-1] + (',"items":[' if len(head) > 2 else '"items":['))
+        for row in rows:
+            item = dumps(dump(row))
+            if stream_format == "json":
+                chunk.append(item if total == 0 else "," + item)
+            else:
+                chunk.append(item + "\n")
+            total += 1
+            if len(chunk) >= batch_size:
+                yield "".join(chunk)
+                chunk = []
+        if stream_format == "json":
+            chunk.append("]" if envelope is None else f'],"total":{total}}}')
+        yield "".join(chunk)
+
+    mimetype = "application/x-ndjson" if stream_format == "ndjson" else "application/json"
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
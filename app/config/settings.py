@@ -7,6 +7,13 @@ def _csv_env(name, default):
     return [item.strip() for item in raw_value.split(",") if item.strip()]
 
 
+def _pre_ping_mode():
+    raw_value = os.getenv("DB_POOL_PRE_PING", "adaptive").strip().lower()
+    if raw_value == "adaptive":
+        return raw_value
+    return "true" if raw_value in ("true", "1", "t", "yes") else "false"
+
+
 def _require_env(name):
     value = os.getenv(name)
     if value is None or not value.strip():
@@ -22,27 +29,40 @@ class Config:
 
     SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:3306/{DB_NAME}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # "true" pings on every checkout, "adaptive" only connections idle longer
+    # than DB_POOL_PING_IDLE_SECONDS, "false" never.
+    DB_POOL_PRE_PING = _pre_ping_mode()
+    DB_POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", "30"))
     SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("true", "1", "t", "yes"),
+        "pool_pre_ping": DB_POOL_PRE_PING == "true",
         "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
         "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
         "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
     }
 
+    # "threading" or "eventlet" (green I/O, needs wsgi.py's monkey patching).
+    # Eventlet stays opt-in until benchmarks/serving_load_test.py shows it
+    # keeping Socket.IO acks up under mixed load against MySQL.
+    SOCKETIO_ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading").strip().lower()
+
     SECRET_KEY = os.getenv("SECRET_KEY", "mysuperawesome")
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwtawesometoken")
 
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=9)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=1)
+    # Role claims in access tokens and the user -> role cache are trusted for
+    # this long before the role is read again (other workers' role changes).
+    IDENTITY_CACHE_TTL_SECONDS = int(os.getenv("IDENTITY_CACHE_TTL_SECONDS", "300"))
 
     CORS_ORIGINS = _csv_env("CORS_ORIGINS", "*")
     CORS_ALLOW_HEADERS = _csv_env(
         "CORS_ALLOW_HEADERS",
-        "Authorization,Content-Type,Accept,Origin,X-Requested-With,Cache-Control,Pragma",
+        "Authorization,Content-Type,Accept,Origin,X-Requested-With,Cache-Control,Pragma,Prefer",
     )
     CORS_EXPOSE_HEADERS = _csv_env(
         "CORS_EXPOSE_HEADERS",
-        "Authorization,Content-Type",
+        "Authorization,Content-Type,Preference-Applied",
     )
     CORS_METHODS = _csv_env(
         "CORS_METHODS",
@@ -55,3 +75,52 @@ class Config:
         "yes",
     )
     CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
+
+    # Read by wsgi.py only: create_app() (CLI commands, tests) never loads clients.
+    CLIENT_SEARCH_WARMUP = os.getenv("CLIENT_SEARCH_WARMUP", "true").lower() in ("true", "1", "t", "yes")
+    CLIENT_SEARCH_SYNC_SECONDS = int(os.getenv("CLIENT_SEARCH_SYNC_SECONDS", "30"))
+
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() in ("true", "1", "t", "yes")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+    # Versions are per process; the TTL bounds staleness from other workers' writes.
+    RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+    RESPONSE_CACHE_MAX_BODY_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BODY_BYTES", str(1024 * 1024)))
+
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("true", "1", "t", "yes")
+    COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+    COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+    COMPRESSION_MIMETYPES = _csv_env("COMPRESSION_MIMETYPES", "application/json,application/x-ndjson")
+
+    BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+    # "async" writes activity logs from a background batch writer after commit;
+    # "sync" writes them in the committing thread (tests, one-off scripts).
+    ACTIVITY_LOG_MODE = os.getenv("ACTIVITY_LOG_MODE", "async").strip().lower()
+    ACTIVITY_LOG_MAX_QUEUE = int(os.getenv("ACTIVITY_LOG_MAX_QUEUE", "10000"))
+    ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "200"))
+    ACTIVITY_LOG_FLUSH_SECONDS = float(os.getenv("ACTIVITY_LOG_FLUSH_SECONDS", "1.0"))
+    ACTIVITY_LOG_DELAYED_SECONDS = float(os.getenv("ACTIVITY_LOG_DELAYED_SECONDS", "5.0"))
+
+    # "auto" follows the Socket.IO async_mode: eventlet's native thread pool
+    # under eventlet, a plain thread pool otherwise.
+    PASSWORD_HASH_MODE = os.getenv("PASSWORD_HASH_MODE", "auto").strip().lower()
+    PASSWORD_HASH_MAX_CONCURRENCY = int(os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", "4"))
+    PASSWORD_HASH_WAIT_SECONDS = float(os.getenv("PASSWORD_HASH_WAIT_SECONDS", "5.0"))
+
+    # How often a wsgi.py server process deletes expired refresh tokens (0
+    # disables it, e.g. when cron runs `flask auth purge-refresh-tokens`).
+    REFRESH_TOKEN_PURGE_SECONDS = int(os.getenv("REFRESH_TOKEN_PURGE_SECONDS", "3600"))
+    REFRESH_TOKEN_PURGE_BATCH_SIZE = int(os.getenv("REFRESH_TOKEN_PURGE_BATCH_SIZE", "1000"))
+
+    # Upper bound for POST /v2/laundry_services/bulk (route pickups are 10-40 bags).
+    BULK_INTAKE_MAX_SERVICES = int(os.getenv("BULK_INTAKE_MAX_SERVICES", "100"))
+
+    # Other workers' catalog writes reach the /catalog/bundle snapshot within this window.
+    CATALOG_BUNDLE_TTL_SECONDS = int(os.getenv("CATALOG_BUNDLE_TTL_SECONDS", "60"))
+    # Same bound for the per-role GET /menus trees.
+    MENU_TREE_TTL_SECONDS = int(os.getenv("MENU_TREE_TTL_SECONDS", "60"))
+
+    # Read-only list endpoints (Flask endpoint names) served from plain Core rows.
+    READ_MODEL_ENDPOINTS = _csv_env(
+        "READ_MODEL_ENDPOINTS",
+        "laundry_service_bp.get_compact,transaction_bp.get_all_transactions,laundry_delivery_bp.get_all",
+    )
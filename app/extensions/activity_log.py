@@ -0,0 +1,243 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.extensions.db import db
+from app.extensions.response_cache import table_versions
+from models.laundry_activity_log import LaundryActivityLog
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_activity_logs"
+_STOP = object()
+_atexit_registered = False
+
+# LaundryService.status -> LaundryActivityLog status enum. STARTED has no log value.
+STATUS_LOG_VALUES = {
+    "PENDING": "PENDIENTE",
+    "IN_PROGRESS": "EN_PROCESO",
+    "READY_FOR_DELIVERY": "LISTO_PARA_ENVIO",
+    "DELIVERED": "COMPLETADO",
+    "CANCELLED": "CANCELADO",
+}
+
+
+def map_status_to_log_enum(status):
+    return STATUS_LOG_VALUES.get(status)
+
+
+class ActivityLogWriter:
+    """Writes LaundryActivityLog rows after the request transaction commits.
+
+    record_activity() only buffers the row on the session; nothing is written unless
+    the session commits. Committed rows then go either straight to the
+    database in the committing thread ("sync", the default until
+    init_activity_log runs) or through a bounded queue drained by one
+    background thread in multi-row INSERTs ("async").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._engine = None
+        self._pid = None
+        self.mode = "sync"
+        self.batch_size = 200
+        self.flush_interval = 1.0
+        self.delayed_after = 5.0
+        self._counters = {}
+        self.reset_stats()
+
+    def configure(self, mode="async", max_queue=10000, batch_size=200, flush_interval=1.0, delayed_after=5.0):
+        self.stop()
+        self.mode = mode
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.delayed_after = delayed_after
+        self._queue = queue.Queue(maxsize=max(1, max_queue)) if mode == "async" else None
+
+    def reset_stats(self):
+        with self._lock:
+            self._counters = {
+                "recorded": 0,
+                "written": 0,
+                "batches": 0,
+                "dropped_queue_full": 0,
+                "dropped_write_failed": 0,
+                "delayed": 0,
+                "max_delay_ms": 0.0,
+            }
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats["mode"] = self.mode
+        stats["queued"] = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+    def start(self, engine):
+        self._engine = engine
+        if self.mode == "async":
+            self._ensure_worker()
+
+    def _ensure_worker(self):
+        # Threads do not survive a fork (e.g. a preloading server): each
+        # process starts its own worker on first use.
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._pid = os.getpid()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout=10.0):
+        """Drain everything still queued, then stop the worker."""
+        thread = self._thread
+        if thread is None or not thread.is_alive() or self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        self._thread = None
+
+    def flush(self):
+        """Block until every queued row has been written (or dropped)."""
+        if self._queue is not None and self._thread is not None:
+            self._queue.join()
+
+    def submit(self, rows, bind):
+        self._count("recorded", len(rows))
+        if self.mode != "async" or self._engine is None:
+            self._write(bind, rows)
+            return
+        self._ensure_worker()
+        enqueued_at = time.monotonic()
+        for row in rows:
+            try:
+                self._queue.put_nowait((enqueued_at, row))
+            except queue.Full:
+                self._count("dropped_queue_full")
+                logger.warning("Activity log queue full; dropped %s for service %s", row.get("action"), row.get("laundry_service_id"))
+
+    def _write(self, bind, rows):
+        try:
+            with bind.connect() as connection:
+                connection.execute(LaundryActivityLog.__table__.insert(), rows)
+                connection.commit()
+        except Exception:
+            logger.exception("Activity log write failed; dropped %s rows", len(rows))
+            self._count("dropped_write_failed", len(rows))
+            return
+        self._count("written", len(rows))
+        self._count("batches")
+        table_versions.bump([LaundryActivityLog.__tablename__])
+
+    def _take_batch(self):
+        # Block for the first row, then collect more for up to flush_interval.
+        batch = []
+        stop = False
+        deadline = None
+        while len(batch) < self.batch_size:
+            try:
+                if deadline is None:
+                    item = self._queue.get()
+                else:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.task_done()
+                stop = True
+                break
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+        return batch, stop
+
+    def _run(self):
+        while True:
+            batch, stop = self._take_batch()
+            if batch:
+                now = time.monotonic()
+                oldest = max(now - enqueued_at for enqueued_at, _ in batch)
+                with self._lock:
+                    self._counters["max_delay_ms"] = max(self._counters["max_delay_ms"], round(oldest * 1000, 1))
+                delayed = sum(1 for enqueued_at, _ in batch if now - enqueued_at > self.delayed_after)
+                if delayed:
+                    self._count("delayed", delayed)
+                self._write(self._engine, [row for _, row in batch])
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                # Anything queued behind the stop marker still gets written.
+                remaining = []
+                while True:
+                    try:
+                        remaining.append(self._queue.get_nowait()[1])
+                    except queue.Empty:
+                        break
+                    self._queue.task_done()
+                if remaining:
+                    self._write(self._engine, remaining)
+                return
+
+
+activity_log = ActivityLogWriter()
+
+
+def record_activity(session=None, **fields):
+    """Buffer one activity log row; it is written only if `session` commits."""
+    session = session or db.session()
+    _install_session_hooks()
+    session.info.setdefault(_PENDING_KEY, []).append(fields)
+
+
+def _submit_committed(session):
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        activity_log.submit(rows, session.get_bind())
+
+
+def _discard_rolled_back(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _install_session_hooks():
+    for name, listener in (
+        ("after_commit", _submit_committed),
+        ("after_rollback", _discard_rolled_back),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def init_activity_log(app):
+    activity_log.configure(
+        mode=app.config.get("ACTIVITY_LOG_MODE", "async"),
+        max_queue=app.config.get("ACTIVITY_LOG_MAX_QUEUE", 10000),
+        batch_size=app.config.get("ACTIVITY_LOG_BATCH_SIZE", 200),
+        flush_interval=app.config.get("ACTIVITY_LOG_FLUSH_SECONDS", 1.0),
+        delayed_after=app.config.get("ACTIVITY_LOG_DELAYED_SECONDS", 5.0),
+    )
+    _install_session_hooks()
+    with app.app_context():
+        activity_log.start(db.engine)
+    global _atexit_registered
+    # One writer per process, however many apps are created (tests, CLI).
+    if not _atexit_registered:
+        atexit.register(activity_log.stop)
+        _atexit_registered = True
@@ -0,0 +1,79 @@
+import gzip
+import zlib
+
+from flask import request
+
+
+NO_BODY_STATUSES = (204, 206, 304)
+
+
+def _gzip_stream(chunks, level):
+    # wbits=31 writes a gzip header/trailer around the deflate stream.
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            # A sync flush per chunk keeps streamed batches flowing to the client
+            # instead of waiting for the compressor's internal buffer to fill.
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def _should_compress(response, mimetypes):
+    if response.mimetype not in mimetypes:
+        return False
+    if response.status_code < 200 or response.status_code in NO_BODY_STATUSES:
+        return False
+    if response.direct_passthrough or "Content-Encoding" in response.headers:
+        return False
+    if "no-transform" in response.headers.get("Cache-Control", ""):
+        return False
+    return request.method != "HEAD"
+
+
+def compress_response(response, min_bytes, level, mimetypes):
+    """gzip `response` in place when the client accepts it and the body is worth it.
+
+    Streamed responses are compressed chunk by chunk as they are generated.
+    """
+    if not _should_compress(response, mimetypes):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response, level)
+        response.headers.pop("Content-Length", None)
+    else:
+        body = response.get_data()
+        if len(body) < min_bytes:
+            return response
+        response.set_data(gzip.compress(body, compresslevel=level))
+
+    response.headers["Content-Encoding"] = "gzip"
+    # The compressed bytes differ from the identity representation.
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    if not app.config.get("COMPRESSION_ENABLED", True):
+        return
+
+    min_bytes = app.config.get("COMPRESSION_MIN_BYTES", 1024)
+    level = app.config.get("COMPRESSION_LEVEL", 6)
+    mimetypes = frozenset(app.config.get("COMPRESSION_MIMETYPES", ("application/json", "application/x-ndjson")))
+
+    @app.after_request
+    def gzip_response(response):
+        return compress_response(response, min_bytes, level, mimetypes)
@@ -0,0 +1,164 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import timezone
+from functools import wraps
+
+from flask import current_app, request
+from sqlalchemy import func, select
+
+from app.extensions.db import db
+from app.extensions.response_cache import normalized_request_args, table_versions
+
+
+class ConditionalGetStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, not_modified):
+        with self._lock:
+            counters = self._endpoints.setdefault(endpoint, {"requests": 0, "not_modified": 0})
+            counters["requests"] += 1
+            if not_modified:
+                counters["not_modified"] += 1
+
+    def stats(self):
+        with self._lock:
+            endpoints = {
+                endpoint: {**counters, "hit_ratio": round(counters["not_modified"] / counters["requests"], 4)}
+                for endpoint, counters in self._endpoints.items()
+            }
+        requests = sum(counters["requests"] for counters in endpoints.values())
+        not_modified = sum(counters["not_modified"] for counters in endpoints.values())
+        return {
+            "requests": requests,
+            "not_modified": not_modified,
+            "hit_ratio": round(not_modified / requests, 4) if requests else None,
+            "endpoints": endpoints,
+        }
+
+
+conditional_get_stats = ConditionalGetStats()
+
+
+class ValidatorCache:
+    """ETag and Last-Modified of the last 200 served per (endpoint, arguments, table versions).
+
+    A revalidation that hits an entry is answered without running the view
+    or touching the database. Entries expire after `ttl_seconds` so writes
+    made by other workers are picked up, as with the response cache.
+    """
+
+    def __init__(self, max_entries=1024):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.max_entries = max_entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1:]
+
+    def set(self, key, etag, last_modified, ttl_seconds):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+validator_cache = ValidatorCache()
+
+
+def _table(model_or_table):
+    return getattr(model_or_table, "__table__", model_or_table)
+
+
+def _last_modified(tables):
+    # One aggregate per table that tracks updated_at; only run when the body changed.
+    last_modified = None
+    for table in tables:
+        if "updated_at" not in table.c:
+            continue
+        table_last_modified = db.session.execute(select(func.max(table.c.updated_at))).scalar()
+        if table_last_modified is not None and (last_modified is None or table_last_modified > last_modified):
+            last_modified = table_last_modified
+    if last_modified is not None and last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified
+
+
+def _is_not_modified(etag, last_modified):
+    # Only called for an item that exists, so "*" is safe to match.
+    if request.if_none_match:
+        return request.if_none_match.star_tag or request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def _conditional_response(response, etag, last_modified):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Browsers keep the copy but always revalidate it.
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def conditional_get(*models):
+    """Strong ETag / Last-Modified for a GET view, derived from the response body.
+
+    A revalidation for a body this process already served is answered with
+    304 before the view runs. Otherwise the view runs (a @cached_response hit
+    below keeps that cheap), and the 304 still saves sending the body. The
+    ETag is a hash of the body, so every worker agrees on it.
+
+    Place it below @jwt_required() and above @cached_response().
+    """
+    tables = tuple(_table(model) for model in models)
+    table_names = tuple(table.name for table in tables)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (request.endpoint, tuple(sorted(kwargs.items())), normalized_request_args(), table_versions.get(table_names))
+            validators = validator_cache.get(key)
+            if validators is not None and _is_not_modified(*validators):
+                conditional_get_stats.record(request.endpoint, True)
+                return _conditional_response(current_app.response_class(status=304), *validators)
+
+            response = current_app.make_response(view(*args, **kwargs))
+            # Errors (a missing item too, so If-None-Match: * does not match it) pass through.
+            if response.status_code != 200 or response.is_streamed:
+                conditional_get_stats.record(request.endpoint, False)
+                return response
+
+            etag = hashlib.sha1(response.get_data()).hexdigest()
+            if validators is not None and validators[0] == etag:
+                last_modified = validators[1]
+            else:
+                last_modified = _last_modified(tables)
+            validator_cache.set(key, etag, last_modified, current_app.config.get("RESPONSE_CACHE_TTL_SECONDS", 300))
+
+            not_modified = _is_not_modified(etag, last_modified)
+            conditional_get_stats.record(request.endpoint, not_modified)
+            if not_modified:
+                response = current_app.response_class(status=304)
+            return _conditional_response(response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import event
 
+from app.extensions.db_pool import TimedQueuePool, instrument_pool
+
 
 db = SQLAlchemy()
 
@@ -12,6 +14,15 @@ def _set_time_zone(conn, _):
 
 
 def init_db(app):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+        "poolclass": TimedQueuePool,
+    }
     db.init_app(app)
     with app.app_context():
         event.listen(db.engine, "connect", _set_time_zone)
+        instrument_pool(
+            db.engine,
+            app.config.get("DB_POOL_PRE_PING", "true"),
+            app.config.get("DB_POOL_PING_IDLE_SECONDS", 30.0),
+        )
@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+logger = logging.getLogger(__name__)
+
+_LAST_USED_KEY = "last_used"
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {
+                "checkouts": 0,
+                "connects": 0,
+                "invalidations": 0,
+                "soft_invalidations": 0,
+                "timeouts": 0,
+                "pings": 0,
+                "pings_skipped": 0,
+                "ping_failures": 0,
+                "total_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+            }
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def record_wait(self, seconds):
+        wait_ms = seconds * 1000
+        with self._lock:
+            self._counters["total_wait_ms"] = round(self._counters["total_wait_ms"] + wait_ms, 3)
+            self._counters["max_wait_ms"] = max(self._counters["max_wait_ms"], round(wait_ms, 3))
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats["avg_wait_ms"] = round(stats["total_wait_ms"] / stats["checkouts"], 3) if stats["checkouts"] else 0.0
+        return stats
+
+
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection.
+
+    The time includes opening a new connection when the pool grows into its
+    overflow.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_stats.count("timeouts")
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started)
+
+
+def pool_status(engine):
+    pool = engine.pool
+    status = {"class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    return status
+
+
+def instrument_pool(engine, pre_ping="true", ping_idle_seconds=30.0):
+    """Count pool events on `engine`; with pre_ping="adaptive", ping only idle connections.
+
+    SQLAlchemy's pool_pre_ping costs a round trip on every checkout. The
+    adaptive mode pings a connection only when it sat in the pool longer than
+    `ping_idle_seconds`, using the dialect's own ping, so a connection dropped
+    by the server or a proxy while idle is still replaced transparently.
+    """
+    dialect = engine.dialect
+
+    def on_connect(dbapi_connection, connection_record):
+        pool_stats.count("connects")
+        connection_record.info[_LAST_USED_KEY] = time.monotonic()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_stats.count("checkouts")
+        if pre_ping != "adaptive":
+            return
+        last_used = connection_record.info.get(_LAST_USED_KEY)
+        if last_used is not None and time.monotonic() - last_used < ping_idle_seconds:
+            pool_stats.count("pings_skipped")
+            return
+        pool_stats.count("pings")
+        try:
+            dialect.do_ping(dbapi_connection)
+        except Exception as error:
+            pool_stats.count("ping_failures")
+            logger.info("Idle pooled connection failed its ping (%s); reconnecting", error)
+            # The pool invalidates this connection and retries the checkout.
+            raise exc.DisconnectionError() from error
+
+    def on_checkin(dbapi_connection, connection_record):
+        if connection_record is not None:
+            connection_record.info[_LAST_USED_KEY] = time.monotonic()
+
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_stats.count("invalidations")
+
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        pool_stats.count("soft_invalidations")
+
+    for name, listener in (
+        ("connect", on_connect),
+        ("checkout", on_checkout),
+        ("checkin", on_checkin),
+        ("invalidate", on_invalidate),
+        ("soft_invalidate", on_soft_invalidate),
+    ):
+        event.listen(engine.pool, name, listener)
+
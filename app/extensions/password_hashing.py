@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import jsonify
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusy(Exception):
+    pass
+
+
+class PasswordHasher:
+    """Runs werkzeug password hashing/verification off the request thread.
+
+    PBKDF2 holds the CPU for tens to hundreds of milliseconds. Under eventlet
+    that call would stop the hub, and with it every socket on the worker, so
+    the work goes to eventlet's native thread pool ("eventlet") or to a small
+    ThreadPoolExecutor ("thread"). hashlib releases the GIL while it hashes.
+    At most `max_concurrency` calls run at once; a caller that cannot get a
+    slot within `wait_seconds` gets PasswordHashingBusy instead of queueing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self.mode = "thread"
+        self.max_concurrency = 4
+        self.wait_seconds = 5.0
+        self._counters = {}
+        self.configure()
+
+    def configure(self, mode="thread", max_concurrency=4, wait_seconds=5.0):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.mode = mode
+        self.max_concurrency = max(1, max_concurrency)
+        self.wait_seconds = wait_seconds
+        if mode == "eventlet":
+            # A green semaphore: waiting callers yield to the hub instead of blocking it.
+            from eventlet.semaphore import Semaphore
+
+            self._slots = Semaphore(self.max_concurrency)
+        else:
+            self._slots = threading.BoundedSemaphore(self.max_concurrency)
+            self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="password-hash")
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self._counters = {
+                "hashed": 0,
+                "verified": 0,
+                "rejected_busy": 0,
+                "in_flight": 0,
+                "total_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+                "total_run_ms": 0.0,
+                "max_run_ms": 0.0,
+            }
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        calls = stats["hashed"] + stats["verified"]
+        stats["avg_run_ms"] = round(stats["total_run_ms"] / calls, 1) if calls else 0.0
+        stats["mode"] = self.mode
+        stats["max_concurrency"] = self.max_concurrency
+        return stats
+
+    def hash(self, password):
+        return self._call("hashed", generate_password_hash, password)
+
+    def verify(self, pwhash, password):
+        return self._call("verified", check_password_hash, pwhash, password)
+
+    def _call(self, counter, fn, *args):
+        waiting_since = time.monotonic()
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            with self._lock:
+                self._counters["rejected_busy"] += 1
+            logger.warning("Password hashing busy: %s calls in flight", self.max_concurrency)
+            raise PasswordHashingBusy()
+        started = time.monotonic()
+        with self._lock:
+            self._counters["in_flight"] += 1
+        try:
+            return self._execute(fn, *args)
+        finally:
+            finished = time.monotonic()
+            self._slots.release()
+            wait_ms = (started - waiting_since) * 1000
+            run_ms = (finished - started) * 1000
+            with self._lock:
+                counters = self._counters
+                counters["in_flight"] -= 1
+                counters[counter] += 1
+                counters["total_wait_ms"] = round(counters["total_wait_ms"] + wait_ms, 1)
+                counters["max_wait_ms"] = max(counters["max_wait_ms"], round(wait_ms, 1))
+                counters["total_run_ms"] = round(counters["total_run_ms"] + run_ms, 1)
+                counters["max_run_ms"] = max(counters["max_run_ms"], round(run_ms, 1))
+
+    def _execute(self, fn, *args):
+        if self.mode == "eventlet":
+            from eventlet import tpool
+
+            return tpool.execute(fn, *args)
+        return self._executor.submit(fn, *args).result()
+
+
+password_hasher = PasswordHasher()
+
+
+def hash_password(password):
+    return password_hasher.hash(password)
+
+
+def verify_password(pwhash, password):
+    return password_hasher.verify(pwhash, password)
+
+
+def _busy_response(_error):
+    response = jsonify({"error": "Too many password checks in progress, please retry"})
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+def init_password_hashing(app, async_mode=None):
+    mode = app.config.get("PASSWORD_HASH_MODE", "auto")
+    if mode == "auto":
+        # Follow the server's concurrency model (Flask-SocketIO's async_mode).
+        mode = "eventlet" if async_mode == "eventlet" else "thread"
+    password_hasher.configure(
+        mode=mode,
+        max_concurrency=app.config.get("PASSWORD_HASH_MAX_CONCURRENCY", 4),
+        wait_seconds=app.config.get("PASSWORD_HASH_WAIT_SECONDS", 5.0),
+    )
+    app.register_error_handler(PasswordHashingBusy, _busy_response)
@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, attributes
+
+
+class TableVersions:
+    """Per-table counters bumped after every commit that wrote to the table.
+
+    Counters are per process; RESPONSE_CACHE_TTL_SECONDS bounds how long
+    another worker's writes can go unnoticed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+
+    def get(self, tables):
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def bump(self, tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._versions)
+
+
+class ResponseCache:
+    """Size-bounded LRU of rendered GET responses."""
+
+    def __init__(self, max_entries=512, ttl_seconds=300, max_body_bytes=1024 * 1024):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.configure(max_entries, ttl_seconds, max_body_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_entries, ttl_seconds, max_body_bytes):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_body_bytes = max_body_bytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, size):
+        if size > self.max_body_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+table_versions = TableVersions()
+response_cache = ResponseCache()
+
+_CHANGED_TABLES_KEY = "response_cache_changed_tables"
+
+
+def _table_name(model_or_table):
+    table = getattr(model_or_table, "__table__", model_or_table)
+    return table.name
+
+
+def _changed_tables(session):
+    return session.info.setdefault(_CHANGED_TABLES_KEY, set())
+
+
+def _record_flush(session, _flush_context):
+    changed = _changed_tables(session)
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        mapper = inspect(instance).mapper
+        changed.update(table.name for table in mapper.tables)
+        # Many-to-many rows (e.g. menu_roles) live outside the mapped tables.
+        for relationship in mapper.relationships:
+            if relationship.secondary is not None and attributes.get_history(instance, relationship.key).has_changes():
+                changed.add(relationship.secondary.name)
+
+
+def _record_bulk_statement(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _changed_tables(orm_execute_state.session).add(table.name)
+
+
+def _bump_committed(session):
+    changed = session.info.pop(_CHANGED_TABLES_KEY, None)
+    if changed:
+        table_versions.bump(changed)
+
+
+def _discard_rolled_back(session):
+    session.info.pop(_CHANGED_TABLES_KEY, None)
+
+
+def init_response_cache(app):
+    response_cache.configure(
+        app.config.get("RESPONSE_CACHE_MAX_ENTRIES", 512),
+        app.config.get("RESPONSE_CACHE_TTL_SECONDS", 300),
+        app.config.get("RESPONSE_CACHE_MAX_BODY_BYTES", 1024 * 1024),
+    )
+    for name, listener in (
+        ("after_flush", _record_flush),
+        ("do_orm_execute", _record_bulk_statement),
+        ("after_commit", _bump_committed),
+        ("after_rollback", _discard_rolled_back),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def normalized_request_args():
+    return tuple(sorted((key, tuple(values)) for key, values in request.args.lists()))
+
+
+def cached_response(*models):
+    """Cache a GET view's 200 response until a commit touches one of `models`.
+
+    Place it below @jwt_required() so authentication still runs on hits.
+    """
+    tables = tuple(_table_name(model) for model in models)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get("RESPONSE_CACHE_ENABLED", True):
+                return view(*args, **kwargs)
+
+            key = (request.endpoint, tuple(sorted(kwargs.items())), normalized_request_args(), table_versions.get(tables))
+            cached = response_cache.get(key)
+            if cached is not None:
+                body, mimetype = cached
+                response = current_app.response_class(body, status=200, mimetype=mimetype)
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                body = response.get_data()
+                response_cache.set(key, (body, response.mimetype), len(body))
+            response.headers["X-Cache"] = "MISS"
+            return response
+
+        return wrapper
+
+    return decorator
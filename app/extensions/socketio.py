@@ -1,3 +1,4 @@
 from flask_socketio import SocketIO
 
-socketio = SocketIO(cors_allowed_origins="*", async_mode="eventlet")
+# async_mode comes from SOCKETIO_ASYNC_MODE at init_app time (see wsgi.py).
+socketio = SocketIO(cors_allowed_origins="*")
@@ -0,0 +1,15 @@
+import click
+from flask.cli import AppGroup
+
+from app.modules.auth.token_store import purge_expired_refresh_tokens, purge_stats
+
+
+auth_cli = AppGroup("auth", help="Authentication maintenance commands.")
+
+
+@auth_cli.command("purge-refresh-tokens")
+@click.option("--batch-size", default=1000, show_default=True, type=int)
+def purge_refresh_tokens(batch_size):
+    """Delete refresh tokens whose expiry has passed."""
+    deleted = purge_expired_refresh_tokens(batch_size)
+    click.echo(f"Purged {deleted} expired refresh tokens in {purge_stats.stats()['last_duration_ms']} ms")
@@ -1,5 +1,4 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.security import check_password_hash
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
@@ -10,6 +9,9 @@ from flask_jwt_extended import (
 )
 from datetime import datetime
 from db import db
+from app.extensions.password_hashing import verify_password
+from app.modules.auth.token_store import is_refresh_token_active, revoke_refresh_token
+from app.services.identity import identity_claims, lookup_role_id
 from models.user import User
 from models.refresh_token import RefreshToken
 from schemas.user_schema import UserSchema
@@ -30,10 +32,10 @@ def login():
     if not user:
         return jsonify({"error": "Invalid username or password"}), 401
 
-    if not check_password_hash(user.password, password):
+    if not verify_password(user.password, password):
         return jsonify({"error": "Invalid username or password"}), 401
 
-    access_token = create_access_token(identity=user.id)
+    access_token = create_access_token(identity=user.id, additional_claims=identity_claims(user.role_id))
     refresh_token = create_refresh_token(identity=user.id)
 
     # Decodificar el refresh token para obtener jti y exp
@@ -64,14 +66,17 @@ def login():
 @jwt_required(refresh=True)
 def refresh():
     current_user_id = get_jwt_identity()
-    jti = get_jwt()["jti"]
+    claims = get_jwt()
 
     # Validar que el token no esté revocado
-    stored_token = RefreshToken.query.filter_by(jti=jti, revoked=False).first()
-    if not stored_token:
+    if not is_refresh_token_active(claims["jti"], claims["exp"]):
         return jsonify({"error": "Refresh token is revoked or invalid"}), 401
 
-    new_access_token = create_access_token(identity=current_user_id)
+    role_id = lookup_role_id(current_user_id)
+    if role_id is None:
+        return jsonify({"error": "Refresh token is revoked or invalid"}), 401
+
+    new_access_token = create_access_token(identity=current_user_id, additional_claims=identity_claims(role_id))
 
     return jsonify({
         "message": "Token refreshed",
@@ -82,11 +87,7 @@ def refresh():
 @auth_bp.route("/logout", methods=["POST"])
 @jwt_required(refresh=True)
 def logout():
-    jti = get_jwt()["jti"]
-    stored_token = RefreshToken.query.filter_by(jti=jti, revoked=False).first()
-
-    if stored_token:
-        stored_token.revoked = True
-        db.session.commit()
+    claims = get_jwt()
+    revoke_refresh_token(claims["jti"], claims["exp"])
 
     return jsonify({"message": "Logout successful"}), 200
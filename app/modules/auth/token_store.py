@@ -0,0 +1,199 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, func, select, update
+
+from db import db
+from models.refresh_token import RefreshToken
+
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedTokens:
+    """jti -> expiry (epoch seconds) of refresh tokens known to be revoked.
+
+    A hit answers /auth/refresh without touching refresh_tokens. Entries are
+    only needed until the token would have expired anyway. Tokens revoked on
+    another worker are still caught by the database lookup.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            self._entries[jti] = expires_at
+
+    def contains(self, jti):
+        with self._lock:
+            expires_at = self._entries.get(jti)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._entries[jti]
+                return False
+            self.hits += 1
+            return True
+
+    def prune(self):
+        now = time.time()
+        with self._lock:
+            for jti in [jti for jti, expires_at in self._entries.items() if expires_at <= now]:
+                del self._entries[jti]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits}
+
+
+revoked_tokens = RevokedTokens()
+
+
+def is_refresh_token_active(jti, expires_at):
+    if revoked_tokens.contains(jti):
+        return False
+    active = db.session.execute(
+        select(RefreshToken.id).where(RefreshToken.jti == jti, RefreshToken.revoked == False)
+    ).first()
+    if active is None:
+        revoked_tokens.add(jti, expires_at)
+        return False
+    return True
+
+
+def revoke_refresh_token(jti, expires_at):
+    db.session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == jti, RefreshToken.revoked == False)
+        .values(revoked=True)
+    )
+    db.session.commit()
+    revoked_tokens.add(jti, expires_at)
+
+
+class PurgeStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {
+                "runs": 0,
+                "deleted": 0,
+                "last_deleted": 0,
+                "last_duration_ms": None,
+                "max_duration_ms": 0.0,
+                "last_run_at": None,
+            }
+
+    def record(self, deleted, duration_ms):
+        with self._lock:
+            counters = self._counters
+            counters["runs"] += 1
+            counters["deleted"] += deleted
+            counters["last_deleted"] = deleted
+            counters["last_duration_ms"] = round(duration_ms, 1)
+            counters["max_duration_ms"] = max(counters["max_duration_ms"], round(duration_ms, 1))
+            counters["last_run_at"] = datetime.utcnow().isoformat()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters)
+
+
+purge_stats = PurgeStats()
+
+
+def purge_expired_refresh_tokens(batch_size=1000, now=None):
+    """Delete expired refresh tokens, `batch_size` rows per transaction.
+
+    Short transactions keep the DELETE from holding locks that /auth/login
+    inserts would wait on. Returns the number of rows removed.
+    """
+    now = now or datetime.utcnow()
+    started = time.monotonic()
+    deleted = 0
+    while True:
+        ids = db.session.execute(
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < now)
+            .order_by(RefreshToken.expires_at)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        db.session.execute(delete(RefreshToken).where(RefreshToken.id.in_(ids)))
+        db.session.commit()
+        deleted += len(ids)
+        if len(ids) < batch_size:
+            break
+    revoked_tokens.prune()
+    purge_stats.record(deleted, (time.monotonic() - started) * 1000)
+    return deleted
+
+
+class RefreshTokenPurger:
+    """Runs purge_expired_refresh_tokens every `interval` seconds in a daemon thread."""
+
+    def __init__(self):
+        self._thread = None
+        self._stop = threading.Event()
+        self._pid = None
+
+    def start(self, app, interval, batch_size):
+        if interval <= 0:
+            return
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._run, args=(app, interval, batch_size), name="refresh-token-purge", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, app, interval, batch_size):
+        while not self._stop.wait(interval):
+            with app.app_context():
+                try:
+                    purge_expired_refresh_tokens(batch_size)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("Refresh token purge failed")
+                finally:
+                    db.session.remove()
+
+
+refresh_token_purger = RefreshTokenPurger()
+
+
+def refresh_token_stats():
+    return {
+        "table_rows": db.session.execute(select(func.count()).select_from(RefreshToken)).scalar(),
+        "purge": purge_stats.stats(),
+        "revoked_cache": revoked_tokens.stats(),
+    }
+
+
+def init_refresh_token_store(app):
+    refresh_token_purger.start(
+        app,
+        app.config.get("REFRESH_TOKEN_PURGE_SECONDS", 3600),
+        app.config.get("REFRESH_TOKEN_PURGE_BATCH_SIZE", 1000),
+    )
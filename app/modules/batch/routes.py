@@ -0,0 +1,134 @@
+import time
+from functools import wraps
+
+from flask import Blueprint, current_app, g, jsonify, request
+from flask_jwt_extended import jwt_required
+from werkzeug.http import HTTP_STATUS_CODES
+
+from db import db
+
+
+batch_bp = Blueprint("batch_bp", __name__, url_prefix="/batch")
+
+# Request headers a sub-request inherits from the batch request.
+FORWARDED_HEADERS = ("Authorization", "Accept-Language")
+SUB_REQUEST_HEADERS = ("If-None-Match", "If-Modified-Since", "Accept")
+
+
+def _decode_once_per_batch(decode):
+    # Sub-requests forward the batch's Authorization header, so jwt_required
+    # would verify the same token again for each of them. While a batch runs,
+    # `g` (shared by its sub-requests) remembers what was verified already.
+    @wraps(decode)
+    def decode_token(encoded_token, csrf_value=None, allow_expired=False):
+        verified = g.get("_batch_verified_tokens")
+        if verified is None:
+            return decode(encoded_token, csrf_value, allow_expired)
+        key = (encoded_token, csrf_value, allow_expired)
+        if key not in verified:
+            verified[key] = decode(encoded_token, csrf_value, allow_expired)
+        return verified[key]
+
+    return decode_token
+
+
+@batch_bp.record_once
+def _reuse_verified_tokens(state):
+    jwt_manager = state.app.extensions.get("flask-jwt-extended")
+    if jwt_manager is not None:
+        jwt_manager._decode_jwt_from_config = _decode_once_per_batch(jwt_manager._decode_jwt_from_config)
+
+
+@batch_bp.before_request
+def _start_batch():
+    g._batch_verified_tokens = {}
+
+
+def _parse_sub_requests(json_data):
+    items = json_data.get("requests") if isinstance(json_data, dict) else None
+    if not isinstance(items, list) or not items:
+        return None, "requests must be a non-empty list"
+    max_requests = current_app.config.get("BATCH_MAX_REQUESTS", 20)
+    if len(items) > max_requests:
+        return None, f"A batch can hold at most {max_requests} requests"
+
+    sub_requests = []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            item = {"path": item}
+        if not isinstance(item, dict):
+            return None, f"requests[{index}] must be a path or an object"
+        path = item.get("path")
+        method = str(item.get("method", "GET")).upper()
+        headers = item.get("headers") or {}
+        if not isinstance(path, str) or not path.startswith("/"):
+            return None, f"requests[{index}].path must start with /"
+        if path.split("?", 1)[0].rstrip("/") == batch_bp.url_prefix:
+            return None, f"requests[{index}] cannot call /batch"
+        if method != "GET":
+            return None, f"requests[{index}]: only GET sub-requests are supported"
+        if not isinstance(headers, dict):
+            return None, f"requests[{index}].headers must be an object"
+        sub_requests.append({
+            "id": item.get("id", index),
+            "path": path,
+            "headers": {key: str(value) for key, value in headers.items() if key in SUB_REQUEST_HEADERS},
+        })
+    return sub_requests, None
+
+
+def _response_body(response):
+    if response.status_code == 304:
+        return None
+    if response.is_json:
+        return response.get_json()
+    if response.status_code >= 400:
+        # Werkzeug's HTML error pages are useless inside a JSON envelope.
+        return {"error": HTTP_STATUS_CODES.get(response.status_code, "Error")}
+    return response.get_data(as_text=True)
+
+
+def _run_sub_request(app, sub_request, forwarded_headers):
+    headers = {**forwarded_headers, **sub_request["headers"]}
+    started = time.perf_counter()
+    # The batch request's app context stays active, so every sub-request
+    # shares its db.session and `g` instead of opening new ones.
+    with app.test_request_context(sub_request["path"], method="GET", headers=headers, base_url=request.host_url):
+        try:
+            response = app.full_dispatch_request()
+        except Exception:
+            db.session.rollback()
+            current_app.logger.exception("Batch sub-request %s failed", sub_request["path"])
+            response = jsonify({"error": "Internal server error"})
+            response.status_code = 500
+        result = {
+            "id": sub_request["id"],
+            "path": sub_request["path"],
+            "status": response.status_code,
+            "body": _response_body(response),
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+        etag = response.headers.get("ETag")
+        if etag:
+            result["etag"] = etag
+        return result
+
+
+@batch_bp.route("", methods=["POST"])
+@jwt_required()
+def run_batch():
+    json_data = request.get_json(silent=True)
+    if not json_data:
+        return jsonify({"error": "No input data provided"}), 400
+    sub_requests, error = _parse_sub_requests(json_data)
+    if error:
+        return jsonify({"error": error}), 400
+
+    app = current_app._get_current_object()
+    forwarded_headers = {key: request.headers[key] for key in FORWARDED_HEADERS if key in request.headers}
+    started = time.perf_counter()
+    responses = [_run_sub_request(app, sub_request, forwarded_headers) for sub_request in sub_requests]
+    return jsonify({
+        "responses": responses,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }), 200
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from db import db
+from app.extensions.response_cache import cached_response
 from models.payment_type import PaymentType
 from schemas.payment_type_schema import PaymentTypeSchema
 
@@ -11,6 +12,7 @@ payment_type_list_schema = PaymentTypeSchema(many=True)
 
 @payment_type_bp.route("", methods=["GET"])
 @jwt_required()
+@cached_response(PaymentType)
 def get_all_payment_types():
     query = PaymentType.query
     is_active = request.args.get("is_active")
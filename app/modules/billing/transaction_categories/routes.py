@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from db import db
+from app.extensions.response_cache import cached_response
 from models.transaction_category import TransactionCategory
 from schemas.transaction_category import TransactionCategorySchema
 
@@ -10,6 +11,7 @@ transaction_categories_schema = TransactionCategorySchema(many=True)
 
 @transaction_category_bp.route('', methods=['GET'])
 @jwt_required()
+@cached_response(TransactionCategory)
 def get_all_categories():
     categories = TransactionCategory.query.order_by(TransactionCategory.created_at.desc()).all()
     return jsonify(transaction_categories_schema.dump(categories)), 200
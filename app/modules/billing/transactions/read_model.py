@@ -0,0 +1,65 @@
+from sqlalchemy import select
+
+from app.api.read_models import decimal_string, local_isoformat
+from models.client import Client
+from models.payment_type import PaymentType
+from models.transaction import Transaction
+from models.transaction_category import TransactionCategory
+from models.user import User
+
+
+def transaction_rows_select():
+    """Columns behind TransactionSchema, without ORM entities."""
+    return (
+        select(
+            Transaction.id,
+            Transaction.user_id,
+            Transaction.transaction_type,
+            Transaction.payment_type_id,
+            Transaction.category_id,
+            Transaction.detail,
+            Transaction.amount,
+            Transaction.created_at,
+            Transaction.updated_at,
+            Transaction.client_id,
+            User.id.label("user_ref_id"),
+            User.name.label("user_name"),
+            PaymentType.id.label("payment_type_ref_id"),
+            PaymentType.name.label("payment_type_name"),
+            TransactionCategory.id.label("category_ref_id"),
+            TransactionCategory.category_name.label("category_name"),
+            Client.id.label("client_ref_id"),
+            Client.name.label("client_name"),
+        )
+        .select_from(Transaction)
+        .outerjoin(User, User.id == Transaction.user_id)
+        .outerjoin(PaymentType, PaymentType.id == Transaction.payment_type_id)
+        .outerjoin(TransactionCategory, TransactionCategory.id == Transaction.category_id)
+        .outerjoin(Client, Client.id == Transaction.client_id)
+    )
+
+
+def map_transaction_row(row):
+    item = {
+        "id": row.id,
+        "user_id": row.user_id,
+        "transaction_type": row.transaction_type,
+        "payment_type_id": row.payment_type_id,
+        "category_id": row.category_id,
+        "detail": row.detail,
+        "amount": decimal_string(row.amount),
+        "created_at": local_isoformat(row.created_at),
+        "updated_at": local_isoformat(row.updated_at),
+        "client_id": row.client_id,
+    }
+    # The schema reads these through relationships and omits them when the
+    # related row is missing.
+    if row.user_ref_id is not None:
+        item["user_name"] = row.user_name
+    if row.payment_type_ref_id is not None:
+        item["payment_type_name"] = row.payment_type_name
+    if row.category_ref_id is not None:
+        item["category_name"] = row.category_name
+    if row.client_ref_id is not None:
+        item["client_name"] = row.client_name
+    return item
@@ -3,6 +3,8 @@ from flask_jwt_extended import jwt_required
 from datetime import datetime
 import calendar
 from db import db
+from app.api.read_models import paginate_rows, read_model_enabled
+from app.modules.billing.transactions.read_model import map_transaction_row, transaction_rows_select
 from models.transaction import Transaction
 from models.user import User
 from models.payment_type import PaymentType
@@ -58,25 +60,32 @@ def get_all_transactions():
         start_date = datetime(year, month, 1, 0, 0, 0, 0)
         end_date = datetime(year, month, last_day_of_month, 23, 59, 59, 999999)
 
-    query = Transaction.query.options(
-        joinedload(Transaction.client),
-        joinedload(Transaction.category),
-        joinedload(Transaction.payment_type),
-        joinedload(Transaction.user)
-    )
+    use_read_model = read_model_enabled()
+    if use_read_model:
+        query = transaction_rows_select()
+    else:
+        query = Transaction.query.options(
+            joinedload(Transaction.client),
+            joinedload(Transaction.category),
+            joinedload(Transaction.payment_type),
+            joinedload(Transaction.user)
+        )
 
     if user_id == "":
         user_id = None
 
     if user_id is not None:
         user_id = int(user_id)
-        query = query.filter_by(user_id=user_id)
+        query = query.filter(Transaction.user_id == user_id)
 
     query = query.filter(
         Transaction.created_at >= start_date,
         Transaction.created_at <= end_date
     ).order_by(Transaction.created_at.desc())
 
+    if use_read_model:
+        return jsonify(paginate_rows(query, page, per_page, map_transaction_row)), 200
+
     # Paginado con SQLAlchemy paginate
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
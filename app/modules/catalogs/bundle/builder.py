@@ -0,0 +1,193 @@
+import gzip
+import hashlib
+import threading
+import time
+
+from flask import current_app
+
+from app.extensions.response_cache import table_versions
+from models.catalog_service_legacy import CatalogServiceLegacy
+from models.extra import Extra
+from models.garment_type import GarmentType
+from models.global_setting import GlobalSetting
+from models.payment_type import PaymentType
+from models.service_category_legacy import ServiceCategoryLegacy
+from models.service_extra_type import ServiceExtraType
+from models.service_variant_legacy import ServiceVariantLegacy
+from models.transaction_category import TransactionCategory
+from schemas.catalog_service_legacy_schema import CatalogServiceLegacySchema
+from schemas.extra_schema import ExtraSchema
+from schemas.garment_type_schema import GarmentTypeSchema
+from schemas.garment_type_v2_schema import GarmentTypeV2Schema
+from schemas.global_setting_schema import GlobalSettingSchema
+from schemas.payment_type_schema import PaymentTypeSchema
+from schemas.service_category_legacy_schema import ServiceCategoryLegacySchema
+from schemas.service_extra_type_schema import ServiceExtraTypeSchema
+from schemas.service_variant_legacy_schema import ServiceVariantLegacySchema
+from schemas.transaction_category import TransactionCategorySchema
+
+
+class BundleSection:
+    def __init__(self, name, model, schema, order_by):
+        self.name = name
+        self.model = model
+        self.table = model.__table__.name
+        self.schema = schema
+        self.order_by = order_by
+
+    def render(self, dumps):
+        items = self.model.query.order_by(*self.order_by()).all()
+        return dumps(self.schema.dump(items)).encode()
+
+
+# Same schemas and ordering as each section's own list endpoint, unfiltered.
+SECTIONS = (
+    BundleSection(
+        "service_categories",
+        ServiceCategoryLegacy,
+        ServiceCategoryLegacySchema(many=True),
+        lambda: (ServiceCategoryLegacy.name.asc(),),
+    ),
+    BundleSection(
+        "catalog_services",
+        CatalogServiceLegacy,
+        CatalogServiceLegacySchema(many=True),
+        lambda: (CatalogServiceLegacy.name.asc(),),
+    ),
+    BundleSection(
+        "service_variants",
+        ServiceVariantLegacy,
+        ServiceVariantLegacySchema(many=True),
+        lambda: (ServiceVariantLegacy.name.asc(),),
+    ),
+    BundleSection("extras", Extra, ExtraSchema(many=True), lambda: (Extra.name.asc(),)),
+    BundleSection("garment_types", GarmentType, GarmentTypeSchema(many=True), lambda: (GarmentType.name.asc(),)),
+    BundleSection("garment_types_v2", GarmentType, GarmentTypeV2Schema(many=True), lambda: (GarmentType.name.asc(),)),
+    BundleSection(
+        "service_extra_types",
+        ServiceExtraType,
+        ServiceExtraTypeSchema(many=True),
+        lambda: (
+            ServiceExtraType.display_order.is_(None),
+            ServiceExtraType.display_order.asc(),
+            ServiceExtraType.name.asc(),
+        ),
+    ),
+    BundleSection(
+        "payment_types",
+        PaymentType,
+        PaymentTypeSchema(many=True),
+        lambda: (PaymentType.sort_order.is_(None), PaymentType.sort_order.asc(), PaymentType.name.asc()),
+    ),
+    BundleSection(
+        "transaction_categories",
+        TransactionCategory,
+        TransactionCategorySchema(many=True),
+        lambda: (TransactionCategory.created_at.desc(),),
+    ),
+    BundleSection("global_settings", GlobalSetting, GlobalSettingSchema(many=True), lambda: (GlobalSetting.key.asc(),)),
+)
+
+VERSION_SEPARATOR = "."
+
+
+def section_version(body):
+    return hashlib.sha1(body).hexdigest()[:10]
+
+
+def bundle_version(section_versions):
+    """Version token for a whole bundle: the section versions in SECTIONS order.
+
+    Section versions are content hashes, so every worker derives the same
+    token and any of them can answer a later `since_version`.
+    """
+    return VERSION_SEPARATOR.join(section_versions[section.name] for section in SECTIONS)
+
+
+def changed_sections(since_version, section_versions):
+    """Names of the sections that differ from `since_version`, or None when it can't be compared."""
+    previous = since_version.split(VERSION_SEPARATOR)
+    if len(previous) != len(SECTIONS):
+        return None
+    return [
+        section.name
+        for section, old_version in zip(SECTIONS, previous)
+        if old_version != section_versions[section.name]
+    ]
+
+
+def assemble_body(dumps, version, section_versions, bodies, names, full):
+    """Splice pre-serialized section arrays into the bundle document without re-encoding them."""
+    parts = [
+        b'{"version":', dumps(version).encode(),
+        b',"full":', b"true" if full else b"false",
+        b',"versions":', dumps(section_versions).encode(),
+        b',"sections":{',
+        b",".join(dumps(name).encode() + b":" + bodies[name] for name in names),
+        b"}}",
+    ]
+    return b"".join(parts)
+
+
+class BundleSnapshot:
+    def __init__(self, table_state, bodies, section_versions, dumps):
+        self.table_state = table_state
+        self.bodies = bodies
+        self.section_versions = section_versions
+        self.version = bundle_version(section_versions)
+        self.body = assemble_body(
+            dumps, self.version, section_versions, bodies, [section.name for section in SECTIONS], True
+        )
+        self.gzipped = gzip.compress(self.body, compresslevel=6)
+        self.built_at = time.monotonic()
+
+
+class CatalogBundle:
+    """Pre-rendered catalog bundle, rebuilt section by section when a catalog table changes.
+
+    Local commits are noticed through table_versions; the TTL re-renders every
+    section so writes made by other workers are picked up too.
+    """
+
+    def __init__(self, sections=SECTIONS):
+        self._sections = sections
+        self._tables = tuple(sorted({section.table for section in sections}))
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self.builds = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+
+    def current(self):
+        ttl_seconds = current_app.config.get("CATALOG_BUNDLE_TTL_SECONDS", 60)
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot, ttl_seconds):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot, ttl_seconds):
+                return snapshot
+            expired = snapshot is None or time.monotonic() - snapshot.built_at >= ttl_seconds
+            # Read the counters before querying so a concurrent commit forces another rebuild.
+            table_state = dict(zip(self._tables, table_versions.get(self._tables)))
+            dumps = current_app.json.dumps
+            bodies = {}
+            section_versions = {}
+            for section in self._sections:
+                stale = expired or table_state[section.table] != snapshot.table_state[section.table]
+                bodies[section.name] = section.render(dumps) if stale else snapshot.bodies[section.name]
+                section_versions[section.name] = section_version(bodies[section.name])
+            self._snapshot = BundleSnapshot(table_state, bodies, section_versions, dumps)
+            self.builds += 1
+            return self._snapshot
+
+    def _is_fresh(self, snapshot, ttl_seconds):
+        if time.monotonic() - snapshot.built_at >= ttl_seconds:
+            return False
+        return tuple(snapshot.table_state[table] for table in self._tables) == table_versions.get(self._tables)
+
+
+catalog_bundle = CatalogBundle()
@@ -0,0 +1,52 @@
+import gzip
+
+from flask import Blueprint, current_app, request
+from flask_jwt_extended import jwt_required
+
+from app.modules.catalogs.bundle.builder import assemble_body, catalog_bundle, changed_sections
+
+
+catalog_bundle_bp = Blueprint("catalog_bundle_bp", __name__, url_prefix="/catalog/bundle")
+
+# Partial bundles smaller than this are not worth compressing per request.
+PARTIAL_GZIP_MIN_BYTES = 1024
+
+
+def _bundle_response(body, gzipped, etag=None):
+    response = current_app.response_class(status=200, mimetype="application/json")
+    if gzipped is not None and request.accept_encodings["gzip"]:
+        response.set_data(gzipped)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response.set_data(body)
+    response.vary.add("Accept-Encoding")
+    if etag is not None:
+        response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+@catalog_bundle_bp.route("", methods=["GET"])
+@jwt_required()
+def get_bundle():
+    snapshot = catalog_bundle.current()
+    since_version = request.args.get("since_version")
+    names = changed_sections(since_version, snapshot.section_versions) if since_version else None
+
+    if names is None:
+        if request.if_none_match.contains(snapshot.version):
+            response = current_app.response_class(status=304)
+            response.set_etag(snapshot.version)
+            return response
+        return _bundle_response(snapshot.body, snapshot.gzipped, snapshot.version)
+
+    body = assemble_body(
+        current_app.json.dumps,
+        snapshot.version,
+        snapshot.section_versions,
+        snapshot.bodies,
+        names,
+        False,
+    )
+    gzipped = gzip.compress(body, compresslevel=6) if len(body) >= PARTIAL_GZIP_MIN_BYTES else None
+    return _bundle_response(body, gzipped)
@@ -2,6 +2,8 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
 from db import db
+from app.extensions.conditional_get import conditional_get
+from app.extensions.response_cache import cached_response
 from models.extra import Extra
 from models.service_category_legacy import ServiceCategoryLegacy
 from models.catalog_service_legacy import CatalogServiceLegacy
@@ -48,6 +50,8 @@ def _apply_is_active_filter(query, model):
 
 @extras_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(Extra)
+@cached_response(Extra)
 def get_extras():
     query = _apply_is_active_filter(Extra.query, Extra)
     items = query.order_by(Extra.name.asc()).all()
@@ -56,6 +60,7 @@ def get_extras():
 
 @extras_bp.route("/<int:item_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(Extra)
 def get_extra(item_id):
     item = Extra.query.get_or_404(item_id)
     return jsonify(extra_schema.dump(item)), 200
@@ -105,6 +110,8 @@ def delete_extra(item_id):
 
 @service_categories_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(ServiceCategoryLegacy)
+@cached_response(ServiceCategoryLegacy)
 def get_service_categories():
     query = _apply_is_active_filter(ServiceCategoryLegacy.query, ServiceCategoryLegacy)
     items = query.order_by(ServiceCategoryLegacy.name.asc()).all()
@@ -113,6 +120,7 @@ def get_service_categories():
 
 @service_categories_bp.route("/<int:item_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(ServiceCategoryLegacy)
 def get_service_category(item_id):
     item = ServiceCategoryLegacy.query.get_or_404(item_id)
     return jsonify(service_category_schema.dump(item)), 200
@@ -166,6 +174,8 @@ def delete_service_category(item_id):
 
 @catalog_services_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(CatalogServiceLegacy)
+@cached_response(CatalogServiceLegacy)
 def get_catalog_services():
     query = _apply_is_active_filter(CatalogServiceLegacy.query, CatalogServiceLegacy)
     category_id = request.args.get("category_id", type=int)
@@ -180,6 +190,7 @@ def get_catalog_services():
 
 @catalog_services_bp.route("/<int:item_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(CatalogServiceLegacy)
 def get_catalog_service(item_id):
     item = CatalogServiceLegacy.query.get_or_404(item_id)
     return jsonify(catalog_service_schema.dump(item)), 200
@@ -229,6 +240,8 @@ def delete_catalog_service(item_id):
 
 @service_variants_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(ServiceVariantLegacy)
+@cached_response(ServiceVariantLegacy)
 def get_service_variants():
     query = _apply_is_active_filter(ServiceVariantLegacy.query, ServiceVariantLegacy)
     service_id = request.args.get("service_id", type=int)
@@ -240,6 +253,7 @@ def get_service_variants():
 
 @service_variants_bp.route("/<int:item_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(ServiceVariantLegacy)
 def get_service_variant(item_id):
     item = ServiceVariantLegacy.query.get_or_404(item_id)
     return jsonify(service_variant_schema.dump(item)), 200
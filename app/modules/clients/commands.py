@@ -0,0 +1,44 @@
+import click
+from flask.cli import AppGroup
+from sqlalchemy import update
+
+from db import db
+from app.modules.clients.phone_numbers import normalize_phone_digits, phone_suffix
+from models.client import ClientPhone
+
+
+clients_cli = AppGroup("clients", help="Client maintenance commands.")
+
+
+@clients_cli.command("backfill-phone-digits")
+@click.option("--batch-size", default=500, show_default=True, type=int)
+def backfill_phone_digits(batch_size):
+    """Fill phone_digits/phone_suffix for phones stored before the columns existed."""
+    last_id = 0
+    total = 0
+    while True:
+        rows = (
+            db.session.query(ClientPhone.id, ClientPhone.phone_number)
+            .filter(ClientPhone.id > last_id)
+            .order_by(ClientPhone.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        payload = []
+        for row in rows:
+            digits = normalize_phone_digits(row.phone_number)
+            payload.append({
+                "id": row.id,
+                "phone_digits": digits,
+                "phone_suffix": phone_suffix(digits),
+            })
+        db.session.execute(update(ClientPhone), payload)
+        db.session.commit()
+
+        total += len(payload)
+        last_id = rows[-1].id
+
+    click.echo(f"Backfilled {total} client phones")
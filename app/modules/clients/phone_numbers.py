@@ -0,0 +1,24 @@
+import re
+
+
+# Local El Salvador numbers are 8 digits; caller ID usually prepends 503.
+PHONE_SUFFIX_LENGTH = 8
+
+
+def normalize_phone_digits(value):
+    if value is None:
+        return None
+    digits = re.sub(r"\D+", "", str(value))
+    return digits or None
+
+
+def phone_suffix(digits):
+    if not digits:
+        return None
+    return digits[-PHONE_SUFFIX_LENGTH:]
+
+
+def apply_phone_number(phone, phone_number):
+    phone.phone_number = phone_number
+    phone.phone_digits = normalize_phone_digits(phone_number)
+    phone.phone_suffix = phone_suffix(phone.phone_digits)
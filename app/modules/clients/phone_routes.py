@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from db import db
+from app.modules.clients.phone_numbers import apply_phone_number
 from models.client import ClientPhone
 from schemas.client_schema import ClientPhoneSchema
 
@@ -37,10 +38,10 @@ def create_phone():
 
     phone = ClientPhone(
         client_id=data["client_id"],
-        phone_number=data["phone_number"],
         description=data.get("description"),
         is_primary=data.get("is_primary", False)
     )
+    apply_phone_number(phone, data["phone_number"])
     db.session.add(phone)
     db.session.commit()
     return jsonify(phone_schema.dump(phone)), 201
@@ -55,7 +56,7 @@ def update_phone(phone_id):
         return jsonify({"error": "No input data provided"}), 400
     data = phone_schema.load(json_data, partial=True)
     if "phone_number" in data:
-        phone.phone_number = data["phone_number"]
+        apply_phone_number(phone, data["phone_number"])
     if "description" in data:
         phone.description = data["description"]
     if "is_primary" in data:
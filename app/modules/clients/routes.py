@@ -1,9 +1,17 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from sqlalchemy.orm import selectinload
-from sqlalchemy import or_, func
-import re
+from sqlalchemy import or_
 from db import db
+from app.extensions.response_cache import cached_response
+from app.api.streaming import iter_query, iter_query_by_key, requested_stream_format, stream_items
+from app.modules.clients.phone_numbers import PHONE_SUFFIX_LENGTH, normalize_phone_digits, phone_suffix
+from app.modules.clients.search import (
+    client_search_index,
+    ensure_client_search_index,
+    index_client,
+    search_clients_sql,
+)
 from models.client import Client, ClientPhone
 from schemas.client_schema import (
     ClientSchema,
@@ -14,27 +22,34 @@ from schemas.client_schema import (
 clients_bp = Blueprint("clients_bp", __name__, url_prefix="/clients")
 
 client_schema = ClientSchema()
+client_short_schema = ClientShortSchema()
 client_short_list_schema = ClientShortSchema(many=True)
 client_detail_schema = ClientDetailSchema()
 client_detail_list_schema = ClientDetailSchema(many=True)
 
+EXPORT_ENVELOPE = {"pages": 1, "current_page": 1, "per_page": 0}
+
 def apply_common_filters(query, q):
     if q:
-        digits = re.sub(r"\D+", "", q)
+        digits = normalize_phone_digits(q)
         name_cond = Client.name.ilike(f"%{q}%")
         if digits:
-            norm = func.replace(ClientPhone.phone_number, "-", "")
-            norm = func.replace(norm, " ", "")
-            norm = func.replace(norm, "(", "")
-            norm = func.replace(norm, ")", "")
-            norm = func.replace(norm, "+", "")
-            query = query.join(ClientPhone, ClientPhone.client_id == Client.id, isouter=True).filter(
-                or_(name_cond, norm.like(f"%{digits}%"), ClientPhone.phone_number.ilike(f"%{q}%"))
-            ).distinct()
+            # Prefix matches only, so both indexed columns are range scans:
+            # "7123" finds "71234567", and via the local suffix "+503 7123-4567".
+            phone_cond = ClientPhone.phone_digits.like(f"{digits}%")
+            if len(digits) <= PHONE_SUFFIX_LENGTH:
+                phone_cond = or_(phone_cond, ClientPhone.phone_suffix.like(f"{digits}%"))
+            phone_client_ids = db.session.query(ClientPhone.client_id).filter(phone_cond)
+            query = query.filter(or_(name_cond, Client.id.in_(phone_client_ids)))
         else:
             query = query.filter(name_cond)
     return query
 
+def _stream_short_clients(query, stream_format):
+    # Plain columns: no ORM objects and none of the selectin collections.
+    rows = iter_query(query.with_entities(Client.id, Client.name).order_by(Client.id))
+    return stream_items(rows, client_short_schema.dump, stream_format, envelope=EXPORT_ENVELOPE)
+
 @clients_bp.route("", methods=["GET"])
 @jwt_required()
 def get_clients():
@@ -49,6 +64,17 @@ def get_clients():
     if detail:
         query = query.options(selectinload(Client.addresses), selectinload(Client.phones))
 
+    stream_format = requested_stream_format() if per_page == 0 else None
+    if stream_format:
+        if detail:
+            return stream_items(
+                iter_query_by_key(query, Client.id),
+                client_detail_schema.dump,
+                stream_format,
+                envelope=EXPORT_ENVELOPE,
+            )
+        return _stream_short_clients(query, stream_format)
+
     query = query.order_by(Client.id)
 
     if per_page == 0:
@@ -75,6 +101,7 @@ def get_clients():
 
 @clients_bp.route("/lite", methods=["GET"])
 @jwt_required()
+@cached_response(Client, ClientPhone)
 def get_clients_lite():
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 10, type=int)
@@ -82,6 +109,11 @@ def get_clients_lite():
 
     query = Client.query.filter_by(is_deleted=False)
     query = apply_common_filters(query, q)
+
+    stream_format = requested_stream_format() if per_page == 0 else None
+    if stream_format:
+        return _stream_short_clients(query, stream_format)
+
     query = query.order_by(Client.id)
 
     if per_page == 0:
@@ -106,6 +138,73 @@ def get_clients_lite():
         "items": items
     }), 200
 
+@clients_bp.route("/search", methods=["GET"])
+@jwt_required()
+def search_clients():
+    q = request.args.get("q", "", type=str)
+    limit = request.args.get("limit", 20, type=int)
+    limit = max(1, min(limit, 100))
+
+    if ensure_client_search_index():
+        items = client_search_index.search(q, limit=limit)
+    else:
+        items = search_clients_sql(q, limit=limit)
+    return jsonify({
+        "q": q,
+        "total": len(items),
+        "items": items
+    }), 200
+
+@clients_bp.route("/by-phone/<string:digits>", methods=["GET"])
+@jwt_required()
+def get_clients_by_phone(digits):
+    normalized_digits = normalize_phone_digits(digits)
+    if not normalized_digits:
+        return jsonify({"error": "Phone digits are required"}), 400
+
+    suffix = phone_suffix(normalized_digits)
+    rows = (
+        db.session.query(
+            Client.id.label("client_id"),
+            Client.name.label("client_name"),
+            ClientPhone.id.label("phone_id"),
+            ClientPhone.phone_number,
+            ClientPhone.phone_digits,
+            ClientPhone.is_primary,
+        )
+        .join(Client, Client.id == ClientPhone.client_id)
+        .filter(Client.is_deleted.is_(False))
+        .filter(or_(
+            ClientPhone.phone_digits == normalized_digits,
+            ClientPhone.phone_suffix == suffix,
+        ))
+        .all()
+    )
+
+    items = [
+        {
+            "client_id": row.client_id,
+            "client_name": row.client_name,
+            "phone_id": row.phone_id,
+            "phone_number": row.phone_number,
+            "is_primary": bool(row.is_primary),
+            "match": "exact" if row.phone_digits == normalized_digits else "suffix",
+        }
+        for row in sorted(
+            rows,
+            key=lambda row: (
+                row.phone_digits != normalized_digits,
+                not bool(row.is_primary),
+                row.phone_id,
+            ),
+        )
+    ]
+    return jsonify({
+        "digits": normalized_digits,
+        "total": len(items),
+        "items": items
+    }), 200
+
 @clients_bp.route("/<int:client_id>", methods=["GET"])
 @jwt_required()
 def get_client(client_id):
@@ -128,6 +227,7 @@ def create_client():
     )
     db.session.add(client)
     db.session.commit()
+    index_client(client)
     return jsonify(client_schema.dump(client)), 201
 
 @clients_bp.route("/<int:client_id>", methods=["PUT"])
@@ -147,6 +247,7 @@ def update_client(client_id):
     if "document_id" in data:
         client.document_id = data["document_id"]
     db.session.commit()
+    index_client(client)
     return jsonify(client_schema.dump(client)), 200
 
 @clients_bp.route("/<int:client_id>", methods=["DELETE"])
@@ -157,4 +258,5 @@ def delete_client(client_id):
         return jsonify({"error": "Client already deleted"}), 400
     client.is_deleted = True
     db.session.commit()
+    client_search_index.remove(client_id)
     return jsonify({"message": f"Client {client_id} logically deleted"}), 200
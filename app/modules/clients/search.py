@@ -0,0 +1,156 @@
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import or_
+from sqlalchemy.exc import SQLAlchemyError
+
+from db import db
+from app.services.client_search import (
+    SCORE_DOCUMENT_PREFIX,
+    SCORE_EMAIL_PREFIX,
+    SCORE_NAME_CONTAINS,
+    SCORE_NAME_EXACT,
+    SCORE_NAME_PREFIX,
+    ClientSearchIndex,
+    normalize_search_text,
+)
+from models.client import Client
+
+
+client_search_index = ClientSearchIndex()
+
+# Writes handled by other workers reach this index through the updated_at watermark.
+_sync_state = {"watermark": None, "checked_at": 0.0}
+_build_lock = threading.Lock()
+_build_state = {"thread": None}
+
+
+def _client_search_rows(query):
+    return query.with_entities(
+        Client.id,
+        Client.name,
+        Client.document_id,
+        Client.email,
+        Client.is_deleted,
+        Client.updated_at,
+    )
+
+
+def _track_watermark(updated_at):
+    if updated_at is not None and (_sync_state["watermark"] is None or updated_at > _sync_state["watermark"]):
+        _sync_state["watermark"] = updated_at
+
+
+def rebuild_client_search_index():
+    rows = _client_search_rows(Client.query.filter_by(is_deleted=False)).all()
+    client_search_index.rebuild(rows)
+    _sync_state["watermark"] = None
+    for row in rows:
+        _track_watermark(row.updated_at)
+    _sync_state["checked_at"] = time.monotonic()
+
+
+def sync_client_search_index():
+    query = Client.query
+    if _sync_state["watermark"] is not None:
+        query = query.filter(Client.updated_at >= _sync_state["watermark"])
+    for row in _client_search_rows(query).all():
+        if row.is_deleted:
+            client_search_index.remove(row.id)
+        else:
+            client_search_index.upsert(row.id, row.name, row.document_id, row.email)
+        _track_watermark(row.updated_at)
+    _sync_state["checked_at"] = time.monotonic()
+
+
+def ensure_client_search_index():
+    """Return False while the index is still being built in the background.
+
+    The full build never runs inside a request; callers fall back to
+    search_clients_sql until it is ready.
+    """
+    if not client_search_index.is_built:
+        start_client_search_build(current_app._get_current_object())
+        return False
+    sync_seconds = current_app.config.get("CLIENT_SEARCH_SYNC_SECONDS", 30)
+    if time.monotonic() - _sync_state["checked_at"] >= sync_seconds:
+        sync_client_search_index()
+    return True
+
+
+def _fallback_score(client, query_key):
+    name_key = normalize_search_text(client.name)
+    if name_key == query_key:
+        return SCORE_NAME_EXACT
+    if name_key.startswith(query_key):
+        return SCORE_NAME_PREFIX
+    if query_key in name_key:
+        return SCORE_NAME_CONTAINS
+    document_key = normalize_search_text(client.document_id).replace(" ", "")
+    if document_key and document_key.startswith(query_key.replace(" ", "")):
+        return SCORE_DOCUMENT_PREFIX
+    return SCORE_EMAIL_PREFIX
+
+
+def search_clients_sql(q, limit=20):
+    """Plain LIKE search with the same item shape as the index, used until it is built."""
+    q = (q or "").strip()
+    if not q or limit <= 0:
+        return []
+    rows = (
+        _client_search_rows(Client.query.filter_by(is_deleted=False))
+        .filter(or_(
+            Client.name.ilike(f"%{q}%"),
+            Client.document_id.like(f"{q}%"),
+            Client.email.ilike(f"{q}%"),
+        ))
+        .order_by(db.func.length(Client.name), Client.id)
+        .limit(limit)
+        .all()
+    )
+    query_key = normalize_search_text(q)
+    items = [
+        {
+            "id": row.id,
+            "name": row.name,
+            "document_id": row.document_id,
+            "email": row.email,
+            "score": _fallback_score(row, query_key),
+        }
+        for row in rows
+    ]
+    # Stable sort keeps shorter names first within a score, as the index does.
+    items.sort(key=lambda item: -item["score"])
+    return items
+
+
+def index_client(client):
+    if client.is_deleted:
+        client_search_index.remove(client.id)
+    else:
+        client_search_index.upsert(client.id, client.name, client.document_id, client.email)
+
+
+def warm_client_search_index(app):
+    with app.app_context():
+        try:
+            rebuild_client_search_index()
+        except SQLAlchemyError as exc:
+            app.logger.warning("Client search index warmup skipped: %s", exc)
+        finally:
+            db.session.remove()
+
+
+def start_client_search_build(app):
+    """Build the index in a daemon thread, once per process, unless one is already running."""
+    with _build_lock:
+        thread = _build_state["thread"]
+        if client_search_index.is_built or (thread is not None and thread.is_alive()):
+            return thread
+        thread = threading.Thread(
+            target=warm_client_search_index, args=(app,), name="client-search-build", daemon=True
+        )
+        _build_state["thread"] = thread
+        thread.start()
+        return thread
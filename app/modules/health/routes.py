@@ -1,8 +1,59 @@
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import jwt_required
+
+from app.extensions.activity_log import activity_log
+from app.extensions.conditional_get import conditional_get_stats
+from app.extensions.db import db
+from app.extensions.db_pool import pool_stats, pool_status
+from app.extensions.password_hashing import password_hasher
+from app.extensions.response_cache import response_cache, table_versions
+from app.modules.auth.token_store import refresh_token_stats
+from app.modules.catalogs.bundle.builder import catalog_bundle
+from app.modules.menus.tree import menu_trees
 
 health_bp = Blueprint("health_bp", __name__, url_prefix="/health")
 
 @health_bp.route("", methods=["GET"])
 def health():
-    return jsonify({"status": "ok"}), 200
\ No newline at end of file
+    return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route("/cache", methods=["GET"])
+@jwt_required()
+def cache_stats():
+    return jsonify({
+        "response_cache": response_cache.stats(),
+        "table_versions": table_versions.snapshot(),
+        "conditional_get": conditional_get_stats.stats(),
+        "catalog_bundle_builds": catalog_bundle.builds,
+        "menu_tree_builds": menu_trees.builds,
+    }), 200
+
+
+@health_bp.route("/activity-log", methods=["GET"])
+@jwt_required()
+def activity_log_stats():
+    return jsonify(activity_log.stats()), 200
+
+
+@health_bp.route("/password-hashing", methods=["GET"])
+@jwt_required()
+def password_hashing_stats():
+    return jsonify(password_hasher.stats()), 200
+
+
+@health_bp.route("/refresh-tokens", methods=["GET"])
+@jwt_required()
+def refresh_tokens_stats():
+    return jsonify(refresh_token_stats()), 200
+
+
+@health_bp.route("/db-pool", methods=["GET"])
+@jwt_required()
+def db_pool_stats():
+    return jsonify({
+        "pre_ping": current_app.config.get("DB_POOL_PRE_PING", "true"),
+        "pool": pool_status(db.engine),
+        "events": pool_stats.stats(),
+    }), 200
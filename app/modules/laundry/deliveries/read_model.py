@@ -0,0 +1,35 @@
+from sqlalchemy import select
+
+from app.api.read_models import local_isoformat
+from models.laundry_delivery import LaundryDelivery
+
+
+def delivery_rows_select():
+    """Columns behind LaundryDeliverySchema, without ORM entities."""
+    return select(
+        LaundryDelivery.id,
+        LaundryDelivery.laundry_service_id,
+        LaundryDelivery.created_by_user_id,
+        LaundryDelivery.assigned_to_user_id,
+        LaundryDelivery.scheduled_delivery_at,
+        LaundryDelivery.delivered_at,
+        LaundryDelivery.status,
+        LaundryDelivery.cancel_note,
+        LaundryDelivery.created_at,
+        LaundryDelivery.updated_at,
+    )
+
+
+def map_delivery_row(row):
+    return {
+        "id": row.id,
+        "laundry_service_id": row.laundry_service_id,
+        "created_by_user_id": row.created_by_user_id,
+        "assigned_to_user_id": row.assigned_to_user_id,
+        "scheduled_delivery_at": local_isoformat(row.scheduled_delivery_at),
+        "delivered_at": local_isoformat(row.delivered_at),
+        "status": row.status,
+        "cancel_note": row.cancel_note,
+        "created_at": local_isoformat(row.created_at),
+        "updated_at": local_isoformat(row.updated_at),
+    }
@@ -1,9 +1,11 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from db import db
+from app.api.read_models import paginate_rows, read_model_enabled
 from models.laundry_delivery import LaundryDelivery
 from models.laundry_service import LaundryService
 from app.modules.laundry.queue.events import emit_queue_updated
+from app.modules.laundry.deliveries.read_model import delivery_rows_select, map_delivery_row
 from schemas.client_schema import ClientDetailSchema
 from schemas.laundry_delivery_schema import LaundryDeliverySchema
 from schemas.transaction_schema import TransactionSchema
@@ -64,7 +66,8 @@ def get_all():
     from_date = request.args.get("from_date")
     to_date = request.args.get("to_date")
 
-    query = LaundryDelivery.query
+    use_read_model = read_model_enabled()
+    query = delivery_rows_select() if use_read_model else LaundryDelivery.query
 
     if laundry_service_id:
         query = query.filter(LaundryDelivery.laundry_service_id == laundry_service_id)
@@ -75,7 +78,11 @@ def get_all():
     if to_date:
         query = query.filter(LaundryDelivery.scheduled_delivery_at <= to_date)
 
-    pagination = query.order_by(LaundryDelivery.id.desc()).paginate(page=page, per_page=per_page, error_out=False)
+    query = query.order_by(LaundryDelivery.id.desc())
+    if use_read_model:
+        return jsonify(paginate_rows(query, page, per_page, map_delivery_row)), 200
+
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
     return jsonify({
         "items": schema_list.dump(pagination.items),
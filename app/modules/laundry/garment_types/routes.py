@@ -2,6 +2,8 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 
 from db import db
+from app.extensions.conditional_get import conditional_get
+from app.extensions.response_cache import cached_response
 from models.garment_type import GarmentType
 from schemas.garment_type_schema import GarmentTypeSchema
 
@@ -14,6 +16,8 @@ garment_type_list_schema = GarmentTypeSchema(many=True)
 
 @garment_type_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(GarmentType)
+@cached_response(GarmentType)
 def get_all_garment_types():
     garment_types = GarmentType.query.order_by(GarmentType.name.asc()).all()
     return jsonify(garment_type_list_schema.dump(garment_types)), 200
@@ -21,6 +25,7 @@ def get_all_garment_types():
 
 @garment_type_bp.route("/<int:garment_type_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(GarmentType)
 def get_garment_type(garment_type_id):
     garment_type = GarmentType.query.get_or_404(garment_type_id)
     return jsonify(garment_type_schema.dump(garment_type)), 200
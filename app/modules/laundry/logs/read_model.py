@@ -0,0 +1,38 @@
+from sqlalchemy import select
+
+from app.api.read_models import local_isoformat
+from models.laundry_activity_log import LaundryActivityLog
+from models.user import User
+
+
+def activity_log_rows_select():
+    """Columns behind LaundryActivityLogSchema plus the acting user's name."""
+    return (
+        select(
+            LaundryActivityLog.id,
+            LaundryActivityLog.laundry_service_id,
+            LaundryActivityLog.user_id,
+            LaundryActivityLog.action,
+            LaundryActivityLog.previous_status,
+            LaundryActivityLog.new_status,
+            LaundryActivityLog.description,
+            LaundryActivityLog.created_at,
+            User.name.label("user_name"),
+        )
+        .select_from(LaundryActivityLog)
+        .outerjoin(User, User.id == LaundryActivityLog.user_id)
+    )
+
+
+def map_activity_log_row(row):
+    return {
+        "id": row.id,
+        "laundry_service_id": row.laundry_service_id,
+        "user_id": row.user_id,
+        "user_name": row.user_name,
+        "action": row.action,
+        "previous_status": row.previous_status,
+        "new_status": row.new_status,
+        "description": row.description,
+        "created_at": local_isoformat(row.created_at),
+    }
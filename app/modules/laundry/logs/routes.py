@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import jwt_required
+
+from app.api.read_models import keyset_page
+from app.modules.laundry.logs.read_model import activity_log_rows_select, map_activity_log_row
+from models.laundry_activity_log import LaundryActivityLog
+
+
+laundry_activity_log_bp = Blueprint("laundry_activity_log_bp", __name__, url_prefix="/laundry_activity_logs")
+
+
+def _date_range():
+    """start_date/end_date (YYYY-MM-DD, both inclusive) as in GET /transactions."""
+    start_date_str = request.args.get("start_date")
+    end_date_str = request.args.get("end_date")
+    start_date = end_date = None
+    if start_date_str:
+        start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+    if end_date_str:
+        end_date = datetime.strptime(end_date_str, "%Y-%m-%d").replace(
+            hour=23, minute=59, second=59, microsecond=999999
+        )
+    return start_date, end_date
+
+
+def _timeline(*criteria, require_range=False):
+    try:
+        start_date, end_date = _date_range()
+    except ValueError:
+        return jsonify({"error": "Invalid date format. Use YYYY-MM-DD"}), 400
+    if require_range and (start_date is None or end_date is None):
+        return jsonify({"error": "start_date and end_date are required"}), 400
+
+    stmt = activity_log_rows_select().where(*criteria)
+    if start_date is not None:
+        stmt = stmt.where(LaundryActivityLog.created_at >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(LaundryActivityLog.created_at <= end_date)
+
+    try:
+        page = keyset_page(
+            stmt,
+            LaundryActivityLog.created_at,
+            LaundryActivityLog.id,
+            request.args.get("cursor"),
+            request.args.get("limit", type=int),
+            map_activity_log_row,
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify(page), 200
+
+
+@laundry_activity_log_bp.route("", methods=["GET"])
+@jwt_required()
+def get_by_date_range():
+    return _timeline(require_range=True)
+
+
+@laundry_activity_log_bp.route("/services/<int:service_id>", methods=["GET"])
+@jwt_required()
+def get_service_timeline(service_id):
+    return _timeline(LaundryActivityLog.laundry_service_id == service_id)
+
+
+@laundry_activity_log_bp.route("/users/<int:user_id>", methods=["GET"])
+@jwt_required()
+def get_user_timeline(user_id):
+    return _timeline(LaundryActivityLog.user_id == user_id)
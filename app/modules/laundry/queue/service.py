@@ -1,8 +1,8 @@
 from sqlalchemy.orm import selectinload
-from sqlalchemy import case
+from sqlalchemy import case, func, select, update
 from db import db
+from app.extensions.activity_log import map_status_to_log_enum, record_activity
 from models.laundry_service import LaundryService
-from models.laundry_activity_log import LaundryActivityLog
 
 allowed_statuses = {"PENDING", "STARTED", "IN_PROGRESS", "READY_FOR_DELIVERY", "DELIVERED", "CANCELLED"}
 
@@ -119,13 +119,12 @@ def reorder_pending_ids(ids, current_user_id: int):
     for idx, service_id in enumerate(ids_int, start=1):
         id_to_item[service_id].pending_order = idx
 
-    log = LaundryActivityLog(
+    record_activity(
         laundry_service_id=ids_int[0],
         user_id=current_user_id,
         action="ACTUALIZACION",
         description=f"Reordenamiento manual de cola PENDING. Total items={len(ids_int)}"
     )
-    db.session.add(log)
 
     db.session.commit()
 
@@ -134,3 +133,80 @@ def reorder_pending_ids(ids, current_user_id: int):
         "count": len(ids_int),
         "ids": ids_int,
     }, 200
+
+def bulk_update_status(ids, status_raw, current_user_id: int):
+    """Move every id to one status in a single transaction.
+
+    Returns (payload, code, statuses) where `statuses` are the queue statuses
+    touched (previous ones plus the new one), for a single broadcast.
+    """
+    if not isinstance(ids, list) or len(ids) == 0:
+        return {"error": "'ids' must be a non-empty list"}, 400, []
+
+    try:
+        ids_int = [int(x) for x in ids]
+    except (TypeError, ValueError):
+        return {"error": "'ids' must contain only integers"}, 400, []
+
+    if len(set(ids_int)) != len(ids_int):
+        return {"error": "Duplicate ids are not allowed"}, 400, []
+
+    new_status = _normalize_status_one(status_raw)
+    if new_status not in allowed_statuses:
+        return {"error": "Invalid status", "valid": sorted(list(allowed_statuses))}, 400, []
+
+    # Row locks keep concurrent moves of the same tickets from interleaving.
+    rows = db.session.execute(
+        select(LaundryService.id, LaundryService.status)
+        .where(LaundryService.id.in_(ids_int))
+        .with_for_update()
+    ).all()
+    old_status_by_id = {row.id: row.status for row in rows}
+    if len(old_status_by_id) != len(ids_int):
+        missing = [i for i in ids_int if i not in old_status_by_id]
+        db.session.rollback()
+        return {"error": "Some ids were not found", "missing": missing}, 404, []
+
+    changed = [i for i in ids_int if old_status_by_id[i] != new_status]
+    unchanged = [i for i in ids_int if old_status_by_id[i] == new_status]
+    if changed and new_status == "PENDING":
+        # Newly pending tickets join the end of the queue in request order.
+        current_max = db.session.execute(
+            select(func.max(LaundryService.pending_order)).where(LaundryService.status == "PENDING")
+        ).scalar()
+        db.session.execute(
+            update(LaundryService),
+            [
+                {"id": service_id, "status": new_status, "pending_order": (current_max or 0) + position}
+                for position, service_id in enumerate(changed, start=1)
+            ],
+        )
+    elif changed:
+        db.session.execute(
+            update(LaundryService)
+            .where(LaundryService.id.in_(changed))
+            .values(status=new_status, pending_order=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    # Every requested ticket gets its log row, unchanged ones too, as with the
+    # single-ticket update_status route.
+    for service_id in ids_int:
+        record_activity(
+            laundry_service_id=service_id,
+            user_id=current_user_id,
+            action="CAMBIO_ESTADO",
+            previous_status=map_status_to_log_enum(old_status_by_id[service_id]),
+            new_status=map_status_to_log_enum(new_status),
+            description=f"Cambio de estado a {new_status}",
+        )
+    db.session.commit()
+
+    statuses = sorted({old_status_by_id[i] for i in changed} | {new_status}) if changed else []
+    return {
+        "message": "Status updated",
+        "status": new_status,
+        "count": len(changed),
+        "ids": changed,
+        "unchanged": unchanged,
+    }, 200, statuses
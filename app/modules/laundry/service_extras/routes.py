@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
+from app.services.order_totals import refresh_order_totals
 from db import db
 from models.laundry_service_extra import LaundryServiceExtra
 from schemas.laundry_service_extra_schema import LaundryServiceExtraSchema
@@ -49,6 +50,7 @@ def create():
         return jsonify({"error": str(exc)}), 400
     item = LaundryServiceExtra(**data)
     db.session.add(item)
+    refresh_order_totals(item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": "Laundry service extra created", "item": schema.dump(item)}), 201
 
@@ -57,6 +59,7 @@ def create():
 @jwt_required()
 def update(item_id):
     item = LaundryServiceExtra.query.get_or_404(item_id)
+    previous_service_id = item.laundry_service_id
     json_data = request.get_json()
     if not json_data:
         return jsonify({"error": "No input data provided"}), 400
@@ -66,6 +69,7 @@ def update(item_id):
         return jsonify({"error": str(exc)}), 400
     for key, value in data.items():
         setattr(item, key, value)
+    refresh_order_totals(previous_service_id, item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": "Laundry service extra updated", "item": schema.dump(item)}), 200
 
@@ -75,5 +79,6 @@ def update(item_id):
 def delete(item_id):
     item = LaundryServiceExtra.query.get_or_404(item_id)
     db.session.delete(item)
+    refresh_order_totals(item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": f"Laundry service extra {item_id} deleted"}), 200
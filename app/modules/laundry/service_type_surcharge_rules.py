@@ -46,3 +46,42 @@ def resolve_laundry_service_type_surcharge(laundry_service_id: int, service_labe
     if client_id is None:
         raise ValueError("Laundry service not found")
     return resolve_client_service_type_surcharge(client_id, service_label)
+
+
+def resolve_client_service_type_surcharges(pairs) -> dict:
+    """Batch form of resolve_client_service_type_surcharge for (client_id, service_label) pairs.
+
+    One query for the client rules, plus the system setting only when an
+    EXPRESS pair has no rule.
+    """
+    normalized_pairs = {
+        (client_id, (service_label or "NORMAL").strip().upper()) for client_id, service_label in pairs
+    }
+    if not normalized_pairs:
+        return {}
+
+    rules = (
+        ClientServiceTypeSurchargeRule.query
+        .filter(
+            ClientServiceTypeSurchargeRule.client_id.in_({client_id for client_id, _ in normalized_pairs}),
+            ClientServiceTypeSurchargeRule.service_label.in_({label for _, label in normalized_pairs}),
+            ClientServiceTypeSurchargeRule.is_active.is_(True),
+        )
+        .all()
+    )
+    rule_amounts = {
+        (rule.client_id, rule.service_label): Decimal(str(rule.amount)).quantize(Decimal("0.01"))
+        for rule in rules
+    }
+
+    system_amounts = {}
+    surcharges = {}
+    for pair in normalized_pairs:
+        if pair in rule_amounts:
+            surcharges[pair] = rule_amounts[pair]
+            continue
+        service_label = pair[1]
+        if service_label not in system_amounts:
+            system_amounts[service_label] = load_system_service_type_surcharge(service_label)
+        surcharges[pair] = system_amounts[service_label]
+    return surcharges
@@ -0,0 +1,29 @@
+import click
+from flask.cli import AppGroup
+from sqlalchemy import func, update
+
+from db import db
+from app.services.order_totals import order_totals_values
+from models.laundry_service import LaundryService
+
+
+laundry_services_cli = AppGroup("laundry-services", help="Laundry service maintenance commands.")
+
+
+@laundry_services_cli.command("backfill-totals")
+@click.option("--batch-size", default=1000, show_default=True, type=int)
+def backfill_totals(batch_size):
+    """Recompute subtotal/extras_total/grand_total from the stored order lines."""
+    max_id = db.session.query(func.max(LaundryService.id)).scalar() or 0
+    total = 0
+    for start in range(1, max_id + 1, batch_size):
+        result = db.session.execute(
+            update(LaundryService)
+            .where(LaundryService.id.between(start, start + batch_size - 1))
+            .values(**order_totals_values())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        total += result.rowcount
+
+    click.echo(f"Backfilled totals for {total} laundry services")
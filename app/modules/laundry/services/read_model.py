@@ -0,0 +1,70 @@
+from sqlalchemy import select
+
+from app.api.read_models import local_isoformat, money_string
+from models.client import Client, ClientAddress
+from models.laundry_service import LaundryService
+from models.user import User
+
+
+def compact_rows_select():
+    """Columns behind LaundryServiceCompactSchema, without ORM entities."""
+    return (
+        select(
+            LaundryService.id,
+            LaundryService.client_id,
+            LaundryService.client_address_id,
+            LaundryService.scheduled_pickup_at,
+            LaundryService.pending_order,
+            LaundryService.status,
+            LaundryService.service_label,
+            LaundryService.fulfillment_type,
+            LaundryService.transaction_id,
+            LaundryService.created_by_user_id,
+            LaundryService.created_at,
+            LaundryService.updated_at,
+            LaundryService.subtotal,
+            LaundryService.extras_total,
+            LaundryService.grand_total,
+            Client.id.label("client_ref_id"),
+            Client.name.label("client_name"),
+            ClientAddress.id.label("address_ref_id"),
+            ClientAddress.client_id.label("address_client_id"),
+            ClientAddress.address_text.label("address_text"),
+            User.id.label("created_by_ref_id"),
+            User.name.label("created_by_name"),
+        )
+        .select_from(LaundryService)
+        .outerjoin(Client, Client.id == LaundryService.client_id)
+        .outerjoin(ClientAddress, ClientAddress.id == LaundryService.client_address_id)
+        .outerjoin(User, User.id == LaundryService.created_by_user_id)
+    )
+
+
+def map_compact_row(row):
+    return {
+        "id": row.id,
+        "client_id": row.client_id,
+        "client_address_id": row.client_address_id,
+        "scheduled_pickup_at": local_isoformat(row.scheduled_pickup_at),
+        "pending_order": row.pending_order,
+        "status": row.status,
+        "service_label": row.service_label,
+        "fulfillment_type": row.fulfillment_type,
+        "transaction_id": row.transaction_id,
+        "created_by_user_id": row.created_by_user_id,
+        "created_at": local_isoformat(row.created_at),
+        "updated_at": local_isoformat(row.updated_at),
+        "client": (
+            {"id": row.client_ref_id, "name": row.client_name}
+            if row.client_ref_id is not None else None
+        ),
+        "client_address": (
+            {"id": row.address_ref_id, "client_id": row.address_client_id, "address_text": row.address_text}
+            if row.address_ref_id is not None else None
+        ),
+        "created_by_user": {"name": row.created_by_name} if row.created_by_ref_id is not None else None,
+        "has_transaction": row.transaction_id is not None,
+        "subtotal": money_string(row.subtotal),
+        "extras_total": money_string(row.extras_total),
+        "grand_total": money_string(row.grand_total),
+    }
@@ -2,19 +2,22 @@ from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy import func
 from db import db
+from app.api.read_models import paginate_rows, read_model_enabled
+from app.extensions.activity_log import map_status_to_log_enum, record_activity
+from app.services.order_totals import refresh_order_totals
 from app.modules.laundry.service_type_surcharge_rules import (
     resolve_client_service_type_surcharge,
     resolve_laundry_service_type_surcharge,
 )
 from models.catalog_service_legacy import CatalogServiceLegacy
 from models.laundry_service import LaundryService
-from models.laundry_activity_log import LaundryActivityLog
 from models.client import Client, ClientAddress
 from models.order_item import OrderItem
 from schemas.laundry_service_schema import LaundryServiceAllSchema, LaundryServiceDetailSchema, LaundryServiceLiteSchema, LaundryServiceSchema, LaundryServiceGetSchema, LaundryServiceCompactSchema
 from sqlalchemy.orm import selectinload
-from app.modules.laundry.queue.service import fetch_queue_items, reorder_pending_ids
+from app.modules.laundry.queue.service import bulk_update_status, fetch_queue_items, reorder_pending_ids
 from app.modules.laundry.queue.events import emit_queue_updated
+from app.modules.laundry.services.read_model import compact_rows_select, map_compact_row
 from models.service_category_legacy import ServiceCategoryLegacy
 
 laundry_service_bp = Blueprint("laundry_service_bp", __name__, url_prefix="/laundry_services")
@@ -25,15 +28,6 @@ schema_get_list = LaundryServiceGetSchema(many=True)
 
 compact_schema_many = LaundryServiceCompactSchema(many=True)
 
-def map_status_to_log_enum(status):
-    return {
-        "PENDING": "PENDIENTE",
-        "IN_PROGRESS": "EN_PROCESO",
-        "READY_FOR_DELIVERY": "LISTO_PARA_ENVIO",
-        "DELIVERED": "COMPLETADO",
-        "CANCELLED": "CANCELADO"
-    }.get(status)
-
 def _get_socketio():
     return current_app.extensions.get("socketio")
 
@@ -185,6 +179,7 @@ def _sync_service_type_order_item(laundry_service_id: int, service_label: str):
     item.applied_price = surcharge_amount
     item.is_friendly_discount = False
     item.calculation_snapshot = _service_type_snapshot(service_label)
+    refresh_order_totals(laundry_service_id)
 
 
 @laundry_service_bp.route("", methods=["GET"])
@@ -276,16 +271,14 @@ def create():
         return jsonify({"error": str(exc)}), 400
     db.session.add(delivery_order_item)
     db.session.add(service_type_order_item)
-    db.session.commit()
-
-    log = LaundryActivityLog(
+    refresh_order_totals(item.id)
+    record_activity(
         laundry_service_id=item.id,
         user_id=current_user_id,
         action="CREACION",
         new_status=map_status_to_log_enum(item.status),
         description="Creación del servicio de lavandería."
     )
-    db.session.add(log)
     db.session.commit()
 
     socketio = _get_socketio()
@@ -355,10 +348,8 @@ def update(item_id):
         db.session.rollback()
         return jsonify({"error": str(exc)}), 400
 
-    db.session.commit()
-
     if status_changed:
-        log = LaundryActivityLog(
+        record_activity(
             laundry_service_id=item.id,
             user_id=current_user_id,
             action="ACTUALIZACION",
@@ -366,8 +357,7 @@ def update(item_id):
             new_status=map_status_to_log_enum(item.status),
             description="Actualización de estado del servicio."
         )
-        db.session.add(log)
-        db.session.commit()
+    db.session.commit()
 
     if status_changed:
         socketio = _get_socketio()
@@ -424,9 +414,7 @@ def update_status(item_id):
         item.pending_order = _next_pending_order()
     else:
         _sync_pending_order_for_status(item)
-    db.session.commit()
-
-    log = LaundryActivityLog(
+    record_activity(
         laundry_service_id=item.id,
         user_id=current_user_id,
         action="CAMBIO_ESTADO",
@@ -434,7 +422,6 @@ def update_status(item_id):
         new_status=map_status_to_log_enum(new_status),
         description=f"Cambio de estado a {new_status}"
     )
-    db.session.add(log)
     db.session.commit()
 
     socketio = _get_socketio()
@@ -446,6 +433,24 @@ def update_status(item_id):
 
     return jsonify(schema.dump(item)), 200
 
+@laundry_service_bp.route("/status/bulk", methods=["PATCH"])
+@jwt_required()
+def update_status_bulk():
+    json_data = request.get_json()
+    if not json_data or "ids" not in json_data or "status" not in json_data:
+        return jsonify({"error": "Missing 'ids' or 'status' in request"}), 400
+
+    current_user_id = get_jwt_identity()
+    payload, code, statuses = bulk_update_status(json_data.get("ids"), json_data.get("status"), current_user_id)
+
+    # One coalesced broadcast for the whole batch.
+    if code == 200 and statuses:
+        socketio = _get_socketio()
+        if socketio:
+            _emit_queue_for_status_and_all(socketio, statuses=statuses)
+
+    return jsonify(payload), code
+
 @laundry_service_bp.route("/<int:service_id>/notes", methods=["GET"])
 @jwt_required()
 def get_laundry_service_with_messages(service_id):
@@ -520,16 +525,20 @@ def get_compact():
     sort_by = request.args.get("sort_by")
     sort_dir = request.args.get("sort_dir", default="desc").lower()
 
-    query = LaundryService.query.options(
-        selectinload(LaundryService.client),
-        selectinload(LaundryService.client_address),
-        selectinload(LaundryService.created_by_user)
-    )
+    use_read_model = read_model_enabled()
+    if use_read_model:
+        query = compact_rows_select()
+    else:
+        query = LaundryService.query.options(
+            selectinload(LaundryService.client),
+            selectinload(LaundryService.client_address),
+            selectinload(LaundryService.created_by_user)
+        )
 
     if client_id:
-        query = query.filter_by(client_id=client_id)
+        query = query.filter(LaundryService.client_id == client_id)
     if status:
-        query = query.filter_by(status=status)
+        query = query.filter(LaundryService.status == status)
 
     allowed_sort_by = {
         "id": LaundryService.id,
@@ -565,14 +574,20 @@ def get_compact():
     else:
         query = apply_default_order(query)
 
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    if use_read_model:
+        page_data = paginate_rows(query, page, per_page, map_compact_row)
+    else:
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+        page_data = {
+            "items": compact_schema_many.dump(pagination.items),
+            "total": pagination.total,
+            "page": pagination.page,
+            "per_page": pagination.per_page,
+            "pages": pagination.pages,
+        }
 
     return jsonify({
-        "items": compact_schema_many.dump(pagination.items),
-        "total": pagination.total,
-        "page": pagination.page,
-        "per_page": pagination.per_page,
-        "pages": pagination.pages,
+        **page_data,
         "sort_mode": sort_mode,
         "sort_by": sort_by,
         "sort_dir": sort_dir
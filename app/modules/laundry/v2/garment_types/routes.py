@@ -2,6 +2,8 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
 from db import db
+from app.extensions.conditional_get import conditional_get
+from app.extensions.response_cache import cached_response
 from models.garment_type import GarmentType
 from schemas.garment_type_v2_schema import GarmentTypeV2Schema
 
@@ -14,6 +16,8 @@ schema_many = GarmentTypeV2Schema(many=True)
 
 @garment_type_v2_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(GarmentType)
+@cached_response(GarmentType)
 def get_all():
     garment_types = GarmentType.query.order_by(GarmentType.name.asc()).all()
     return jsonify(schema_many.dump(garment_types)), 200
@@ -21,6 +25,7 @@ def get_all():
 
 @garment_type_v2_bp.route("/<int:garment_type_id>", methods=["GET"])
 @jwt_required()
+@conditional_get(GarmentType)
 def get_one(garment_type_id):
     garment_type = GarmentType.query.get_or_404(garment_type_id)
     return jsonify(schema.dump(garment_type)), 200
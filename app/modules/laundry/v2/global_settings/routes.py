@@ -2,6 +2,7 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
 from db import db
+from app.extensions.conditional_get import conditional_get
 from models.global_setting import GlobalSetting
 from schemas.global_setting_schema import GlobalSettingSchema
 from app.modules.laundry.v2.global_settings.categorying import normalize_global_setting_category
@@ -19,6 +20,7 @@ schema_many = GlobalSettingSchema(many=True)
 
 @global_setting_v2_bp.route("", methods=["GET"])
 @jwt_required()
+@conditional_get(GlobalSetting)
 def get_all():
     query = GlobalSetting.query
     is_active = request.args.get("is_active")
@@ -33,6 +35,7 @@ def get_all():
 
 @global_setting_v2_bp.route("/<string:item_key>", methods=["GET"])
 @jwt_required()
+@conditional_get(GlobalSetting)
 def get_one(item_key):
     item = GlobalSetting.query.filter_by(key=item_key).first_or_404()
     return jsonify(schema.dump(item)), 200
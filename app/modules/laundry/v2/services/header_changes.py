@@ -0,0 +1,59 @@
+from models.laundry_service import LaundryService
+
+
+SERVICE_LABELS = ("NORMAL", "EXPRESS")
+FULFILLMENT_TYPES = (
+    LaundryService.FULFILLMENT_TYPE_WALK_IN,
+    LaundryService.FULFILLMENT_TYPE_DELIVERY,
+    LaundryService.FULFILLMENT_TYPE_PICKUP_DELIVERY,
+)
+
+SERVICE_TYPE_LINE = "service_type"
+DELIVERY_LINE = "delivery"
+
+# Header inputs each automatic order line is derived from.
+DERIVED_LINE_INPUTS = {
+    SERVICE_TYPE_LINE: ("service_label",),
+    DELIVERY_LINE: ("fulfillment_type", "distance_km", "manual_delivery_fee"),
+}
+
+
+class HeaderPatchPlan:
+    def __init__(self, column_changes, lines):
+        self.column_changes = column_changes
+        self.lines = lines
+
+    @property
+    def has_changes(self):
+        return bool(self.column_changes or self.lines)
+
+
+def plan_header_patch(current, data):
+    """Work out what a header PATCH actually changes.
+
+    `current` is the stored service. Returns the columns whose value differs and
+    the automatic lines whose inputs are dirty; raises ValueError on bad input.
+    distance_km and manual_delivery_fee are not stored on the header, so sending
+    either one always recomputes the delivery line.
+    """
+    values = {}
+    if "service_label" in data:
+        service_label = str(data["service_label"]).strip().upper()
+        if service_label not in SERVICE_LABELS:
+            raise ValueError("service_label must be NORMAL or EXPRESS")
+        values["service_label"] = service_label
+    if "fulfillment_type" in data:
+        fulfillment_type = str(data["fulfillment_type"]).strip().upper()
+        if fulfillment_type not in FULFILLMENT_TYPES:
+            raise ValueError("fulfillment_type must be one of WALK_IN, DELIVERY, PICKUP_DELIVERY")
+        values["fulfillment_type"] = fulfillment_type
+    if data.get("notes") not in (None, ""):
+        values["notes"] = data["notes"]
+
+    column_changes = {
+        name: value for name, value in values.items() if getattr(current, name) != value
+    }
+    dirty = set(column_changes)
+    dirty.update(name for name in ("distance_km", "manual_delivery_fee") if data.get(name) is not None)
+    lines = {line for line, inputs in DERIVED_LINE_INPUTS.items() if dirty.intersection(inputs)}
+    return HeaderPatchPlan(column_changes, lines)
@@ -3,15 +3,30 @@ from decimal import Decimal, ROUND_HALF_UP
 
 from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
+# `update`/`delete` are also view names in this module.
+from sqlalchemy import update as bulk_update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
 
+from app.api.preferences import minimal_response, prefers_minimal
+from app.api.read_models import money_string
+from app.extensions.activity_log import map_status_to_log_enum, record_activity
 from app.modules.laundry.queue.events import emit_queue_updated
+from app.modules.laundry.v2.services.header_changes import DELIVERY_LINE, SERVICE_TYPE_LINE, plan_header_patch
 from app.modules.laundry.service_type_surcharge_rules import (
     resolve_client_service_type_surcharge,
+    resolve_client_service_type_surcharges,
     resolve_laundry_service_type_surcharge,
 )
 from app.services.discount_rules import calculate_commercial_discount
+from app.services.order_totals import (
+    mark_order_totals_dirty,
+    refresh_order_totals,
+    refresh_pending_order_totals,
+)
+from app.services.reference_resolver import ReferenceResolver
+from app.services.row_reconciliation import reconcile_rows
 from app.services.weight_pricing import calculate_weight_service_quote
 from db import db
 from models.catalog_service_legacy import CatalogServiceLegacy
@@ -19,12 +34,12 @@ from models.client import Client, ClientAddress
 from models.extra import Extra
 from models.global_setting import GlobalSetting
 from models.garment_type import GarmentType
-from models.laundry_activity_log import LaundryActivityLog
 from models.laundry_service import LaundryService
 from models.laundry_service_extra import LaundryServiceExtra
 from models.order_item import OrderItem
 from models.service_category_legacy import ServiceCategoryLegacy
 from models.service_variant_legacy import ServiceVariantLegacy
+from models.transaction import Transaction
 from schemas.laundry_service_v2_schema import LaundryServiceV2Schema, LaundryServiceV2UpsertSchema
 
 
@@ -35,16 +50,6 @@ schema_many = LaundryServiceV2Schema(many=True)
 upsert_schema = LaundryServiceV2UpsertSchema()
 
 
-def map_status_to_log_enum(status):
-    return {
-        "PENDING": "PENDIENTE",
-        "IN_PROGRESS": "EN_PROCESO",
-        "READY_FOR_DELIVERY": "LISTO_PARA_ENVIO",
-        "DELIVERED": "COMPLETADO",
-        "CANCELLED": "CANCELADO",
-    }.get(status)
-
-
 def _get_socketio():
     return current_app.extensions.get("socketio")
 
@@ -120,6 +125,31 @@ def _validate_client_and_address(client_id, client_address_id):
     return client, address, None
 
 
+def _minimal_service_response(service_id, status=200, **extra):
+    """Body for `Prefer: return=minimal`: id, revision and the stored totals, no reload."""
+    row = db.session.execute(
+        select(
+            LaundryService.id,
+            LaundryService.updated_at,
+            LaundryService.subtotal,
+            LaundryService.extras_total,
+            LaundryService.grand_total,
+        ).where(LaundryService.id == service_id)
+    ).one()
+    return minimal_response(
+        {
+            "id": row.id,
+            # The value to send back as expected_updated_at.
+            "revision": _serialize_datetime(row.updated_at),
+            "subtotal": money_string(row.subtotal),
+            "extras_total": money_string(row.extras_total),
+            "grand_total": money_string(row.grand_total),
+            **extra,
+        },
+        status,
+    )
+
+
 def _service_query():
     return LaundryService.query.options(
         selectinload(LaundryService.client),
@@ -267,6 +297,7 @@ def _sync_service_type_order_item(laundry_service_id: int, service_label: str):
     item.applied_price = surcharge_amount
     item.is_friendly_discount = False
     item.calculation_snapshot = _service_type_snapshot(service_label)
+    mark_order_totals_dirty(laundry_service_id)
 
 
 def _apply_nested_rows(service, data):
@@ -705,6 +736,7 @@ def _sync_delivery_order_item(
                 "is_manual_override": False,
             }
         )
+        mark_order_totals_dirty(laundry_service_id)
         return item
 
     final_delivery_fee = item.applied_price or Decimal("0.00")
@@ -743,15 +775,16 @@ def _sync_delivery_order_item(
             "is_manual_override": manual_delivery_fee is not None,
         }
     )
+    mark_order_totals_dirty(laundry_service_id)
     return item
 
 
-def _validate_fixed_order_item_payload(data):
+def _validate_fixed_order_item_payload(data, references):
     service_id = data.get("service_id")
     if service_id is None:
         raise ValueError("service_id is required")
 
-    service = CatalogServiceLegacy.query.get(service_id)
+    service = references.get(CatalogServiceLegacy, service_id)
     if not service or not service.is_active:
         raise ValueError("Service not found")
     if service.pricing_mode != CatalogServiceLegacy.PRICING_MODE_FIXED:
@@ -768,7 +801,7 @@ def _validate_fixed_order_item_payload(data):
         raise ValueError("garment_type_id only applies to WEIGHT services")
     variant = None
     if service_variant_id is not None:
-        variant = ServiceVariantLegacy.query.get(service_variant_id)
+        variant = references.get(ServiceVariantLegacy, service_variant_id)
         if not variant or variant.service_id != service.id:
             raise ValueError("service_variant_id does not belong to service_id")
 
@@ -809,11 +842,11 @@ def _validate_fixed_order_item_payload(data):
     }
 
 
-def _build_fixed_order_items(laundry_service_id, rows):
+def _build_fixed_order_items(laundry_service_id, rows, references):
     seen = set()
     items = []
     for row in rows:
-        normalized = _validate_fixed_order_item_payload(row)
+        normalized = _validate_fixed_order_item_payload(row, references)
         key = (
             normalized["service"].id,
             normalized["service_variant"].id if normalized["service_variant"] else None,
@@ -822,25 +855,25 @@ def _build_fixed_order_items(laundry_service_id, rows):
             raise ValueError("Duplicate FIXED service row in order_items payload")
         seen.add(key)
         items.append(
-            OrderItem(
-                laundry_service_id=laundry_service_id,
-                service_id=normalized["service"].id,
-                service_variant_id=(
+            {
+                "laundry_service_id": laundry_service_id,
+                "service_id": normalized["service"].id,
+                "service_variant_id": (
                     normalized["service_variant"].id if normalized["service_variant"] else None
                 ),
-                garment_type_id=None,
-                quantity=normalized["quantity"],
-                unit_catalog_price=normalized["unit_catalog_price"],
-                catalog_price=normalized["catalog_price"],
-                applied_price=normalized["applied_price"],
-                is_friendly_discount=normalized["is_friendly_discount"],
-                calculation_snapshot=normalized["calculation_snapshot"],
-            )
+                "garment_type_id": None,
+                "quantity": normalized["quantity"],
+                "unit_catalog_price": normalized["unit_catalog_price"],
+                "catalog_price": normalized["catalog_price"],
+                "applied_price": normalized["applied_price"],
+                "is_friendly_discount": normalized["is_friendly_discount"],
+                "calculation_snapshot": normalized["calculation_snapshot"],
+            }
         )
     return items
 
 
-def _build_weight_order_item(laundry_service_id, weight_payload, has_other_services):
+def _build_weight_order_item(laundry_service_id, weight_payload, has_other_services, references):
     weight_service = _resolve_weight_service_catalog()
     weight_lb = weight_payload.get("weight_lb")
     if weight_lb is None:
@@ -860,7 +893,7 @@ def _build_weight_order_item(laundry_service_id, weight_payload, has_other_servi
             raise ValueError("garment_type_id is required in weight_service.garments")
         if garment_type_id in seen_garment_ids:
             raise ValueError("Duplicate garment_type_id in weight_service.garments")
-        garment_type = GarmentType.query.get(garment_type_id)
+        garment_type = references.get(GarmentType, garment_type_id)
         if not garment_type:
             raise ValueError("Garment type not found")
         quantity = _as_money(garment.get("quantity"))
@@ -880,16 +913,17 @@ def _build_weight_order_item(laundry_service_id, weight_payload, has_other_servi
         pricing_config=_load_weight_pricing_config(),
     )
     final_price = _as_money(quote["summary"]["final_price"])
-    return OrderItem(
-        laundry_service_id=laundry_service_id,
-        service_id=weight_service.id,
-        service_variant_id=None,
-        garment_type_id=None,
-        quantity=Decimal("1.00"),
-        catalog_price=final_price,
-        applied_price=final_price,
-        is_friendly_discount=bool(quote["summary"]["is_friendly_applied"]),
-        calculation_snapshot=_snapshot_to_text(
+    return {
+        "laundry_service_id": laundry_service_id,
+        "service_id": weight_service.id,
+        "service_variant_id": None,
+        "garment_type_id": None,
+        "quantity": Decimal("1.00"),
+        "unit_catalog_price": None,
+        "catalog_price": final_price,
+        "applied_price": final_price,
+        "is_friendly_discount": bool(quote["summary"]["is_friendly_applied"]),
+        "calculation_snapshot": _snapshot_to_text(
             {
                 "weight_lb": f"{_as_money(weight_lb):.2f}",
                 "has_other_services": has_other_services,
@@ -897,73 +931,130 @@ def _build_weight_order_item(laundry_service_id, weight_payload, has_other_servi
                 "quote": quote,
             }
         ),
+    }
+
+
+ORDER_ITEM_RECONCILED_FIELDS = (
+    "garment_type_id",
+    "quantity",
+    "unit_catalog_price",
+    "catalog_price",
+    "applied_price",
+    "is_friendly_discount",
+    "calculation_snapshot",
+)
+EXTRA_RECONCILED_FIELDS = ("quantity", "unit_price", "subtotal", "is_courtesy")
+
+
+def _order_item_key(row):
+    return row["service_id"], row["service_variant_id"]
+
+
+def _extra_key(row):
+    return row["extra_id"]
+
+
+def _apply_reconciliation(model, reconciliation):
+    # ORM bulk statements: one executemany per statement kind, no per-row objects.
+    if reconciliation.deletes:
+        db.session.execute(
+            model.__table__.delete().where(model.__table__.c.id.in_(reconciliation.deletes))
+        )
+    if reconciliation.updates:
+        db.session.execute(bulk_update(model), reconciliation.updates)
+    if reconciliation.inserts:
+        db.session.execute(insert(model).execution_options(render_nulls=True), reconciliation.inserts)
+
+
+def _existing_rows(model, laundry_service_id, *criteria):
+    table = model.__table__
+    return db.session.execute(
+        select(table)
+        .where(table.c.laundry_service_id == laundry_service_id, *criteria)
+        .order_by(table.c.id.asc())
+    ).mappings().all()
+
+
+def _collect_commercial_detail_references(data):
+    """Load every catalog row the commercial-detail payload points at, one query per model."""
+
+    def rows_of(value):
+        return [row for row in value if isinstance(row, dict)] if isinstance(value, list) else []
+
+    order_items = rows_of(data.get("order_items"))
+    weight_payload = data.get("weight_service")
+    garments = rows_of(weight_payload.get("garments")) if isinstance(weight_payload, dict) else []
+    return (
+        ReferenceResolver()
+        .collect(CatalogServiceLegacy, [row.get("service_id") for row in order_items])
+        .collect(ServiceVariantLegacy, [row.get("service_variant_id") for row in order_items])
+        .collect(GarmentType, [garment.get("garment_type_id") for garment in garments])
+        .collect(Extra, [row.get("extra_id") for row in rows_of(data.get("extras"))])
+        .load()
     )
 
 
-def _replace_manual_order_items(service, data):
+def _replace_manual_order_items(service, data, references):
+    """Reconcile the manual order lines with the payload; returns the change summary or None."""
     has_weight_service_key = "weight_service" in data
     rows = data.get("order_items")
     weight_payload = data.get("weight_service")
     if rows is None and weight_payload is None:
-        if has_weight_service_key:
-            weight_service_ids = (
-                db.session.query(CatalogServiceLegacy.id)
-                .filter(CatalogServiceLegacy.pricing_mode == CatalogServiceLegacy.PRICING_MODE_WEIGHT)
-            )
-            (
-                OrderItem.query
-                .filter(OrderItem.laundry_service_id == service.id)
-                .filter(OrderItem.service_id.in_(weight_service_ids))
-                .delete(synchronize_session=False)
+        if not has_weight_service_key:
+            return None
+        weight_service_ids = (
+            select(CatalogServiceLegacy.id)
+            .where(CatalogServiceLegacy.pricing_mode == CatalogServiceLegacy.PRICING_MODE_WEIGHT)
+        )
+        existing = _existing_rows(OrderItem, service.id, OrderItem.__table__.c.service_id.in_(weight_service_ids))
+        reconciliation = reconcile_rows(existing, [], _order_item_key, ORDER_ITEM_RECONCILED_FIELDS)
+    else:
+        if rows is not None and not isinstance(rows, list):
+            raise ValueError("order_items must be a list")
+        if weight_payload is not None and not isinstance(weight_payload, dict):
+            raise ValueError("weight_service must be an object")
+
+        automatic_ids = _automatic_service_ids()
+        desired = _build_fixed_order_items(service.id, rows or [], references)
+        if weight_payload is not None:
+            desired.append(
+                _build_weight_order_item(
+                    service.id,
+                    weight_payload,
+                    has_other_services=bool(desired),
+                    references=references,
+                )
             )
-        return
+        existing = _existing_rows(OrderItem, service.id, ~OrderItem.__table__.c.service_id.in_(automatic_ids))
+        reconciliation = reconcile_rows(existing, desired, _order_item_key, ORDER_ITEM_RECONCILED_FIELDS)
 
-    if rows is not None and not isinstance(rows, list):
-        raise ValueError("order_items must be a list")
-    if weight_payload is not None and not isinstance(weight_payload, dict):
-        raise ValueError("weight_service must be an object")
+    if reconciliation.has_changes:
+        _apply_reconciliation(OrderItem, reconciliation)
+        mark_order_totals_dirty(service.id)
+    return reconciliation.summary()
 
-    automatic_ids = _automatic_service_ids()
-    (
-        OrderItem.query
-        .filter(OrderItem.laundry_service_id == service.id)
-        .filter(~OrderItem.service_id.in_(automatic_ids))
-        .delete(synchronize_session=False)
-    )
-
-    fixed_items = _build_fixed_order_items(service.id, rows or [])
-    for item in fixed_items:
-        db.session.add(item)
-
-    if weight_payload is not None:
-        weight_item = _build_weight_order_item(
-            service.id,
-            weight_payload,
-            has_other_services=bool(fixed_items),
-        )
-        db.session.add(weight_item)
 
-
-def _replace_extras(service, rows):
+def _replace_extras(service, rows, references):
+    """Reconcile the service extras with the payload; returns the change summary or None."""
     if rows is None:
-        return
+        return None
     if not isinstance(rows, list):
         raise ValueError("extras must be a list")
 
     seen_extra_ids = set()
-    (
-        LaundryServiceExtra.query
-        .filter(LaundryServiceExtra.laundry_service_id == service.id)
-        .delete(synchronize_session=False)
-    )
-
+    desired = []
     for row in rows:
         extra_id = row.get("extra_id")
         if extra_id is None:
             raise ValueError("extra_id is required")
+        try:
+            # "3" and 3 are the same extra, both for duplicates and for matching stored rows.
+            extra_id = int(extra_id)
+        except (TypeError, ValueError):
+            raise ValueError("extra_id must be an integer")
         if extra_id in seen_extra_ids:
             raise ValueError("Duplicate extra_id in extras payload")
-        extra = Extra.query.get(extra_id)
+        extra = references.get(Extra, extra_id)
         if not extra or not extra.is_active:
             raise ValueError("Extra not found")
         quantity = row.get("quantity")
@@ -974,18 +1065,25 @@ def _replace_extras(service, rows):
             raise ValueError("unit_price must be zero or greater")
         is_courtesy = bool(row.get("is_courtesy", False))
         subtotal = Decimal("0.00") if is_courtesy else _line_subtotal(int(quantity), unit_price)
-        db.session.add(
-            LaundryServiceExtra(
-                laundry_service_id=service.id,
-                extra_id=extra_id,
-                quantity=int(quantity),
-                unit_price=unit_price,
-                subtotal=subtotal,
-                is_courtesy=is_courtesy,
-            )
+        desired.append(
+            {
+                "laundry_service_id": service.id,
+                "extra_id": extra_id,
+                "quantity": int(quantity),
+                "unit_price": unit_price,
+                "subtotal": subtotal,
+                "is_courtesy": is_courtesy,
+            }
         )
         seen_extra_ids.add(extra_id)
 
+    existing = _existing_rows(LaundryServiceExtra, service.id)
+    reconciliation = reconcile_rows(existing, desired, _extra_key, EXTRA_RECONCILED_FIELDS)
+    if reconciliation.has_changes:
+        _apply_reconciliation(LaundryServiceExtra, reconciliation)
+        mark_order_totals_dirty(service.id)
+    return reconciliation.summary()
+
 
 def _apply_summary_price_overrides(service, data):
     order_item_rows = data.get("order_items")
@@ -1078,6 +1176,8 @@ def _apply_summary_price_overrides(service, data):
             )
             seen_extra_ids.add(extra_row_id)
 
+    mark_order_totals_dirty(service.id)
+
 
 @laundry_service_v2_bp.route("", methods=["GET"])
 @jwt_required()
@@ -1247,55 +1347,46 @@ def patch_header(service_id):
             "error": "Alguien mas ha editado esta orden de trabajo, por favor, refresca tu navegador"
         }), 409
 
-    service_label = json_data.get("service_label", service.service_label)
-    fulfillment_type = json_data.get("fulfillment_type", service.fulfillment_type)
-    distance_km = json_data.get("distance_km")
-    manual_delivery_fee = json_data.get("manual_delivery_fee")
-
-    if "service_label" in json_data:
-        normalized_service_label = str(service_label).strip().upper()
-        if normalized_service_label not in {"NORMAL", "EXPRESS"}:
-            return jsonify({"error": "service_label must be NORMAL or EXPRESS"}), 400
-        service.service_label = normalized_service_label
-
-    if "fulfillment_type" in json_data:
-        normalized_fulfillment_type = str(fulfillment_type).strip().upper()
-        if normalized_fulfillment_type not in {
-            LaundryService.FULFILLMENT_TYPE_WALK_IN,
-            LaundryService.FULFILLMENT_TYPE_DELIVERY,
-            LaundryService.FULFILLMENT_TYPE_PICKUP_DELIVERY,
-        }:
-            return jsonify(
-                {"error": "fulfillment_type must be one of WALK_IN, DELIVERY, PICKUP_DELIVERY"}
-            ), 400
-        service.fulfillment_type = normalized_fulfillment_type
-
     try:
-        _sync_service_type_order_item(service.id, service.service_label)
-        _sync_delivery_order_item(
-            service.id,
-            service.fulfillment_type,
-            distance_km=distance_km,
-            manual_delivery_fee=manual_delivery_fee,
-        )
-        service.updated_at = func.now()
-    except (ArithmeticError, ValueError) as exc:
-        db.session.rollback()
+        plan = plan_header_patch(service, json_data)
+    except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
 
+    if plan.has_changes:
+        try:
+            for name, value in plan.column_changes.items():
+                setattr(service, name, value)
+            service.updated_at = func.now()
+            if SERVICE_TYPE_LINE in plan.lines:
+                _sync_service_type_order_item(service.id, service.service_label)
+            if DELIVERY_LINE in plan.lines:
+                _sync_delivery_order_item(
+                    service.id,
+                    service.fulfillment_type,
+                    distance_km=json_data.get("distance_km"),
+                    manual_delivery_fee=json_data.get("manual_delivery_fee"),
+                )
+            record_activity(
+                laundry_service_id=service.id,
+                user_id=current_user_id,
+                action="ACTUALIZACION",
+                new_status=map_status_to_log_enum(service.status),
+                description="Actualizacion de cabecera operativa V2.",
+            )
+            refresh_pending_order_totals()
+            db.session.flush()
+        except (ArithmeticError, ValueError) as exc:
+            db.session.rollback()
+            return jsonify({"error": str(exc)}), 400
+
+    if prefers_minimal():
+        db.session.commit()
+        return _minimal_service_response(service.id)
+
+    # Built inside the transaction from the loaded service: no reload after commit.
+    response = _build_summary_response(service)
     db.session.commit()
-    db.session.add(
-        LaundryActivityLog(
-            laundry_service_id=service.id,
-            user_id=current_user_id,
-            action="ACTUALIZACION",
-            new_status=map_status_to_log_enum(service.status),
-            description="Actualizacion de cabecera operativa V2.",
-        )
-    )
-    db.session.commit()
-    service = _service_query().filter(LaundryService.id == service.id).first_or_404()
-    return jsonify(_build_summary_response(service)), 200
+    return jsonify(response), 200
 
 
 @laundry_service_v2_bp.route("/<int:service_id>/commercial-detail", methods=["PATCH"])
@@ -1318,26 +1409,29 @@ def patch_commercial_detail(service_id):
         notes = json_data.get("notes")
         if notes not in (None, ""):
             service.notes = notes
-        _replace_manual_order_items(service, json_data)
-        _replace_extras(service, json_data.get("extras"))
+        references = _collect_commercial_detail_references(json_data)
+        changes = {
+            "order_items": _replace_manual_order_items(service, json_data, references),
+            "extras": _replace_extras(service, json_data.get("extras"), references),
+        }
         service.updated_at = func.now()
     except (ArithmeticError, ValueError) as exc:
         db.session.rollback()
         return jsonify({"error": str(exc)}), 400
 
-    db.session.commit()
-    db.session.add(
-        LaundryActivityLog(
-            laundry_service_id=service.id,
-            user_id=current_user_id,
-            action="ACTUALIZACION",
-            new_status=map_status_to_log_enum(service.status),
-            description="Actualizacion de detalle comercial V2.",
-        )
+    record_activity(
+        laundry_service_id=service.id,
+        user_id=current_user_id,
+        action="ACTUALIZACION",
+        new_status=map_status_to_log_enum(service.status),
+        description="Actualizacion de detalle comercial V2.",
     )
+    refresh_pending_order_totals()
     db.session.commit()
+    if prefers_minimal():
+        return _minimal_service_response(service.id, changes=changes)
     service = _service_query().filter(LaundryService.id == service.id).first_or_404()
-    return jsonify(_build_summary_response(service)), 200
+    return jsonify({**_build_summary_response(service), "changes": changes}), 200
 
 
 @laundry_service_v2_bp.route("/<int:service_id>/summary/prices", methods=["PATCH"])
@@ -1355,21 +1449,24 @@ def patch_summary_prices(service_id):
         db.session.rollback()
         return jsonify({"error": str(exc)}), 400
 
-    db.session.commit()
-    db.session.add(
-        LaundryActivityLog(
-            laundry_service_id=service.id,
-            user_id=current_user_id,
-            action="ACTUALIZACION",
-            new_status=map_status_to_log_enum(service.status),
-            description="Actualizacion de precios del resumen V2.",
-        )
+    record_activity(
+        laundry_service_id=service.id,
+        user_id=current_user_id,
+        action="ACTUALIZACION",
+        new_status=map_status_to_log_enum(service.status),
+        description="Actualizacion de precios del resumen V2.",
     )
+    refresh_pending_order_totals()
     db.session.commit()
+    if prefers_minimal():
+        return _minimal_service_response(service.id)
     service = _service_query().filter(LaundryService.id == service.id).first_or_404()
     return jsonify(_build_summary_response(service)), 200
 
 
+NESTED_CREATE_FIELDS = ("order_items", "weight_service", "extras")
+
+
 @laundry_service_v2_bp.route("", methods=["POST"])
 @jwt_required()
 def create():
@@ -1377,8 +1474,10 @@ def create():
     if not json_data:
         return jsonify({"error": "No input data provided"}), 400
 
+    # Optional lines, validated like PATCH /<id>/commercial-detail.
+    nested = {key: json_data[key] for key in NESTED_CREATE_FIELDS if key in json_data}
     try:
-        data = upsert_schema.load(json_data)
+        data = upsert_schema.load({key: value for key, value in json_data.items() if key not in nested})
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
@@ -1404,41 +1503,208 @@ def create():
     else:
         _sync_pending_order_for_status(service)
 
-    db.session.add(service)
-    db.session.flush()
-
+    # One transaction: the flush only assigns the id, nothing is visible to
+    # the queue until every line and the activity log commit together.
     try:
-        delivery_order_item = _build_default_delivery_order_item(service.id)
-        service_type_order_item = _build_default_service_type_order_item(
-            service.id,
-            service.client_id,
-            service.service_label,
+        db.session.add(service)
+        db.session.flush()
+        db.session.add(_build_default_delivery_order_item(service.id))
+        db.session.add(
+            _build_default_service_type_order_item(
+                service.id,
+                service.client_id,
+                service.service_label,
+            )
         )
-    except ValueError as exc:
+        if nested:
+            references = _collect_commercial_detail_references(nested)
+            _replace_manual_order_items(service, nested, references)
+            _replace_extras(service, nested.get("extras"), references)
+        mark_order_totals_dirty(service.id)
+        record_activity(
+            laundry_service_id=service.id,
+            user_id=current_user_id,
+            action="CREACION",
+            new_status=map_status_to_log_enum(service.status),
+            description="Creacion del servicio de lavanderia V2.",
+        )
+        refresh_pending_order_totals()
+        db.session.commit()
+    except (ArithmeticError, ValueError) as exc:
         db.session.rollback()
         return jsonify({"error": str(exc)}), 400
-    db.session.add(delivery_order_item)
-    db.session.add(service_type_order_item)
-    db.session.commit()
-
-    log = LaundryActivityLog(
-        laundry_service_id=service.id,
-        user_id=current_user_id,
-        action="CREACION",
-        new_status=map_status_to_log_enum(service.status),
-        description="Creacion del servicio de lavanderia V2.",
-    )
-    db.session.add(log)
-    db.session.commit()
 
+    # Side effects only once the service is durable.
     socketio = _get_socketio()
     if socketio:
         _emit_queue_for_status_and_all(socketio, statuses=[service.status])
 
+    if prefers_minimal():
+        return _minimal_service_response(service.id, 201)
     service = _service_query().filter(LaundryService.id == service.id).first_or_404()
     return jsonify(schema.dump(service)), 201
 
 
+def _validate_bulk_intake_rows(rows):
+    """Schema + client/address checks for every row; returns (results, accepted)."""
+    results = [None] * len(rows)
+    loaded = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            results[index] = {"index": index, "status": 400, "error": "Each service must be an object"}
+            continue
+        try:
+            loaded.append((index, upsert_schema.load(row)))
+        except Exception as e:
+            results[index] = {"index": index, "status": 400, "error": str(e)}
+
+    client_ids = {data["client_id"] for _, data in loaded}
+    address_ids = {data["client_address_id"] for _, data in loaded}
+    known_clients = set(
+        db.session.execute(select(Client.id).where(Client.id.in_(client_ids))).scalars()
+    ) if client_ids else set()
+    address_owners = dict(
+        db.session.execute(
+            select(ClientAddress.id, ClientAddress.client_id).where(ClientAddress.id.in_(address_ids))
+        ).all()
+    ) if address_ids else {}
+
+    transaction_ids = {data["transaction_id"] for _, data in loaded if data.get("transaction_id") is not None}
+    known_transactions = set(
+        db.session.execute(select(Transaction.id).where(Transaction.id.in_(transaction_ids))).scalars()
+    ) if transaction_ids else set()
+
+    accepted = []
+    for index, data in loaded:
+        if data["client_id"] not in known_clients:
+            results[index] = {"index": index, "status": 404, "error": "Client not found"}
+        elif address_owners.get(data["client_address_id"]) != data["client_id"]:
+            results[index] = {"index": index, "status": 400, "error": "Address does not belong to client"}
+        elif data.get("transaction_id") is not None and data["transaction_id"] not in known_transactions:
+            results[index] = {"index": index, "status": 404, "error": "Transaction not found"}
+        else:
+            accepted.append((index, data))
+    return results, accepted
+
+
+@laundry_service_v2_bp.route("/bulk", methods=["POST"])
+@jwt_required()
+def create_bulk():
+    json_data = request.get_json()
+    rows = json_data.get("services") if isinstance(json_data, dict) else None
+    if not isinstance(rows, list) or not rows:
+        return jsonify({"error": "'services' must be a non-empty list"}), 400
+    max_services = current_app.config.get("BULK_INTAKE_MAX_SERVICES", 100)
+    if len(rows) > max_services:
+        return jsonify({"error": f"A bulk intake can hold at most {max_services} services"}), 400
+
+    results, accepted = _validate_bulk_intake_rows(rows)
+    if not accepted:
+        return jsonify({"created": 0, "items": results}), 400
+
+    # Shared references, resolved once for the whole batch.
+    try:
+        delivery_service = _resolve_delivery_catalog()
+        service_type_catalog = _resolve_service_type_catalog()
+        surcharges = resolve_client_service_type_surcharges(
+            (data["client_id"], data["service_label"]) for _, data in accepted
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    current_user_id = get_jwt_identity()
+    next_pending_order = _next_pending_order()
+    services = []
+    for _, data in accepted:
+        service = LaundryService(
+            client_id=data["client_id"],
+            client_address_id=data["client_address_id"],
+            scheduled_pickup_at=data["scheduled_pickup_at"],
+            service_label=data["service_label"],
+            fulfillment_type=data.get("fulfillment_type", "WALK_IN"),
+            status=data["status"],
+            transaction_id=data.get("transaction_id"),
+            notes=data.get("notes"),
+            created_by_user_id=current_user_id,
+        )
+        # Consecutive queue slots in request order.
+        if service.status == "PENDING":
+            service.pending_order = next_pending_order
+            next_pending_order += 1
+        else:
+            _sync_pending_order_for_status(service)
+        services.append(service)
+
+    # The flush assigns the ids (batched where the driver returns them);
+    # everything after it is one multi-row statement per table.
+    try:
+        db.session.add_all(services)
+        db.session.flush()
+
+        order_items = []
+        for service in services:
+            surcharge_amount = surcharges[(service.client_id, service.service_label)]
+            order_items.append(
+                {
+                    "laundry_service_id": service.id,
+                    "service_id": delivery_service.id,
+                    "service_variant_id": None,
+                    "garment_type_id": None,
+                    "quantity": 1,
+                    "catalog_price": 0,
+                    "applied_price": 0,
+                    "is_friendly_discount": False,
+                    "calculation_snapshot": None,
+                }
+            )
+            order_items.append(
+                {
+                    "laundry_service_id": service.id,
+                    "service_id": service_type_catalog.id,
+                    "service_variant_id": None,
+                    "garment_type_id": None,
+                    "quantity": 1,
+                    "catalog_price": surcharge_amount,
+                    "applied_price": surcharge_amount,
+                    "is_friendly_discount": False,
+                    "calculation_snapshot": _service_type_snapshot(service.service_label),
+                }
+            )
+        # render_nulls keeps every row in one executemany: omitting NULL columns
+        # would split the batch by key set.
+        db.session.execute(insert(OrderItem).execution_options(render_nulls=True), order_items)
+        refresh_order_totals(*(service.id for service in services))
+        for service in services:
+            record_activity(
+                laundry_service_id=service.id,
+                user_id=current_user_id,
+                action="CREACION",
+                new_status=map_status_to_log_enum(service.status),
+                description="Creacion del servicio de lavanderia V2 (ingreso masivo).",
+            )
+        created = [
+            {"index": index, "status": 201, "id": service.id, "pending_order": service.pending_order}
+            for (index, _), service in zip(accepted, services)
+        ]
+        db.session.commit()
+    except SQLAlchemyError:
+        # A row the checks above could not catch (e.g. a row deleted meanwhile)
+        # fails the whole transaction, so nothing from this request was stored.
+        db.session.rollback()
+        current_app.logger.exception("Bulk intake failed")
+        for index, _ in accepted:
+            results[index] = {"index": index, "status": 409, "error": "Not created: the bulk intake was rolled back"}
+        return jsonify({"error": "The services could not be stored", "created": 0, "items": results}), 409
+
+    socketio = _get_socketio()
+    if socketio:
+        _emit_queue_for_status_and_all(socketio, statuses=sorted({service.status for service in services}))
+
+    for item in created:
+        results[item["index"]] = item
+    return jsonify({"created": len(created), "items": results}), 201 if len(created) == len(rows) else 207
+
+
 @laundry_service_v2_bp.route("/<int:service_id>", methods=["PUT"])
 @jwt_required()
 def update(service_id):
@@ -1489,10 +1755,8 @@ def update(service_id):
         payload, code = nested_error
         return jsonify(payload), code
 
-    db.session.commit()
-
     if old_status != service.status:
-        log = LaundryActivityLog(
+        record_activity(
             laundry_service_id=service.id,
             user_id=current_user_id,
             action="ACTUALIZACION",
@@ -1500,13 +1764,15 @@ def update(service_id):
             new_status=map_status_to_log_enum(service.status),
             description="Actualizacion del servicio de lavanderia V2.",
         )
-        db.session.add(log)
-        db.session.commit()
+    refresh_pending_order_totals()
+    db.session.commit()
 
     socketio = _get_socketio()
     if socketio:
         _emit_queue_for_status_and_all(socketio, statuses=[old_status, service.status])
 
+    if prefers_minimal():
+        return _minimal_service_response(service.id)
     service = _service_query().filter(LaundryService.id == service.id).first_or_404()
     return jsonify(schema.dump(service)), 200
 
@@ -1,12 +1,14 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 import re
 import unicodedata
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from models.menu import Menu
 from models.role import Role
-from models.user import User
 from schemas.menu_schema import MenuSchema
 from db import db
+from app.extensions.response_cache import cached_response
+from app.modules.menus.tree import menu_trees
+from app.services.identity import current_role_id
 
 menu_bp = Blueprint("menu_bp", __name__, url_prefix="/menus")
 menu_schema = MenuSchema(many=True)
@@ -44,37 +46,10 @@ def _build_menu_key(payload, menu=None):
     return None
 
 def get_current_user_roles():
-    user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
+    role_id = current_role_id()
+    if role_id is None:
         return []
-    return [user.role.id]
-
-def _serialize_menu_node(menu):
-    return {
-        "id": menu.id,
-        "key": menu.key,
-        "label": menu.label,
-        "path": menu.path,
-        "icon": menu.icon,
-        "show_in_sidebar": menu.show_in_sidebar,
-        "order": menu.order,
-        "parent_id": menu.parent_id,
-        "created_at": menu.created_at,
-        "updated_at": menu.updated_at,
-        "children": []
-    }
-
-def build_tree(flat_list):
-    items = {menu.id: _serialize_menu_node(menu) for menu in flat_list}
-    roots = []
-    for menu in flat_list:
-        current = items[menu.id]
-        if menu.parent_id and menu.parent_id in items:
-            items[menu.parent_id]["children"].append(current)
-        else:
-            roots.append(current)
-    return roots
+    return [role_id]
 
 @menu_bp.route("", methods=["GET"])
 @jwt_required()
@@ -82,18 +57,20 @@ def get_menus():
     allowed_roles = get_current_user_roles()
     if not allowed_roles:
         return jsonify([]), 200
-    menus_query = (
-        Menu.query
-        .filter(Menu.show_in_sidebar == True)
-        .filter(Menu.roles.any(Role.id.in_(allowed_roles)))
-        .order_by(Menu.order)
-        .all()
-    )
-    menu_tree = build_tree(menus_query)
-    return jsonify(menu_schema.dump(menu_tree)), 200
+    tree = menu_trees.get(allowed_roles[0])
+    # Weak comparison: the compression hook weakens the ETag of gzipped bodies.
+    if request.if_none_match.contains_weak(tree.etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(tree.body, status=200, mimetype="application/json")
+    response.set_etag(tree.etag)
+    response.vary.add("Authorization")
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 @menu_bp.route("/all", methods=["GET"])
 @jwt_required()
+@cached_response(Menu)
 def get_all_menus():
     menus = Menu.query.order_by(Menu.order).all()
     return jsonify(menu_schema.dump(menus)), 200
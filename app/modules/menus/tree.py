@@ -0,0 +1,103 @@
+import hashlib
+import threading
+import time
+
+from flask import current_app
+
+from app.extensions.response_cache import table_versions
+from models.menu import Menu
+from models.role import Role
+from schemas.menu_schema import MenuSchema
+
+
+menu_schema = MenuSchema(many=True)
+
+# menus covers create/update/delete, menu_roles the role assignments and
+# roles a deleted role.
+MENU_TREE_TABLES = ("menus", "menu_roles", "roles")
+
+
+def _serialize_menu_node(menu):
+    return {
+        "id": menu.id,
+        "key": menu.key,
+        "label": menu.label,
+        "path": menu.path,
+        "icon": menu.icon,
+        "show_in_sidebar": menu.show_in_sidebar,
+        "order": menu.order,
+        "parent_id": menu.parent_id,
+        "created_at": menu.created_at,
+        "updated_at": menu.updated_at,
+        "children": []
+    }
+
+def build_tree(flat_list):
+    items = {menu.id: _serialize_menu_node(menu) for menu in flat_list}
+    roots = []
+    for menu in flat_list:
+        current = items[menu.id]
+        if menu.parent_id and menu.parent_id in items:
+            items[menu.parent_id]["children"].append(current)
+        else:
+            roots.append(current)
+    return roots
+
+
+class MenuTree:
+    def __init__(self, table_state, body):
+        self.table_state = table_state
+        self.body = body
+        # A content hash, so every worker hands out the same ETag for the same tree.
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.built_at = time.monotonic()
+
+
+class MenuTreeCache:
+    """Rendered GET /menus body per role, rebuilt when menus or role assignments change.
+
+    Local commits are noticed through table_versions; the TTL picks up writes
+    made by other workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._trees = {}
+        self.builds = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._trees.clear()
+
+    def get(self, role_id):
+        ttl_seconds = current_app.config.get("MENU_TREE_TTL_SECONDS", 60)
+        tree = self._trees.get(role_id)
+        if tree is not None and self._is_fresh(tree, ttl_seconds):
+            return tree
+
+        with self._lock:
+            tree = self._trees.get(role_id)
+            if tree is not None and self._is_fresh(tree, ttl_seconds):
+                return tree
+            # Read the counters before querying so a concurrent commit forces another rebuild.
+            table_state = table_versions.get(MENU_TREE_TABLES)
+            menus = (
+                Menu.query
+                .filter(Menu.show_in_sidebar == True)
+                .filter(Menu.roles.any(Role.id == role_id))
+                .order_by(Menu.order)
+                .all()
+            )
+            body = current_app.json.dumps(menu_schema.dump(build_tree(menus))).encode()
+            tree = MenuTree(table_state, body)
+            self._trees[role_id] = tree
+            self.builds += 1
+            return tree
+
+    def _is_fresh(self, tree, ttl_seconds):
+        if time.monotonic() - tree.built_at >= ttl_seconds:
+            return False
+        return tree.table_state == table_versions.get(MENU_TREE_TABLES)
+
+
+menu_trees = MenuTreeCache()
@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
+from sqlalchemy.orm import joinedload
+from app.api.streaming import iter_query, requested_stream_format, stream_items
 from db import db
 from models.task import Task
 from models.task_view import TaskView
@@ -14,7 +16,13 @@ task_view_schema = TaskViewSchema()
 @task_bp.route("", methods=["GET"])
 @jwt_required()
 def get_all_tasks():
-    tasks = Task.query.order_by(Task.created_at.desc()).all()
+    query = Task.query.order_by(Task.created_at.desc())
+    stream_format = requested_stream_format()
+    if stream_format:
+        # user_name comes from the same row; no per-task lazy load mid-cursor.
+        query = query.options(joinedload(Task.user))
+        return stream_items(iter_query(query), task_schema.dump, stream_format)
+    tasks = query.all()
     return jsonify(task_list_schema.dump(tasks)), 200
 
 @task_bp.route("", methods=["POST"])
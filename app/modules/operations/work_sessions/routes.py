@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, Response
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from datetime import datetime, timezone
 from db import db
+from app.api.streaming import iter_query, requested_stream_format, stream_items
 from models.global_setting import GlobalSetting
 from models.work_session import WorkSession
 from schemas.work_session_schema import WorkSessionSchema
@@ -118,7 +119,11 @@ def get_work_sessions():
         except ValueError:
             return jsonify({"error": "Invalid date format. Use YYYY-MM-DD"}), 400
 
-    sessions = query.order_by(WorkSession.id.desc()).all()
+    query = query.order_by(WorkSession.id.desc())
+    stream_format = requested_stream_format()
+    if stream_format:
+        return stream_items(iter_query(query), work_session_schema.dump, stream_format)
+    sessions = query.all()
     return jsonify(work_session_list_schema.dump(sessions)), 200
 
 @work_session_bp.route("/latest", methods=["GET"])
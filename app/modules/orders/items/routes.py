@@ -3,6 +3,8 @@ import json
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
+from app.api.streaming import iter_query, requested_stream_format, stream_items
+from app.services.order_totals import refresh_order_totals
 from db import db
 from models.catalog_service_legacy import CatalogServiceLegacy
 from models.order_item import OrderItem
@@ -74,7 +76,11 @@ def get_all():
         query = query.filter(OrderItem.laundry_service_id == laundry_service_id)
     if service_id is not None:
         query = query.filter(OrderItem.service_id == service_id)
-    items = query.order_by(OrderItem.id.desc()).all()
+    query = query.order_by(OrderItem.id.desc())
+    stream_format = requested_stream_format()
+    if stream_format:
+        return stream_items(iter_query(query), schema.dump, stream_format)
+    items = query.all()
     return jsonify(schema_many.dump(items)), 200
 
 
@@ -102,6 +108,7 @@ def create():
         return jsonify(payload), code
     item = OrderItem(**data)
     db.session.add(item)
+    refresh_order_totals(item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": "Order item created", "item": schema.dump(item)}), 201
 
@@ -110,6 +117,7 @@ def create():
 @jwt_required()
 def update(item_id):
     item = OrderItem.query.get_or_404(item_id)
+    previous_service_id = item.laundry_service_id
     json_data = request.get_json()
     if not json_data:
         return jsonify({"error": "No input data provided"}), 400
@@ -124,6 +132,7 @@ def update(item_id):
         return jsonify(payload), code
     for key, value in data.items():
         setattr(item, key, value)
+    refresh_order_totals(previous_service_id, item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": "Order item updated", "item": schema.dump(item)}), 200
 
@@ -133,5 +142,6 @@ def update(item_id):
 def delete(item_id):
     item = OrderItem.query.get_or_404(item_id)
     db.session.delete(item)
+    refresh_order_totals(item.laundry_service_id)
     db.session.commit()
     return jsonify({"message": f"Order item {item_id} deleted"}), 200
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from db import db
+from app.extensions.response_cache import cached_response
 from models.menu import Menu
 from models.role import Role
 from models.user import User
@@ -35,6 +36,7 @@ def _serialize_menu_catalog_item(menu):
 
 @role_bp.route("", methods=["GET"])
 @jwt_required()
+@cached_response(Role)
 def get_roles():
     roles = Role.query.order_by(Role.id).all()
     return jsonify(role_list_schema.dump(roles)), 200
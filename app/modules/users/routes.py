@@ -1,12 +1,13 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.security import check_password_hash, generate_password_hash
 from db import db
+from app.extensions.password_hashing import hash_password, verify_password
 from models.menu import Menu
 from models.user import User
 from models.user_shortcut import UserShortcut
 from models.role import Role
 from schemas.user_schema import UserSchema
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.identity import ADMIN_ROLE_ID, current_role_id
 
 user_bp = Blueprint("user_bp", __name__, url_prefix="/users")
 user_schema = UserSchema()
@@ -20,14 +21,14 @@ def _get_current_user():
     return User.query.get_or_404(current_user_id)
 
 
-def _get_allowed_shortcut_keys(user):
+def _get_allowed_shortcut_keys():
     allowed_menu_keys = {
         menu.key
         for menu in (
             Menu.query
             .filter(Menu.show_in_sidebar == True)
             .filter(Menu.path.isnot(None))
-            .filter(Menu.roles.any(Role.id == user.role_id))
+            .filter(Menu.roles.any(Role.id == current_role_id()))
             .all()
         )
     }
@@ -93,7 +94,7 @@ def register_user():
     existing_user = User.query.filter_by(username=username).first()
     if existing_user:
         return jsonify({"error": "User already exists"}), 409
-    hashed_password = generate_password_hash(password)
+    hashed_password = hash_password(password)
     new_user = User(
         username=username,
         password=hashed_password,
@@ -147,9 +148,9 @@ def get_profile():
 @user_bp.route("/shortcuts", methods=["GET"])
 @jwt_required()
 def get_shortcuts():
-    user = _get_current_user()
-    allowed_keys = _get_allowed_shortcut_keys(user)
-    valid_shortcuts = [shortcut for shortcut in user.shortcuts if shortcut.shortcut_key in allowed_keys]
+    allowed_keys = _get_allowed_shortcut_keys()
+    shortcuts = UserShortcut.query.filter_by(user_id=get_jwt_identity()).all()
+    valid_shortcuts = [shortcut for shortcut in shortcuts if shortcut.shortcut_key in allowed_keys]
 
     if not valid_shortcuts:
       return jsonify([{"key": DEFAULT_SHORTCUT_KEY, "order": 0}]), 200
@@ -167,7 +168,7 @@ def create_shortcut():
     if not shortcut_key:
         return jsonify({"error": "Shortcut key is required"}), 400
 
-    allowed_keys = _get_allowed_shortcut_keys(user)
+    allowed_keys = _get_allowed_shortcut_keys()
     if shortcut_key not in allowed_keys:
         return jsonify({"error": "Shortcut key is not available for current user"}), 400
 
@@ -280,10 +281,10 @@ def change_password(user_id):
         return jsonify({"error": "Both old and new passwords are required"}), 400
 
 
-    if not check_password_hash(user.password, old_password):
+    if not verify_password(user.password, old_password):
         return jsonify({"error": "Incorrect current password"}), 401
 
-    user.password = generate_password_hash(new_password)
+    user.password = hash_password(new_password)
     db.session.commit()
 
     return jsonify({"message": "Password updated successfully"}), 200
@@ -292,10 +293,7 @@ def change_password(user_id):
 @user_bp.route("/<int:user_id>/force-password", methods=["PUT"])
 @jwt_required()
 def force_change_password(user_id):
-    current_user_id = get_jwt_identity()
-    current_user = User.query.get_or_404(current_user_id)
-
-    if current_user.role_id != 1:
+    if current_role_id() != ADMIN_ROLE_ID:
         return jsonify({"error": "Only admins can force password changes"}), 403
 
     user = User.query.get_or_404(user_id)
@@ -304,7 +302,7 @@ def force_change_password(user_id):
     if not json_data or "new_password" not in json_data:
         return jsonify({"error": "New password required"}), 400
 
-    user.password = generate_password_hash(json_data["new_password"])
+    user.password = hash_password(json_data["new_password"])
     db.session.commit()
 
     return jsonify({"message": f"Password updated for user {user.username}"}), 200
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+FUZZY_MIN_SIMILARITY = 0.3
+FUZZY_MAX_WORDS_PER_TOKEN = 10
+
+NAME_START_MARKER = "^"
+WORD_START_MARKER = "<"
+
+SCORE_NAME_EXACT = 100
+SCORE_DOCUMENT_EXACT = 95
+SCORE_NAME_PREFIX = 80
+SCORE_DOCUMENT_PREFIX = 70
+SCORE_NAME_WORD_PREFIX = 60
+SCORE_EMAIL_PREFIX = 50
+SCORE_NAME_CONTAINS = 40
+SCORE_FUZZY = 20
+
+
+def normalize_search_text(value: Any) -> str:
+    if value is None:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    ascii_value = "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", ascii_value).split())
+
+
+def _compact_key(value: Any) -> str:
+    return normalize_search_text(value).replace(" ", "")
+
+
+def _email_key(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value).strip().casefold()
+
+
+def _word_trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def _name_keys(name_key: str) -> set[str]:
+    # Padded word trigrams plus explicit word-start and name-start markers, so
+    # prefix tiers come straight out of the postings without scanning names.
+    keys = set()
+    for word in name_key.split():
+        keys |= _word_trigrams(word)
+        if len(word) >= 3:
+            keys.add(WORD_START_MARKER + word[:3])
+    for length in range(1, min(len(name_key), 3) + 1):
+        keys.add(NAME_START_MARKER + name_key[:length])
+    return keys
+
+
+def _token_trigrams(token: str) -> set[str]:
+    # Short tokens only match at the start of a word, longer ones anywhere.
+    if len(token) < 3:
+        padded = f"  {token}"
+        return {padded[index:index + 3] for index in range(len(padded) - 2)}
+    return {token[index:index + 3] for index in range(len(token) - 2)}
+
+
+def _similarity(left: set[str], right: set[str]) -> float:
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+class ClientSearchDocument(NamedTuple):
+    id: int
+    name: str
+    document_id: Optional[str]
+    email: Optional[str]
+    name_key: str
+    document_key: str
+    email_key: str
+
+
+class ClientSearchIndex:
+    """In-memory trigram/prefix index over client name, document_id and email."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+        self.is_built = False
+
+    def _reset(self):
+        self._documents: Dict[int, ClientSearchDocument] = {}
+        self._name_postings: Dict[str, set[int]] = defaultdict(set)
+        self._names: Dict[str, set[int]] = defaultdict(set)
+        self._name_lengths: Dict[int, set[int]] = defaultdict(set)
+        self._words: Dict[str, set[int]] = defaultdict(set)
+        self._word_postings: Dict[str, set[str]] = defaultdict(set)
+        self._document_keys: List[tuple[str, int]] = []
+        self._email_keys: List[tuple[str, int]] = []
+
+    def __len__(self):
+        return len(self._documents)
+
+    def rebuild(self, rows: Iterable[Any]):
+        with self._lock:
+            self._reset()
+            for row in rows:
+                self._add(self._make_document(row.id, row.name, row.document_id, row.email), sort=False)
+            self._document_keys.sort()
+            self._email_keys.sort()
+            self.is_built = True
+
+    def upsert(self, client_id: int, name: str, document_id: Optional[str] = None, email: Optional[str] = None):
+        document = self._make_document(client_id, name, document_id, email)
+        with self._lock:
+            self._remove(client_id)
+            self._add(document, sort=True)
+
+    def remove(self, client_id: int):
+        with self._lock:
+            self._remove(client_id)
+
+    def search(self, query: Any, limit: int = 20) -> List[Dict[str, Any]]:
+        query_key = normalize_search_text(query)
+        if not query_key or limit <= 0:
+            return []
+        tokens = query_key.split()
+        compact_query = query_key.replace(" ", "")
+        email_query = _email_key(query)
+
+        with self._lock:
+            scores = self._name_matches(query_key, tokens, limit)
+            for client_id in self._prefix_matches(self._document_keys, compact_query):
+                exact = self._documents[client_id].document_key == compact_query
+                score = SCORE_DOCUMENT_EXACT if exact else SCORE_DOCUMENT_PREFIX
+                scores[client_id] = max(scores.get(client_id, 0), score)
+            for client_id in self._prefix_matches(self._email_keys, email_query):
+                scores[client_id] = max(scores.get(client_id, 0), SCORE_EMAIL_PREFIX)
+
+            if not scores and len(query_key) >= 3:
+                scores = self._fuzzy_name_matches(tokens)
+
+            best = heapq.nsmallest(
+                limit,
+                scores.items(),
+                key=lambda entry: (-entry[1], len(self._documents[entry[0]].name_key), entry[0]),
+            )
+            return [
+                {
+                    "id": client_id,
+                    "name": self._documents[client_id].name,
+                    "document_id": self._documents[client_id].document_id,
+                    "email": self._documents[client_id].email,
+                    "score": score,
+                }
+                for client_id, score in best
+            ]
+
+    def _make_document(self, client_id, name, document_id, email):
+        return ClientSearchDocument(
+            id=int(client_id),
+            name=name,
+            document_id=document_id,
+            email=email,
+            name_key=normalize_search_text(name),
+            document_key=_compact_key(document_id),
+            email_key=_email_key(email),
+        )
+
+    def _add(self, document: ClientSearchDocument, sort: bool):
+        self._documents[document.id] = document
+        for key in _name_keys(document.name_key):
+            self._name_postings[key].add(document.id)
+        self._names[document.name_key].add(document.id)
+        self._name_lengths[len(document.name_key)].add(document.id)
+        for word in set(document.name_key.split()):
+            if word not in self._words:
+                for trigram in _word_trigrams(word):
+                    self._word_postings[trigram].add(word)
+            self._words[word].add(document.id)
+        for keys, key in ((self._document_keys, document.document_key), (self._email_keys, document.email_key)):
+            if not key:
+                continue
+            if sort:
+                insort(keys, (key, document.id))
+            else:
+                keys.append((key, document.id))
+
+    def _remove(self, client_id: int):
+        document = self._documents.pop(client_id, None)
+        if document is None:
+            return
+        for key in _name_keys(document.name_key):
+            self._discard(self._name_postings, key, client_id)
+        self._discard(self._names, document.name_key, client_id)
+        self._discard(self._name_lengths, len(document.name_key), client_id)
+        for word in set(document.name_key.split()):
+            self._discard(self._words, word, client_id)
+            if word not in self._words:
+                for trigram in _word_trigrams(word):
+                    self._discard(self._word_postings, trigram, word)
+        for keys, key in ((self._document_keys, document.document_key), (self._email_keys, document.email_key)):
+            if not key:
+                continue
+            position = bisect_left(keys, (key, client_id))
+            if position < len(keys) and keys[position] == (key, client_id):
+                del keys[position]
+
+    @staticmethod
+    def _discard(mapping: Dict[Any, set], key: Any, value: Any):
+        members = mapping.get(key)
+        if members is None:
+            return
+        members.discard(value)
+        if not members:
+            del mapping[key]
+
+    def _postings(self, keys: Iterable[str]) -> set[int]:
+        postings = [self._name_postings.get(key) for key in keys]
+        if not postings or any(posting is None for posting in postings):
+            return set()
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _name_matches(self, query_key: str, tokens: List[str], limit: int) -> Dict[int, int]:
+        # Trigram postings are exact for tokens of up to three characters; longer
+        # tokens are verified lazily, only for the names that make it into a tier.
+        candidates = None
+        for token in tokens:
+            token_candidates = self._postings(_token_trigrams(token))
+            candidates = token_candidates if candidates is None else candidates & token_candidates
+            if not candidates:
+                return {}
+
+        long_tokens = [token for token in tokens if len(token) > 3]
+        scores: Dict[int, int] = {}
+        for client_id in self._names.get(query_key, ()):
+            scores[client_id] = SCORE_NAME_EXACT
+
+        prefix_candidates = candidates & self._name_postings.get(NAME_START_MARKER + query_key[:3], set())
+        self._take_ranked(
+            scores,
+            prefix_candidates,
+            SCORE_NAME_PREFIX,
+            limit,
+            (lambda name_key: name_key.startswith(query_key)) if len(query_key) > 3 else None,
+        )
+
+        word_prefix_candidates = candidates
+        for token in tokens:
+            if len(token) >= 3:
+                word_prefix_candidates = word_prefix_candidates & self._name_postings.get(
+                    WORD_START_MARKER + token[:3], set()
+                )
+        self._take_ranked(
+            scores,
+            word_prefix_candidates,
+            SCORE_NAME_WORD_PREFIX,
+            limit,
+            (
+                lambda name_key: all(
+                    any(word.startswith(token) for word in name_key.split()) for token in long_tokens
+                )
+            ) if long_tokens else None,
+        )
+
+        self._take_ranked(
+            scores,
+            candidates,
+            SCORE_NAME_CONTAINS,
+            limit,
+            (lambda name_key: all(token in name_key for token in long_tokens)) if long_tokens else None,
+        )
+        return scores
+
+    def _take_ranked(
+        self,
+        scores: Dict[int, int],
+        candidates: set[int],
+        score: int,
+        limit: int,
+        accept: Optional[Callable[[str], bool]],
+    ):
+        # Walk candidates shortest name first (then id), which matches the final
+        # ordering inside a tier, and stop once `limit` new names were taken.
+        taken = 0
+        for length in sorted(self._name_lengths):
+            for client_id in sorted(candidates & self._name_lengths[length]):
+                if client_id in scores:
+                    continue
+                if accept is not None and not accept(self._documents[client_id].name_key):
+                    continue
+                scores[client_id] = score
+                taken += 1
+                if taken >= limit:
+                    return
+
+    def _fuzzy_name_matches(self, tokens: List[str]) -> Dict[int, int]:
+        # Typos are matched word by word against the (small) vocabulary of name
+        # words, then intersected across tokens.
+        token_matches = []
+        for token in tokens:
+            similarities = self._similar_words(token)
+            if not similarities:
+                continue
+            matches: Dict[int, float] = {}
+            for word, similarity in similarities:
+                for client_id in self._words[word]:
+                    if similarity > matches.get(client_id, 0.0):
+                        matches[client_id] = similarity
+            token_matches.append(matches)
+        if not token_matches:
+            return {}
+
+        token_matches.sort(key=len)
+        candidates = set(token_matches[0]).intersection(*token_matches[1:])
+        return {
+            client_id: max(1, int(SCORE_FUZZY * sum(matches[client_id] for matches in token_matches) / len(tokens)))
+            for client_id in candidates
+        }
+
+    def _similar_words(self, token: str) -> List[tuple[str, float]]:
+        token_trigrams = _word_trigrams(token)
+        words = set()
+        for trigram in token_trigrams:
+            words |= self._word_postings.get(trigram, set())
+        similarities = []
+        for word in words:
+            similarity = _similarity(token_trigrams, _word_trigrams(word))
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                similarities.append((word, similarity))
+        return heapq.nlargest(FUZZY_MAX_WORDS_PER_TOKEN, similarities, key=lambda entry: (entry[1], entry[0]))
+
+    @staticmethod
+    def _prefix_matches(keys: List[tuple[str, int]], prefix: str, max_matches: int = 200) -> List[int]:
+        if not prefix:
+            return []
+        matches = []
+        position = bisect_left(keys, (prefix, -1))
+        while position < len(keys) and keys[position][0].startswith(prefix) and len(matches) < max_matches:
+            matches.append(keys[position][1])
+            position += 1
+        return matches
@@ -0,0 +1,104 @@
+import threading
+import time
+import uuid
+
+from flask import current_app
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from sqlalchemy import select
+
+from db import db
+from app.extensions.response_cache import table_versions
+from models.user import User
+
+
+ROLE_CLAIM = "role_id"
+PERMISSIONS_VERSION_CLAIM = "perms_version"
+ADMIN_ROLE_ID = 1
+
+# Writes to these tables can change which role a token's user holds.
+IDENTITY_TABLES = ("users", "roles")
+
+# table_versions restart at zero in every process; the boot id keeps a token
+# minted elsewhere (or before a restart) from matching by coincidence.
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def permissions_version():
+    return ".".join([_BOOT_ID, *(str(version) for version in table_versions.get(IDENTITY_TABLES))])
+
+
+def identity_claims(role_id):
+    """Additional claims for access tokens minted by /auth/login and /auth/refresh."""
+    return {ROLE_CLAIM: role_id, PERMISSIONS_VERSION_CLAIM: permissions_version()}
+
+
+class IdentityCache:
+    """user id -> role id, dropped whenever users/roles change in this process.
+
+    Like the response cache, other workers' writes are only noticed through
+    the TTL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def role_id(self, user_id, ttl_seconds=300):
+        version = permissions_version()
+        now = time.monotonic()
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[1] < ttl_seconds:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        role_id = db.session.execute(select(User.role_id).where(User.id == user_id)).scalar()
+        if role_id is not None:
+            with self._lock:
+                if self._version == version:
+                    self._entries[user_id] = (role_id, now)
+        return role_id
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+identity_cache = IdentityCache()
+
+
+def _ttl_seconds():
+    return current_app.config.get("IDENTITY_CACHE_TTL_SECONDS", 300)
+
+
+def lookup_role_id(user_id):
+    return identity_cache.role_id(user_id, _ttl_seconds())
+
+
+def current_role_id():
+    """Role of the request's user without touching the database when possible.
+
+    The token's role claim is trusted while it was minted by this process at
+    the current users/roles version and is younger than the cache TTL;
+    otherwise the role comes from the identity cache. None if the user no
+    longer exists.
+    """
+    claims = get_jwt()
+    if (
+        claims.get(ROLE_CLAIM) is not None
+        and claims.get(PERMISSIONS_VERSION_CLAIM) == permissions_version()
+        and time.time() - claims.get("iat", 0) < _ttl_seconds()
+    ):
+        return claims[ROLE_CLAIM]
+    return lookup_role_id(get_jwt_identity())
@@ -0,0 +1,80 @@
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from db import db
+from models.laundry_service import LaundryService
+from models.laundry_service_extra import LaundryServiceExtra
+from models.order_item import OrderItem
+
+
+TOTAL_COLUMNS = ("subtotal", "extras_total", "grand_total")
+
+_DIRTY_SERVICES_KEY = "order_totals_dirty_services"
+
+
+def order_totals_values():
+    """SET clause recomputing the stored totals from each service's own lines.
+
+    The totals are plain sums of the persisted prices (order_items.applied_price
+    and laundry_service_extras.subtotal), i.e. the "base" pricing context of the
+    v2 summary. updated_at is written back unchanged: totals are derived data
+    and must not trip the expected_updated_at edit checks.
+    """
+    subtotal = (
+        select(func.coalesce(func.sum(OrderItem.applied_price), 0))
+        .where(OrderItem.laundry_service_id == LaundryService.id)
+        .scalar_subquery()
+    )
+    extras_total = (
+        select(func.coalesce(func.sum(LaundryServiceExtra.subtotal), 0))
+        .where(LaundryServiceExtra.laundry_service_id == LaundryService.id)
+        .scalar_subquery()
+    )
+    return {
+        "subtotal": subtotal,
+        "extras_total": extras_total,
+        "grand_total": subtotal + extras_total,
+        "updated_at": LaundryService.updated_at,
+    }
+
+
+def refresh_order_totals(*laundry_service_ids):
+    """Recompute the totals of the given services inside the current transaction."""
+    laundry_service_ids = {service_id for service_id in laundry_service_ids if service_id is not None}
+    if not laundry_service_ids:
+        return
+
+    # Pending line changes must be visible to the SUMs.
+    db.session.flush()
+    db.session.execute(
+        update(LaundryService)
+        .where(LaundryService.id.in_(laundry_service_ids))
+        .values(**order_totals_values())
+        .execution_options(synchronize_session=False)
+    )
+    for service_id in laundry_service_ids:
+        service = db.session.identity_map.get(identity_key(LaundryService, service_id))
+        if service is not None:
+            db.session.expire(service, list(TOTAL_COLUMNS))
+
+
+def mark_order_totals_dirty(*laundry_service_ids):
+    """Queue services whose lines changed; refresh_pending_order_totals() recomputes them once."""
+    dirty = db.session.info.setdefault(_DIRTY_SERVICES_KEY, set())
+    dirty.update(service_id for service_id in laundry_service_ids if service_id is not None)
+
+
+def refresh_pending_order_totals():
+    """Recompute the totals queued in this transaction. Call it right before the commit."""
+    refresh_order_totals(*db.session.info.pop(_DIRTY_SERVICES_KEY, ()))
+
+
+def _discard_dirty_services(session, previous_transaction):
+    # A savepoint rollback keeps the outer transaction's changes.
+    if not previous_transaction.nested:
+        session.info.pop(_DIRTY_SERVICES_KEY, None)
+
+
+if not event.contains(Session, "after_soft_rollback", _discard_dirty_services):
+    event.listen(Session, "after_soft_rollback", _discard_dirty_services)
@@ -0,0 +1,58 @@
+from collections import defaultdict
+
+from sqlalchemy import select
+
+from db import db
+
+
+def _coerce_id(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReferenceResolver:
+    """Loads every entity referenced by a nested payload with one IN query per model.
+
+    Ids are collected up front with `collect`, then `get` answers from the
+    loaded rows. A lookup for an id that was never collected falls back to
+    loading it on its own, so a missed collect costs a query, not a wrong
+    "not found".
+    """
+
+    def __init__(self):
+        self._pending = defaultdict(set)
+        self._loaded = defaultdict(dict)
+        self.queries = 0
+
+    def collect(self, model, ids):
+        for value in ids:
+            entity_id = _coerce_id(value)
+            if entity_id is not None and entity_id not in self._loaded[model]:
+                self._pending[model].add(entity_id)
+        return self
+
+    def load(self):
+        for model, ids in list(self._pending.items()):
+            if not ids:
+                continue
+            rows = db.session.execute(select(model).where(model.id.in_(ids))).scalars()
+            self.queries += 1
+            loaded = self._loaded[model]
+            for entity_id in ids:
+                loaded[entity_id] = None
+            for row in rows:
+                loaded[row.id] = row
+        self._pending.clear()
+        return self
+
+    def get(self, model, value):
+        entity_id = _coerce_id(value)
+        if entity_id is None:
+            return None
+        if entity_id not in self._loaded[model]:
+            self.collect(model, [entity_id]).load()
+        return self._loaded[model][entity_id]
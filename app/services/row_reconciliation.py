@@ -0,0 +1,53 @@
+class RowReconciliation:
+    """Minimal INSERT/UPDATE/DELETE set turning the stored child rows into the desired ones."""
+
+    def __init__(self, inserts, updates, deletes):
+        self.inserts = inserts
+        self.updates = updates
+        self.deletes = deletes
+
+    @property
+    def has_changes(self):
+        return bool(self.inserts or self.updates or self.deletes)
+
+    def summary(self):
+        """Counts and ids of what changed, or None when nothing did."""
+        if not self.has_changes:
+            return None
+        return {
+            "inserted": len(self.inserts),
+            "updated_ids": [row["id"] for row in self.updates],
+            "deleted_ids": list(self.deletes),
+        }
+
+
+def reconcile_rows(existing_rows, desired_rows, key, fields):
+    """Match `desired_rows` to `existing_rows` by `key(row)`.
+
+    `existing_rows` are mappings with an "id"; `desired_rows` are column dicts
+    without one. Matched rows keep their id and only the `fields` whose value
+    differs are updated; unmatched existing rows (including duplicates of a
+    key) are deleted.
+    """
+    existing_by_key = {}
+    deletes = []
+    for row in existing_rows:
+        row_key = key(row)
+        if row_key in existing_by_key:
+            deletes.append(row["id"])
+        else:
+            existing_by_key[row_key] = row
+
+    inserts = []
+    updates = []
+    for desired in desired_rows:
+        current = existing_by_key.pop(key(desired), None)
+        if current is None:
+            inserts.append(desired)
+            continue
+        changed = {field: desired[field] for field in fields if current[field] != desired[field]}
+        if changed:
+            updates.append({"id": current["id"], **changed})
+
+    deletes.extend(row["id"] for row in existing_by_key.values())
+    return RowReconciliation(inserts, updates, sorted(deletes))
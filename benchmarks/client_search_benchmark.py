@@ -0,0 +1,119 @@
+"""Latency benchmark for the in-process client search index.
+
+Usage: python benchmarks/client_search_benchmark.py [--clients 100000] [--queries 2000]
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+
+module_path = Path(__file__).resolve().parents[1] / "app" / "services" / "client_search.py"
+module_spec = spec_from_file_location("client_search_benchmark_target", module_path)
+client_search_module = module_from_spec(module_spec)
+module_spec.loader.exec_module(client_search_module)
+ClientSearchIndex = client_search_module.ClientSearchIndex
+
+FIRST_NAMES = [
+    "José", "María", "Juan", "Ana", "Carlos", "Lucía", "Jorge", "Sofía", "Luis", "Marta",
+    "Andrés", "Camila", "Raúl", "Valeria", "Óscar", "Daniela", "Iván", "Gabriela", "René", "Inés",
+]
+LAST_NAMES = [
+    "Pérez", "Hernández", "López", "Martínez", "González", "Rodríguez", "Ramírez", "Flores",
+    "Núñez", "Castillo", "Guzmán", "Orellana", "Alvarado", "Quintanilla", "Menjívar", "Chávez",
+]
+
+
+class Row:
+    __slots__ = ("id", "name", "document_id", "email")
+
+    def __init__(self, client_id, name, document_id, email):
+        self.id = client_id
+        self.name = name
+        self.document_id = document_id
+        self.email = email
+
+
+def build_rows(count, rng):
+    rows = []
+    for client_id in range(1, count + 1):
+        first = rng.choice(FIRST_NAMES)
+        last = f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        document_id = f"{rng.randrange(10**8):08d}-{rng.randrange(10)}" if rng.random() < 0.6 else None
+        email = f"{first.lower()}{client_id}@example.com" if rng.random() < 0.4 else None
+        rows.append(Row(client_id, f"{first} {last}", document_id, email))
+    return rows
+
+
+def build_queries(rows, count, rng):
+    queries = []
+    for _ in range(count):
+        row = rng.choice(rows)
+        kind = rng.randrange(5)
+        if kind == 0:
+            queries.append(row.name[: rng.randint(1, 3)])
+        elif kind == 1:
+            queries.append(row.name.split()[0][:4] + " " + row.name.split()[1][:3])
+        elif kind == 2:
+            queries.append(row.name.lower().replace("é", "e").replace("á", "a"))
+        elif kind == 3 and row.document_id:
+            queries.append(row.document_id[:5])
+        else:
+            name = row.name
+            position = rng.randrange(1, len(name) - 1)
+            queries.append(name[:position] + name[position + 1:])
+    return queries
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows = build_rows(args.clients, rng)
+    queries = build_queries(rows, args.queries, rng)
+
+    tracemalloc.start()
+    index = ClientSearchIndex()
+    started = time.perf_counter()
+    index.rebuild(rows)
+    build_seconds = time.perf_counter() - started
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms = []
+    for query in queries:
+        started = time.perf_counter()
+        index.search(query, limit=20)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    for row in rows[:1000]:
+        index.upsert(row.id, row.name + " Jr", row.document_id, row.email)
+    upsert_ms = (time.perf_counter() - started) * 1000 / 1000
+
+    print(f"clients={args.clients} queries={args.queries}")
+    print(f"build_seconds={build_seconds:.2f} peak_memory_mb={peak_bytes / 1024 / 1024:.1f}")
+    print(
+        "search_ms "
+        f"p50={statistics.median(latencies_ms):.2f} "
+        f"p95={percentile(latencies_ms, 0.95):.2f} "
+        f"p99={percentile(latencies_ms, 0.99):.2f} "
+        f"max={max(latencies_ms):.2f}"
+    )
+    print(f"upsert_ms avg={upsert_ms:.3f}")
+
+
+if __name__ == "__main__":
+    main()
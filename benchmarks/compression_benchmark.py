@@ -0,0 +1,137 @@
+"""Bytes saved vs CPU cost of the gzip after-request hook.
+
+Builds synthetic payloads shaped like the large JSON responses (order
+summaries, the unbounded queue, /clients?detail=true, a /transactions page and
+a streamed NDJSON export) and times app.extensions.compression at several
+levels.
+
+Usage: python benchmarks/compression_benchmark.py [--rows 2000] [--levels 1,6,9] [--repeat 20]
+"""
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.extensions.compression import _gzip_stream
+
+
+STATUSES = ("PENDING", "STARTED", "IN_PROGRESS", "READY_FOR_DELIVERY", "DELIVERED")
+STREETS = ("Colonia Escalón", "Colonia San Benito", "Residencial Altavista", "Santa Tecla centro")
+
+
+def _client(rng, client_id):
+    return {
+        "id": client_id,
+        "name": f"Cliente {client_id} {rng.choice(('Pérez', 'López', 'Martínez', 'Hernández'))}",
+        "document_id": f"0{rng.randint(1000000, 9999999)}-{rng.randint(0, 9)}",
+        "email": f"cliente{client_id}@example.com",
+        "is_deleted": False,
+        "created_at": "2024-05-01T12:30:00",
+        "updated_at": "2024-05-01T12:30:00",
+        "addresses": [
+            {"id": client_id, "client_id": client_id, "address_text": f"{rng.choice(STREETS)}, casa {client_id % 90}", "is_primary": True}
+        ],
+        "phones": [{"id": client_id, "client_id": client_id, "phone_number": f"7{rng.randint(1000000, 9999999)}", "is_primary": True}],
+    }
+
+
+def _order_summary(rng, service_id):
+    return {
+        "id": service_id,
+        "client": {"id": service_id % 500, "name": f"Cliente {service_id % 500}"},
+        "status": rng.choice(STATUSES),
+        "service_label": rng.choice(("NORMAL", "EXPRESS")),
+        "scheduled_pickup_at": "2024-05-02T09:00:00",
+        "items": [
+            {
+                "garment_type_id": rng.randint(1, 20),
+                "garment_type_name": rng.choice(("Camisa", "Pantalón", "Vestido", "Edredón")),
+                "quantity": rng.randint(1, 6),
+                "unit_price": f"{rng.randint(50, 900) / 100:.2f}",
+                "notes": None,
+            }
+            for _ in range(rng.randint(1, 6))
+        ],
+        "extras": [{"service_extra_type_id": 1, "name": "Planchado", "quantity": 1, "unit_price": "1.50"}],
+        "grand_total": f"{rng.randint(300, 9000) / 100:.2f}",
+    }
+
+
+def _transaction(rng, transaction_id):
+    return {
+        "id": transaction_id,
+        "user_id": 1,
+        "user_name": "Caja 1",
+        "transaction_type": rng.choice(("IN", "OUT")),
+        "payment_type_id": 1,
+        "payment_type_name": "Efectivo",
+        "category_id": 1,
+        "category_name": "Ventas",
+        "detail": f"Servicio {transaction_id}",
+        "amount": f"{rng.randint(100, 20000) / 100:.2f}",
+        "client_id": transaction_id % 500,
+        "client_name": f"Cliente {transaction_id % 500}",
+        "created_at": "2024-05-01T12:30:00",
+        "updated_at": "2024-05-01T12:30:00",
+    }
+
+
+def payloads(rows, rng):
+    dumps = lambda value: json.dumps(value, separators=(",", ":")).encode()  # noqa: E731
+    return {
+        "order summaries": dumps([_order_summary(rng, index) for index in range(rows)]),
+        "queue (unbounded)": dumps([_order_summary(rng, index) for index in range(rows * 2)]),
+        "clients?detail=true": dumps({"items": [_client(rng, index) for index in range(rows)], "total": rows}),
+        "transactions page": dumps({"items": [_transaction(rng, index) for index in range(100)], "total": rows}),
+    }
+
+
+def ndjson_chunks(rows, rng, batch_size=500):
+    lines = [json.dumps(_client(rng, index), separators=(",", ":")) + "\n" for index in range(rows)]
+    return ["".join(lines[start:start + batch_size]) for start in range(0, len(lines), batch_size)]
+
+
+def _time(function, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--levels", default="1,6,9")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(7)
+    levels = [int(level) for level in args.levels.split(",")]
+
+    print(f"{'payload':<24}{'level':>6}{'raw KB':>10}{'gzip KB':>10}{'saved':>8}{'ms':>9}{'MB/s':>9}")
+    for name, body in payloads(args.rows, rng).items():
+        for level in levels:
+            seconds, compressed = _time(lambda: gzip.compress(body, compresslevel=level), args.repeat)
+            saved = 1 - len(compressed) / len(body)
+            print(
+                f"{name:<24}{level:>6}{len(body) / 1024:>10.1f}{len(compressed) / 1024:>10.1f}"
+                f"{saved:>8.1%}{seconds * 1000:>9.2f}{len(body) / seconds / 1e6:>9.1f}"
+            )
+
+    chunks = ndjson_chunks(args.rows * 5, rng)
+    raw_size = sum(len(chunk.encode()) for chunk in chunks)
+    for level in levels:
+        seconds, compressed = _time(lambda: list(_gzip_stream(iter(chunks), level)), args.repeat)
+        size = sum(len(part) for part in compressed)
+        print(
+            f"{'ndjson stream':<24}{level:>6}{raw_size / 1024:>10.1f}{size / 1024:>10.1f}"
+            f"{1 - size / raw_size:>8.1%}{seconds * 1000:>9.2f}{raw_size / seconds / 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Round trips saved by the adaptive pre-ping.
+
+Runs the same burst of short transactions through a TimedQueuePool for each
+DB_POOL_PRE_PING mode and counts the liveness pings issued. Against SQLite
+(the default) a ping costs nothing, so --ping-latency-ms adds a simulated
+network round trip to every ping; point --database-url at a scratch MySQL
+schema to measure real ones.
+
+Usage: python benchmarks/db_pool_benchmark.py [--transactions 5000] [--threads 8]
+    [--ping-latency-ms 0.5] [--database-url mysql+pymysql://...]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine, text
+
+from app.extensions.db_pool import TimedQueuePool, instrument_pool, pool_stats
+
+
+def run(database_url, pre_ping, args):
+    engine = create_engine(
+        database_url,
+        poolclass=TimedQueuePool,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        pool_pre_ping=pre_ping == "true",
+    )
+    instrument_pool(engine, pre_ping, args.idle_seconds)
+
+    pings = [0]
+    lock = threading.Lock()
+    do_ping = engine.dialect.do_ping
+
+    def counted_ping(dbapi_connection):
+        with lock:
+            pings[0] += 1
+        if args.ping_latency_ms:
+            time.sleep(args.ping_latency_ms / 1000)
+        return do_ping(dbapi_connection)
+
+    engine.dialect.do_ping = counted_ping
+
+    def transaction(_):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    pool_stats.reset()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        list(pool.map(transaction, range(args.transactions)))
+    seconds = time.perf_counter() - started
+    stats = pool_stats.stats()
+    engine.dispose()
+    return seconds, pings[0], stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--max-overflow", type=int, default=20)
+    parser.add_argument("--idle-seconds", type=float, default=30.0)
+    parser.add_argument("--ping-latency-ms", type=float, default=0.5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    path = None
+    database_url = args.database_url
+    if database_url is None:
+        handle, path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        database_url = f"sqlite:///{path}"
+
+    try:
+        print(f"{'pre_ping':<10}{'tx/s':>10}{'pings':>8}{'pings/tx':>10}{'avg wait ms':>13}{'max wait ms':>13}")
+        for pre_ping in ("true", "adaptive", "false"):
+            seconds, pings, stats = run(database_url, pre_ping, args)
+            print(
+                f"{pre_ping:<10}{args.transactions / seconds:>10.1f}{pings:>8}{pings / args.transactions:>10.3f}"
+                f"{stats['avg_wait_ms']:>13.3f}{stats['max_wait_ms']:>13.3f}"
+            )
+    finally:
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
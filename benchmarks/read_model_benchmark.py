@@ -0,0 +1,183 @@
+"""ORM vs Core-row read path for the paginated read-only list endpoints.
+
+Seeds synthetic data into --database-url (in-memory SQLite by default; point it
+at a scratch MySQL schema for realistic numbers) and reports rows/sec and peak
+Python memory per page for each path.
+
+Usage: python benchmarks/read_model_benchmark.py [--services 20000] [--per-page 100] [--pages 20]
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.api.read_models import paginate_rows
+from app.extensions.db import db
+from app.modules.billing.transactions.read_model import map_transaction_row, transaction_rows_select
+from app.modules.laundry.deliveries.read_model import delivery_rows_select, map_delivery_row
+from app.modules.laundry.services.read_model import compact_rows_select, map_compact_row
+import models  # noqa: F401  (registers every table for create_all)
+from models.client import Client, ClientAddress, ClientPhone
+from models.laundry_delivery import LaundryDelivery
+from models.laundry_service import LaundryService
+from models.payment_type import PaymentType
+from models.role import Role
+from models.transaction import Transaction
+from models.transaction_category import TransactionCategory
+from models.user import User
+from schemas.laundry_delivery_schema import LaundryDeliverySchema
+from schemas.laundry_service_schema import LaundryServiceCompactSchema
+from schemas.transaction_schema import TransactionSchema
+
+
+def seed(count, rng):
+    started_at = datetime(2024, 1, 1, 8, 0, 0)
+    db.session.execute(Role.__table__.insert(), [{"id": 1, "name": "admin", "description": "bench"}])
+    db.session.execute(User.__table__.insert(), [
+        {"id": user_id, "username": f"bench{user_id}", "password": "x", "role_id": 1, "name": f"User {user_id}"}
+        for user_id in range(1, 6)
+    ])
+    db.session.execute(PaymentType.__table__.insert(), [{"id": 1, "code": "CASH", "name": "Efectivo", "description": "bench"}])
+    db.session.execute(TransactionCategory.__table__.insert(), [{"id": 1, "category_name": "Ventas"}])
+
+    client_count = max(1, count // 4)
+    db.session.execute(Client.__table__.insert(), [
+        {"id": client_id, "name": f"Cliente {client_id}", "is_deleted": False}
+        for client_id in range(1, client_count + 1)
+    ])
+    db.session.execute(ClientAddress.__table__.insert(), [
+        {"id": client_id, "client_id": client_id, "address_text": f"Colonia {client_id}, casa {client_id % 90}"}
+        for client_id in range(1, client_count + 1)
+    ])
+    db.session.execute(ClientPhone.__table__.insert(), [
+        {"client_id": client_id, "phone_number": f"7{client_id:07d}"[:9]}
+        for client_id in range(1, client_count + 1)
+    ])
+    db.session.execute(Transaction.__table__.insert(), [
+        {
+            "id": item_id, "user_id": rng.randint(1, 5), "transaction_type": "IN", "payment_type_id": 1,
+            "category_id": 1, "amount": Decimal("12.50"), "client_id": rng.randint(1, client_count),
+            "detail": "bench", "created_at": started_at + timedelta(minutes=item_id),
+        }
+        for item_id in range(1, count + 1)
+    ])
+    db.session.execute(LaundryService.__table__.insert(), [
+        {
+            "id": item_id, "client_id": (item_id % client_count) + 1, "client_address_id": (item_id % client_count) + 1,
+            "scheduled_pickup_at": started_at + timedelta(hours=item_id), "status": "PENDING",
+            "service_label": "NORMAL", "transaction_id": item_id if item_id % 2 else None,
+            "created_by_user_id": rng.randint(1, 5), "created_at": started_at, "updated_at": started_at,
+        }
+        for item_id in range(1, count + 1)
+    ])
+    db.session.execute(LaundryDelivery.__table__.insert(), [
+        {
+            "id": item_id, "laundry_service_id": item_id, "created_by_user_id": 1,
+            "scheduled_delivery_at": started_at + timedelta(days=1), "status": "PENDING",
+        }
+        for item_id in range(1, count + 1)
+    ])
+    db.session.commit()
+
+
+def orm_page(query, schema, page, per_page):
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    return schema.dump(pagination.items)
+
+
+CASES = {
+    "laundry_services/compact": (
+        lambda page, per_page: orm_page(
+            LaundryService.query.options(
+                selectinload(LaundryService.client),
+                selectinload(LaundryService.client_address),
+                selectinload(LaundryService.created_by_user),
+            ).order_by(LaundryService.id.desc()),
+            LaundryServiceCompactSchema(many=True), page, per_page,
+        ),
+        lambda page, per_page: paginate_rows(
+            compact_rows_select().order_by(LaundryService.id.desc()), page, per_page, map_compact_row,
+        )["items"],
+    ),
+    "transactions": (
+        lambda page, per_page: orm_page(
+            Transaction.query.options(
+                joinedload(Transaction.client),
+                joinedload(Transaction.category),
+                joinedload(Transaction.payment_type),
+                joinedload(Transaction.user),
+            ).order_by(Transaction.created_at.desc()),
+            TransactionSchema(many=True), page, per_page,
+        ),
+        lambda page, per_page: paginate_rows(
+            transaction_rows_select().order_by(Transaction.created_at.desc()), page, per_page, map_transaction_row,
+        )["items"],
+    ),
+    "laundry_deliveries": (
+        lambda page, per_page: orm_page(
+            LaundryDelivery.query.order_by(LaundryDelivery.id.desc()),
+            LaundryDeliverySchema(many=True), page, per_page,
+        ),
+        lambda page, per_page: paginate_rows(
+            delivery_rows_select().order_by(LaundryDelivery.id.desc()), page, per_page, map_delivery_row,
+        )["items"],
+    ),
+}
+
+
+def measure(fetch_page, pages, per_page):
+    rows = 0
+    started = time.perf_counter()
+    for page in range(1, pages + 1):
+        rows += len(fetch_page(page, per_page))
+        db.session.remove()
+    elapsed = time.perf_counter() - started
+
+    # Memory is traced on a separate pass; tracemalloc skews the timings.
+    tracemalloc.start()
+    fetch_page(1, per_page)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    db.session.remove()
+    return rows / elapsed, peak_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--services", type=int, default=20_000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=args.database_url, SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        seed(args.services, random.Random(args.seed))
+        print(f"services={args.services} per_page={args.per_page} pages={args.pages} db={db.engine.dialect.name}")
+        for name, (orm_fetch, core_fetch) in CASES.items():
+            orm_rate, orm_peak = measure(orm_fetch, args.pages, args.per_page)
+            core_rate, core_peak = measure(core_fetch, args.pages, args.per_page)
+            print(
+                f"{name:26} orm {orm_rate:8.0f} rows/s {orm_peak / 1024:7.0f} KiB/page | "
+                f"core {core_rate:8.0f} rows/s {core_peak / 1024:7.0f} KiB/page | "
+                f"x{core_rate / orm_rate:.1f}"
+            )
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
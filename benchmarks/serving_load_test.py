@@ -0,0 +1,214 @@
+"""Concurrent HTTP + Socket.IO load against a running server.
+
+Start the server with the production entry point (`gunicorn -c
+gunicorn.conf.py wsgi:application`, once with SOCKETIO_ASYNC_MODE=eventlet and
+once with threading to compare), then run this script against it. For the
+whole run it keeps going, all at once:
+
+- --http-clients keep-alive clients cycling through --paths;
+- --slow-clients clients hitting --slow-path (an endpoint backed by a slow
+  query), to show whether one slow query holds up everything else;
+- --socket-clients Socket.IO clients sending `laundry:queue:ping` and
+  timing each acknowledgement.
+
+Socket.IO is spoken over Engine.IO long-polling with the standard library,
+so nothing beyond Python is needed on the load generator. It reports
+requests/s and latency percentiles per kind of traffic.
+
+Compare the modes against MySQL (`docker compose up` with the same
+DB_* settings, SOCKETIO_ASYNC_MODE=eventlet and then threading) with
+--slow-path set, so the slow clients keep queries in flight. A SQLite-backed
+server says little about eventlet: its queries never yield, so every request
+runs to completion and Socket.IO polls queue behind the HTTP clients.
+
+Usage: python benchmarks/serving_load_test.py --url http://localhost:5000 \
+    --username admin --password secret [--seconds 20] [--slow-path /laundry_services/compact]
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+
+RECORD_SEPARATOR = "\x1e"
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+
+    def ok(self, seconds):
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def error(self):
+        with self._lock:
+            self.errors += 1
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return float("nan")
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+        return (
+            f"{len(latencies):>8}{len(latencies) / elapsed:>10.1f}{self.errors:>8}"
+            f"{percentile(0.5):>9.1f}{percentile(0.95):>9.1f}{percentile(0.99):>9.1f}"
+        )
+
+
+def connect(url):
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    return connection_class(parts.hostname, parts.port, timeout=30)
+
+
+def request(connection, method, path, body=None, headers=None):
+    connection.request(method, path, body=body, headers=headers or {})
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def login(url, username, password):
+    connection = connect(url)
+    status, body = request(
+        connection, "POST", "/auth/login",
+        json.dumps({"username": username, "password": password}),
+        {"Content-Type": "application/json"},
+    )
+    if status != 200:
+        raise SystemExit(f"login failed: {status} {body[:200]!r}")
+    return json.loads(body)["access_token"]
+
+
+def http_client(url, paths, headers, deadline, recorder):
+    connection = connect(url)
+    index = 0
+    while time.monotonic() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.monotonic()
+        try:
+            status, _ = request(connection, "GET", path, headers=headers)
+        except (OSError, http.client.HTTPException):
+            recorder.error()
+            connection.close()
+            connection = connect(url)
+            continue
+        if status in (200, 304):
+            recorder.ok(time.monotonic() - started)
+        else:
+            recorder.error()
+
+
+class PollingSocket:
+    """Just enough of Engine.IO v4 / Socket.IO v5 long-polling for acked emits."""
+
+    def __init__(self, url, token):
+        self.connection = connect(url)
+        self.query = {"EIO": "4", "transport": "polling", "token": token}
+        status, body = request(self.connection, "GET", self._path())
+        if status != 200 or not body.startswith(b"0"):
+            raise RuntimeError(f"handshake failed: {status} {body[:200]!r}")
+        self.query["sid"] = json.loads(body[1:])["sid"]
+        self._post("40" + json.dumps({"token": token}))
+        self._receive(lambda packet: packet.startswith("40"))
+        self.next_ack = 0
+
+    def _path(self):
+        return "/socket.io/?" + urlencode(self.query)
+
+    def _post(self, payload):
+        status, _ = request(self.connection, "POST", self._path(), payload.encode(), {"Content-Type": "text/plain"})
+        if status != 200:
+            raise RuntimeError(f"post failed: {status}")
+
+    def _receive(self, wanted):
+        while True:
+            status, body = request(self.connection, "GET", self._path())
+            if status != 200:
+                raise RuntimeError(f"poll failed: {status}")
+            for packet in body.decode().split(RECORD_SEPARATOR):
+                if packet == "2":
+                    self._post("3")
+                elif wanted(packet):
+                    return packet
+
+    def call(self, event, data):
+        ack_id = str(self.next_ack)
+        self.next_ack += 1
+        self._post("42" + ack_id + json.dumps([event, data]))
+        return self._receive(lambda packet: packet.startswith("43" + ack_id + "["))
+
+    def close(self):
+        try:
+            self._post("1")
+        except (OSError, RuntimeError, http.client.HTTPException):
+            pass
+        self.connection.close()
+
+
+def socket_client(url, token, deadline, recorder):
+    try:
+        socket = PollingSocket(url, token)
+    except (OSError, RuntimeError, http.client.HTTPException):
+        recorder.error()
+        return
+    try:
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+            try:
+                socket.call("laundry:queue:ping", {"sent_at": started})
+            except (OSError, RuntimeError, http.client.HTTPException):
+                recorder.error()
+                return
+            recorder.ok(time.monotonic() - started)
+    finally:
+        socket.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--http-clients", type=int, default=20)
+    parser.add_argument("--socket-clients", type=int, default=20)
+    parser.add_argument("--paths", default="/health,/menus")
+    parser.add_argument("--slow-path", default=None)
+    parser.add_argument("--slow-clients", type=int, default=2)
+    args = parser.parse_args()
+
+    token = login(args.url, args.username, args.password)
+    headers = {"Authorization": f"Bearer {token}"}
+    paths = [path.strip() for path in args.paths.split(",") if path.strip()]
+    recorders = {"http": Recorder(), "slow http": Recorder(), "socket ping": Recorder()}
+
+    slow_clients = args.slow_clients if args.slow_path else 0
+    deadline = time.monotonic() + args.seconds
+    started = time.monotonic()
+    with ThreadPoolExecutor(args.http_clients + slow_clients + args.socket_clients) as pool:
+        for _ in range(args.http_clients):
+            pool.submit(http_client, args.url, paths, headers, deadline, recorders["http"])
+        for _ in range(slow_clients):
+            pool.submit(http_client, args.url, [args.slow_path], headers, deadline, recorders["slow http"])
+        for _ in range(args.socket_clients):
+            pool.submit(socket_client, args.url, token, deadline, recorders["socket ping"])
+    elapsed = time.monotonic() - started
+
+    print(f"{'traffic':<14}{'done':>8}{'per s':>10}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for label, recorder in recorders.items():
+        if recorder.latencies or recorder.errors:
+            print(f"{label:<14}{recorder.summary(elapsed)}")
+
+
+if __name__ == "__main__":
+    main()
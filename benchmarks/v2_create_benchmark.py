@@ -0,0 +1,146 @@
+"""Throughput of POST /v2/laundry_services.
+
+Seeds a catalog and some clients into --database-url (in-memory SQLite by
+default; point it at a scratch MySQL schema for realistic numbers, since the
+commit count is what a real disk pays for), then drives the create endpoint
+through the test client. Reports creates/sec plus the statements and commits
+issued per create, for the full and the `Prefer: return=minimal` response and
+with or without nested lines.
+
+Usage: python benchmarks/v2_create_benchmark.py [--creates 500] [--database-url sqlite://]
+"""
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+for name, value in (("DB_USER", "bench"), ("DB_PASSWORD", "bench"), ("DB_HOST", "localhost"), ("DB_NAME", "bench")):
+    os.environ.setdefault(name, value)
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.modules.laundry.v2.services.routes import laundry_service_v2_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.catalog_service_legacy import CatalogServiceLegacy
+from models.client import Client, ClientAddress
+from models.extra import Extra
+from models.global_setting import GlobalSetting
+from models.role import Role
+from models.service_category_legacy import ServiceCategoryLegacy
+from models.user import User
+
+
+SETTINGS = {
+    "express_service_surcharge": "3.00",
+    "delivery_price_per_km": "0.50",
+    "laundry_weight_tier_1_max_lb": "10",
+    "laundry_weight_tier_1_price": "5.00",
+    "laundry_weight_tier_2_max_lb": "20",
+    "laundry_weight_tier_2_price": "9.00",
+    "laundry_weight_extra_lb_price": "0.50",
+    "laundry_weight_min_price_no_services": "3.00",
+}
+
+
+def make_app(database_url):
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=database_url, JWT_SECRET_KEY="bench", SECRET_KEY="bench")
+    db.init_app(app)
+    JWTManager(app)
+    app.register_blueprint(laundry_service_v2_bp)
+    return app
+
+
+def seed(clients=50):
+    db.session.add(Role(id=1, name="admin", description="bench"))
+    db.session.add(User(id=1, username="bench", password="x", role_id=1, name="Bench"))
+    surcharge = ServiceCategoryLegacy(name="Surcharge")
+    washing = ServiceCategoryLegacy(name="Lavado")
+    db.session.add_all([surcharge, washing])
+    db.session.flush()
+    catalog = {}
+    for key, category, mode in (
+        ("delivery", washing, CatalogServiceLegacy.PRICING_MODE_DELIVERY),
+        ("surcharge", surcharge, CatalogServiceLegacy.PRICING_MODE_FIXED),
+        ("fixed", washing, CatalogServiceLegacy.PRICING_MODE_FIXED),
+        ("weight", washing, CatalogServiceLegacy.PRICING_MODE_WEIGHT),
+    ):
+        service = CatalogServiceLegacy(name=key, category_id=category.id, pricing_mode=mode, is_active=True)
+        db.session.add(service)
+        db.session.flush()
+        catalog[key] = service.id
+    extra = Extra(name="Planchado", default_price=Decimal("1.50"), is_active=True)
+    db.session.add(extra)
+    for key, value in SETTINGS.items():
+        db.session.add(GlobalSetting(key=key, name=key, value=value, is_active=True, category="bench"))
+    for client_id in range(1, clients + 1):
+        db.session.add(Client(id=client_id, name=f"Cliente {client_id}"))
+        db.session.add(ClientAddress(id=client_id, client_id=client_id, address_text=f"Colonia {client_id}"))
+    db.session.commit()
+    catalog["extra"] = extra.id
+    return catalog
+
+
+def payload(index, catalog, clients, nested):
+    body = {
+        "client_id": index % clients + 1,
+        "client_address_id": index % clients + 1,
+        "scheduled_pickup_at": "2024-05-02T10:00:00",
+        "service_label": "EXPRESS" if index % 2 else "NORMAL",
+        "status": "PENDING",
+    }
+    if nested:
+        body["order_items"] = [{"service_id": catalog["fixed"], "quantity": 2, "unit_catalog_price": "2.50"}]
+        body["weight_service"] = {"weight_lb": "12"}
+        body["extras"] = [{"extra_id": catalog["extra"], "quantity": 1, "unit_price": "1.50"}]
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creates", type=int, default=500)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--database-url", default="sqlite://")
+    args = parser.parse_args()
+
+    app = make_app(args.database_url)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        catalog = seed(args.clients)
+        token = create_access_token(identity="1")
+        counts = {"statements": 0, "commits": 0}
+        event.listen(db.engine, "before_cursor_execute", lambda *_: counts.__setitem__("statements", counts["statements"] + 1))
+        event.listen(db.engine, "commit", lambda *_: counts.__setitem__("commits", counts["commits"] + 1))
+
+    client = app.test_client()
+    print(f"{'variant':<28}{'creates/s':>11}{'ms/create':>11}{'stmts':>8}{'commits':>9}")
+    for label, prefer, nested in (
+        ("representation", None, False),
+        ("return=minimal", "return=minimal", False),
+        ("representation + lines", None, True),
+        ("return=minimal + lines", "return=minimal", True),
+    ):
+        headers = {"Authorization": f"Bearer {token}"}
+        if prefer:
+            headers["Prefer"] = prefer
+        counts.update(statements=0, commits=0)
+        started = time.perf_counter()
+        for index in range(args.creates):
+            response = client.post("/v2/laundry_services", headers=headers, json=payload(index, catalog, args.clients, nested))
+            assert response.status_code == 201, response.get_json()
+        seconds = time.perf_counter() - started
+        print(
+            f"{label:<28}{args.creates / seconds:>11.1f}{seconds / args.creates * 1000:>11.2f}"
+            f"{counts['statements'] / args.creates:>8.1f}{counts['commits'] / args.creates:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
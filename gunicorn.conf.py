@@ -0,0 +1,25 @@
+# Gunicorn settings for wsgi:application, driven by the same environment as the app.
+import os
+
+async_mode = os.getenv("SOCKETIO_ASYNC_MODE", "threading").strip().lower()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+# Socket.IO sessions live in the worker that accepted them: more than one
+# worker needs sticky sessions at the proxy and a Socket.IO message queue.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+
+if async_mode == "eventlet":
+    worker_class = "eventlet"
+    # Open connections (HTTP and WebSocket) per worker; queries beyond the DB
+    # pool wait for a connection (DB_POOL_TIMEOUT) without blocking the others.
+    worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+else:
+    worker_class = "gthread"
+    threads = int(os.getenv("GUNICORN_THREADS", "16"))
+    # One connection per request thread plus the background writers.
+    os.environ.setdefault("DB_POOL_SIZE", str(threads))
+    os.environ.setdefault("DB_MAX_OVERFLOW", "4")
@@ -12,7 +12,7 @@ class Client(db.Model):
     created_by = db.Column(db.Integer)
     updated_by = db.Column(db.Integer)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
+    updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now(), index=True)
 
     addresses = db.relationship(
         "ClientAddress",
@@ -63,6 +63,8 @@ class ClientPhone(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     client_id = db.Column(db.Integer, db.ForeignKey('clients.id', onupdate='CASCADE'), nullable=False)
     phone_number = db.Column(db.String(20), nullable=False)
+    phone_digits = db.Column(db.String(20), nullable=True, index=True)
+    phone_suffix = db.Column(db.String(8), nullable=True, index=True)
     description = db.Column(db.String(100))
     is_primary = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
@@ -1,9 +1,15 @@
 from db import db
-from sqlalchemy import Column, Integer, Enum, Text, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, Enum, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 class LaundryActivityLog(db.Model):
     __tablename__ = "laundry_activity_logs"
+    # Timeline reads: per service, per user and by date, newest first.
+    __table_args__ = (
+        Index("ix_laundry_activity_logs_service_created", "laundry_service_id", "created_at"),
+        Index("ix_laundry_activity_logs_user_created", "user_id", "created_at"),
+        Index("ix_laundry_activity_logs_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     laundry_service_id = Column(Integer, ForeignKey("laundry_services.id"), nullable=False)
@@ -35,6 +35,10 @@ class LaundryService(db.Model):
     )
     transaction_id = Column(Integer, ForeignKey("transactions.id"), nullable=True)
     notes = Column(Text, nullable=True)
+    # Sums of the stored line prices, kept current by app.services.order_totals.
+    subtotal = Column(Numeric(10, 2), nullable=False, default=0, server_default="0")
+    extras_total = Column(Numeric(10, 2), nullable=False, default=0, server_default="0")
+    grand_total = Column(Numeric(10, 2), nullable=False, default=0, server_default="0")
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -8,7 +8,8 @@ class RefreshToken(db.Model):
     id = Column(Integer, primary_key=True)
     jti = Column(String(36), unique=True, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    expires_at = Column(DateTime, nullable=False)
+    # Indexed for the expiry purge; jti lookups use the unique index.
+    expires_at = Column(DateTime, nullable=False, index=True)
     revoked = Column(Boolean, default=False)
     created_at = Column(DateTime, default=func.now())
 
@@ -84,6 +84,9 @@ class LaundryServiceCompactSchema(LaundryServiceSchema):
     client_address_id = fields.Int()
     client_address = fields.Nested(ClientAddressNoUpdateSchema, only=("id", "client_id", "address_text"))
     has_transaction = fields.Method("get_has_transaction")
+    subtotal = fields.Decimal(as_string=True, places=2, dump_only=True)
+    extras_total = fields.Decimal(as_string=True, places=2, dump_only=True)
+    grand_total = fields.Decimal(as_string=True, places=2, dump_only=True)
 
     def get_has_transaction(self, obj):
         return obj.transaction_id is not None
@@ -0,0 +1,109 @@
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from flask import Flask
+
+from app.extensions import activity_log as activity_log_module
+from app.extensions.activity_log import activity_log, init_activity_log, record_activity
+from app.extensions.db import db
+import models  # noqa: F401  (registers every table for create_all)
+from models.laundry_activity_log import LaundryActivityLog
+from models.laundry_service import LaundryService
+
+
+def _log_count():
+    return db.session.query(LaundryActivityLog).count()
+
+
+class ActivityLogWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.execute(LaundryService.__table__.insert(), [{
+            "id": 1,
+            "client_id": 1,
+            "client_address_id": 1,
+            "scheduled_pickup_at": datetime(2024, 5, 1, 9, 0, 0),
+            "created_by_user_id": 1,
+        }])
+        db.session.commit()
+        activity_log.configure(mode="sync")
+        activity_log.reset_stats()
+
+    def tearDown(self):
+        activity_log.configure(mode="sync")
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _record(self, description="x"):
+        record_activity(laundry_service_id=1, user_id=None, action="ACTUALIZACION", description=description)
+
+    def test_sync_mode_writes_on_commit_and_discards_on_rollback(self):
+        self._record("kept")
+        self.assertEqual(_log_count(), 0)
+        db.session.commit()
+        self.assertEqual(_log_count(), 1)
+
+        self._record("rolled back")
+        db.session.rollback()
+        db.session.commit()
+        self.assertEqual([log.description for log in LaundryActivityLog.query.all()], ["kept"])
+
+    def test_async_mode_batches_rows_and_drains_on_stop(self):
+        activity_log.configure(mode="async", batch_size=50, flush_interval=0.05)
+        activity_log.start(db.engine)
+        for index in range(120):
+            self._record(str(index))
+            db.session.commit()
+        activity_log.stop()
+
+        stats = activity_log.stats()
+        self.assertEqual(_log_count(), 120)
+        self.assertEqual(stats["written"], 120)
+        self.assertLess(stats["batches"], 120)
+        self.assertEqual(stats["dropped_queue_full"], 0)
+
+    def test_full_queue_drops_and_counts(self):
+        release = threading.Event()
+        write = activity_log._write
+
+        def slow_write(bind, rows):
+            release.wait(5)
+            write(bind, rows)
+
+        activity_log.configure(mode="async", max_queue=2, batch_size=1, flush_interval=0.01)
+        activity_log._write = slow_write
+        try:
+            activity_log.start(db.engine)
+            for index in range(6):
+                self._record(str(index))
+                db.session.commit()
+            release.set()
+            activity_log.stop()
+        finally:
+            del activity_log._write
+
+        stats = activity_log.stats()
+        self.assertGreater(stats["dropped_queue_full"], 0)
+        self.assertEqual(stats["written"] + stats["dropped_queue_full"], 6)
+        self.assertEqual(_log_count(), stats["written"])
+
+    def test_stop_is_registered_with_atexit_once_per_process(self):
+        self.app.config["ACTIVITY_LOG_MODE"] = "sync"
+        with mock.patch.object(activity_log_module, "_atexit_registered", False), \
+                mock.patch.object(activity_log_module.atexit, "register") as register:
+            init_activity_log(self.app)
+            init_activity_log(self.app)
+
+        register.assert_called_once_with(activity_log.stop)
+
+
+if __name__ == "__main__":
+    unittest.main()
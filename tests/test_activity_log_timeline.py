@@ -0,0 +1,150 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import create_engine, text
+
+from app.extensions.db import db
+from app.modules.laundry.logs.read_model import activity_log_rows_select
+from app.modules.laundry.logs.routes import laundry_activity_log_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.laundry_activity_log import LaundryActivityLog
+from models.laundry_service import LaundryService
+
+
+BASE = datetime(2024, 5, 1, 9, 0, 0)
+
+
+def _timeline_sql(criterion, dialect):
+    stmt = (
+        activity_log_rows_select()
+        .where(criterion)
+        .order_by(LaundryActivityLog.created_at.desc(), LaundryActivityLog.id.desc())
+        .limit(21)
+    )
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+class ActivityLogTimelineTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test")
+        db.init_app(self.app)
+        JWTManager(self.app)
+        self.app.register_blueprint(laundry_activity_log_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.execute(LaundryService.__table__.insert(), [
+            {
+                "id": service_id,
+                "client_id": 1,
+                "client_address_id": 1,
+                "scheduled_pickup_at": BASE,
+                "created_by_user_id": 1,
+            }
+            for service_id in (1, 2)
+        ])
+        # Pairs of rows share a created_at so paging has to break ties on id.
+        db.session.execute(LaundryActivityLog.__table__.insert(), [
+            {
+                "laundry_service_id": 1 if index % 3 else 2,
+                "user_id": 1 + index % 2,
+                "action": "ACTUALIZACION",
+                "description": f"row {index}",
+                "created_at": BASE + timedelta(minutes=index // 2),
+            }
+            for index in range(25)
+        ])
+        db.session.commit()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _walk(self, url, limit):
+        ids, cursor, pages = [], None, 0
+        while True:
+            query = f"{url}{'&' if '?' in url else '?'}limit={limit}"
+            if cursor:
+                query += f"&cursor={cursor}"
+            response = self.client.get(query, headers=self.headers)
+            self.assertEqual(response.status_code, 200, response.get_json())
+            body = response.get_json()
+            ids.extend(item["id"] for item in body["items"])
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return ids, pages
+
+    def _expected(self, criterion=True):
+        rows = db.session.execute(
+            db.select(LaundryActivityLog.id)
+            .where(criterion)
+            .order_by(LaundryActivityLog.created_at.desc(), LaundryActivityLog.id.desc())
+        ).scalars().all()
+        return list(rows)
+
+    def test_service_timeline_pages_without_gaps_or_duplicates(self):
+        ids, pages = self._walk("/laundry_activity_logs/services/1", limit=4)
+        self.assertEqual(ids, self._expected(LaundryActivityLog.laundry_service_id == 1))
+        self.assertEqual(pages, 4)  # 16 rows; a full last page still ends the walk
+
+    def test_user_timeline_and_date_range(self):
+        ids, _ = self._walk("/laundry_activity_logs/users/2", limit=3)
+        self.assertEqual(ids, self._expected(LaundryActivityLog.user_id == 2))
+
+        ids, _ = self._walk("/laundry_activity_logs?start_date=2024-05-01&end_date=2024-05-01", limit=7)
+        self.assertEqual(ids, self._expected())
+
+        response = self.client.get("/laundry_activity_logs?start_date=2024-05-02&end_date=2024-05-02", headers=self.headers)
+        self.assertEqual(response.get_json()["items"], [])
+
+    def test_rejects_bad_cursor_and_missing_range(self):
+        response = self.client.get("/laundry_activity_logs/services/1?cursor=not-a-cursor", headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Invalid cursor"})
+
+        response = self.client.get("/laundry_activity_logs?start_date=2024-05-01", headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_sqlite_plan_uses_timeline_indexes(self):
+        for criterion, index in (
+            (LaundryActivityLog.laundry_service_id == 1, "ix_laundry_activity_logs_service_created"),
+            (LaundryActivityLog.user_id == 2, "ix_laundry_activity_logs_user_created"),
+        ):
+            sql = _timeline_sql(criterion, db.engine.dialect)
+            plan = " ".join(row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+            self.assertIn(index, plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+
+@unittest.skipUnless(os.getenv("TEST_MYSQL_URL"), "TEST_MYSQL_URL not set")
+class ActivityLogTimelineMySQLPlanTests(unittest.TestCase):
+    """EXPLAIN against a scratch MySQL schema (the tables are created and dropped)."""
+
+    def test_mysql_plan_uses_timeline_indexes(self):
+        engine = create_engine(os.environ["TEST_MYSQL_URL"])
+        LaundryActivityLog.metadata.create_all(engine)
+        try:
+            with engine.connect() as connection:
+                for criterion, index in (
+                    (LaundryActivityLog.laundry_service_id == 1, "ix_laundry_activity_logs_service_created"),
+                    (LaundryActivityLog.user_id == 2, "ix_laundry_activity_logs_user_created"),
+                ):
+                    plan = connection.execute(text(f"EXPLAIN {_timeline_sql(criterion, engine.dialect)}")).mappings().all()
+                    logs = next(row for row in plan if row["table"] == LaundryActivityLog.__tablename__)
+                    self.assertEqual(logs["key"], index)
+                    self.assertNotIn("filesort", logs["Extra"] or "")
+        finally:
+            LaundryActivityLog.metadata.drop_all(engine)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
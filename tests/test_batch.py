@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+from flask import Flask, abort, g, jsonify
+from flask_jwt_extended import JWTManager, create_access_token, jwt_manager, jwt_required
+
+from app.modules.batch.routes import batch_bp
+
+
+class BatchEndpointTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(JWT_SECRET_KEY="test-secret", BATCH_MAX_REQUESTS=3)
+        JWTManager(self.app)
+        self.app.register_blueprint(batch_bp)
+
+        @self.app.route("/items/<int:item_id>")
+        @jwt_required()
+        def get_item(item_id):
+            if item_id > 10:
+                abort(404)
+            g.calls = g.get("calls", 0) + 1
+            return jsonify({"id": item_id, "calls": g.calls})
+
+        with self.app.app_context():
+            token = create_access_token(identity="1")
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client = self.app.test_client()
+
+    def test_sub_requests_share_one_context_and_report_status(self):
+        response = self.client.post(
+            "/batch",
+            headers=self.headers,
+            json={"requests": [{"id": "first", "path": "/items/1"}, "/items/2", "/items/99"]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["responses"]
+        self.assertEqual([result["status"] for result in results], [200, 200, 404])
+        self.assertEqual(results[0]["id"], "first")
+        self.assertEqual(results[1]["body"], {"id": 2, "calls": 2})
+        self.assertEqual(results[2]["body"], {"error": "Not Found"})
+        self.assertTrue(all("duration_ms" in result for result in results))
+
+    def test_token_is_verified_once_per_batch(self):
+        with mock.patch.object(jwt_manager, "_decode_jwt", wraps=jwt_manager._decode_jwt) as decode:
+            response = self.client.post("/batch", headers=self.headers, json={"requests": ["/items/1", "/items/2", "/items/3"]})
+            batch_decodes = decode.call_count
+            self.client.get("/items/1", headers=self.headers)
+
+        self.assertEqual([result["status"] for result in response.get_json()["responses"]], [200, 200, 200])
+        self.assertEqual(batch_decodes, 1)
+        # Outside a batch every request still verifies its own token.
+        self.assertEqual(decode.call_count, 2)
+
+    def test_rejects_unauthenticated_and_invalid_batches(self):
+        self.assertEqual(self.client.post("/batch", json={"requests": ["/items/1"]}).status_code, 401)
+        for requests in ([], ["/items/1"] * 4, [{"path": "/items/1", "method": "DELETE"}], ["/batch"], ["items/1"]):
+            response = self.client.post("/batch", headers=self.headers, json={"requests": requests})
+            self.assertEqual(response.status_code, 400, requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
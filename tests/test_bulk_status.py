@@ -0,0 +1,107 @@
+import unittest
+from datetime import datetime
+
+from flask import Flask
+from sqlalchemy import event, select
+
+from app.extensions.db import db
+from app.modules.laundry.queue.service import bulk_update_status
+import models  # noqa: F401  (registers every table for create_all)
+from models.laundry_activity_log import LaundryActivityLog
+from models.laundry_service import LaundryService
+
+
+PICKUP_AT = datetime(2024, 5, 1, 9, 0, 0)
+
+
+class BulkUpdateStatusTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.execute(LaundryService.__table__.insert(), [
+            {
+                "id": service_id,
+                "client_id": 1,
+                "client_address_id": 1,
+                "scheduled_pickup_at": PICKUP_AT,
+                "created_by_user_id": 1,
+                "status": status,
+                "pending_order": pending_order,
+            }
+            for service_id, status, pending_order in (
+                (1, "PENDING", 1),
+                (2, "PENDING", 2),
+                (3, "IN_PROGRESS", None),
+                (4, "READY_FOR_DELIVERY", None),
+            )
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _state(self):
+        return {
+            row.id: (row.status, row.pending_order)
+            for row in db.session.execute(select(LaundryService.id, LaundryService.status, LaundryService.pending_order))
+        }
+
+    def test_moves_all_tickets_with_set_based_writes(self):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement.split()[0])  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            payload, code, statuses = bulk_update_status([1, 3, 4], "ready_for_delivery", current_user_id=7)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(code, 200)
+        self.assertEqual(payload["ids"], [1, 3])
+        self.assertEqual(payload["unchanged"], [4])
+        self.assertEqual(statuses, ["IN_PROGRESS", "PENDING", "READY_FOR_DELIVERY"])
+        self.assertEqual(statements.count("UPDATE"), 1)
+        self.assertEqual(statements.count("INSERT"), 1)
+        self.assertEqual(self._state()[1], ("READY_FOR_DELIVERY", None))
+        logs = db.session.execute(
+            select(LaundryActivityLog.laundry_service_id, LaundryActivityLog.previous_status)
+            .order_by(LaundryActivityLog.laundry_service_id)
+        ).all()
+        self.assertEqual(
+            [tuple(row) for row in logs], [(1, "PENDIENTE"), (3, "EN_PROCESO"), (4, "LISTO_PARA_ENVIO")]
+        )
+
+    def test_tickets_returning_to_pending_join_the_end_of_the_queue(self):
+        payload, code, _ = bulk_update_status([4, 3], "PENDING", current_user_id=7)
+
+        self.assertEqual(code, 200)
+        state = self._state()
+        self.assertEqual(state[4], ("PENDING", 3))
+        self.assertEqual(state[3], ("PENDING", 4))
+
+    def test_validation_failures_write_nothing(self):
+        self.assertEqual(bulk_update_status([1, 99], "DELIVERED", 7)[:2], ({"error": "Some ids were not found", "missing": [99]}, 404))
+        self.assertEqual(bulk_update_status([1, 1], "DELIVERED", 7)[1], 400)
+        self.assertEqual(bulk_update_status([1], "LOST", 7)[1], 400)
+        self.assertEqual(self._state()[1], ("PENDING", 1))
+        self.assertEqual(db.session.query(LaundryActivityLog).count(), 0)
+
+    def test_unchanged_tickets_are_logged_like_the_single_status_route(self):
+        payload, code, statuses = bulk_update_status([3], "IN_PROGRESS", current_user_id=7)
+
+        self.assertEqual(code, 200)
+        self.assertEqual((payload["count"], payload["unchanged"]), (0, [3]))
+        self.assertEqual(statuses, [])
+        logs = db.session.execute(
+            select(LaundryActivityLog.laundry_service_id, LaundryActivityLog.previous_status, LaundryActivityLog.new_status)
+        ).all()
+        self.assertEqual([tuple(row) for row in logs], [(3, "EN_PROCESO", "EN_PROCESO")])
+
+
+if __name__ == "__main__":
+    unittest.main()
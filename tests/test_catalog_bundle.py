@@ -0,0 +1,131 @@
+import gzip
+import json
+import unittest
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.catalogs.bundle.builder import (
+    SECTIONS,
+    assemble_body,
+    bundle_version,
+    catalog_bundle,
+    changed_sections,
+    section_version,
+)
+from app.modules.catalogs.bundle.routes import catalog_bundle_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.extra import Extra
+
+
+def _versions(**overrides):
+    versions = {section.name: section_version(b"[]") for section in SECTIONS}
+    versions.update(overrides)
+    return versions
+
+
+class CatalogBundleVersionTests(unittest.TestCase):
+    def test_since_version_returns_only_changed_sections(self):
+        old = _versions()
+        new = _versions(extras=section_version(b'[{"id":1}]'), global_settings=section_version(b'[{"id":2}]'))
+
+        self.assertEqual(changed_sections(bundle_version(old), new), ["extras", "global_settings"])
+        self.assertEqual(changed_sections(bundle_version(new), new), [])
+
+    def test_unknown_since_version_requires_full_bundle(self):
+        self.assertIsNone(changed_sections("stale-token", _versions()))
+
+    def test_assembled_body_embeds_preserialized_sections(self):
+        versions = _versions()
+        bodies = {"extras": b'[{"id":1,"name":"Planchado"}]', "payment_types": b"[]"}
+
+        body = assemble_body(json.dumps, "v1", versions, bodies, ["extras", "payment_types"], False)
+
+        self.assertEqual(
+            json.loads(body),
+            {
+                "version": "v1",
+                "full": False,
+                "versions": versions,
+                "sections": {"extras": [{"id": 1, "name": "Planchado"}], "payment_types": []},
+            },
+        )
+
+
+class CatalogBundleRouteTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test")
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        self.app.register_blueprint(catalog_bundle_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(Extra(id=1, name="Planchado", default_price=1))
+        db.session.commit()
+        catalog_bundle.invalidate()
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+        catalog_bundle.invalidate()
+
+    def test_requires_a_token(self):
+        self.assertEqual(self.client.get("/catalog/bundle").status_code, 401)
+
+    def test_full_bundle_and_etag_revalidation(self):
+        first = self.client.get("/catalog/bundle", headers=self.headers)
+
+        self.assertEqual(first.status_code, 200)
+        body = first.get_json()
+        self.assertTrue(body["full"])
+        self.assertEqual(set(body["sections"]), {section.name for section in SECTIONS})
+        self.assertEqual([item["name"] for item in body["sections"]["extras"]], ["Planchado"])
+        self.assertEqual(first.headers["ETag"], f'"{body["version"]}"')
+
+        second = self.client.get("/catalog/bundle", headers={**self.headers, "If-None-Match": first.headers["ETag"]})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+        self.assertEqual(catalog_bundle.builds, 1)
+
+    def test_full_bundle_is_gzipped_when_accepted(self):
+        plain = self.client.get("/catalog/bundle", headers=self.headers)
+        compressed = self.client.get("/catalog/bundle", headers={**self.headers, "Accept-Encoding": "gzip"})
+
+        self.assertEqual(compressed.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+
+    def test_since_version_returns_changed_sections_only(self):
+        version = self.client.get("/catalog/bundle", headers=self.headers).get_json()["version"]
+
+        unchanged = self.client.get(f"/catalog/bundle?since_version={version}", headers=self.headers).get_json()
+        self.assertEqual((unchanged["full"], unchanged["sections"]), (False, {}))
+
+        db.session.get(Extra, 1).name = "Lavado"
+        db.session.commit()
+        response = self.client.get(f"/catalog/bundle?since_version={version}", headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+        body = response.get_json()
+        self.assertFalse(body["full"])
+        self.assertEqual(list(body["sections"]), ["extras"])
+        self.assertEqual(body["sections"]["extras"][0]["name"], "Lavado")
+        self.assertNotEqual(body["version"], version)
+
+    def test_unknown_since_version_returns_full_bundle(self):
+        response = self.client.get("/catalog/bundle?since_version=stale", headers=self.headers)
+
+        self.assertTrue(response.get_json()["full"])
+        self.assertIn("ETag", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.clients.commands import clients_cli
+from app.modules.clients.phone_numbers import apply_phone_number, normalize_phone_digits, phone_suffix
+from app.modules.clients.routes import apply_common_filters, clients_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.client import Client, ClientPhone
+
+
+class PhoneNumberTests(unittest.TestCase):
+    def test_normalize_strips_formatting(self):
+        self.assertEqual(normalize_phone_digits("+503 7123-4567"), "50371234567")
+        self.assertEqual(normalize_phone_digits("(503) 7123 4567"), "50371234567")
+        self.assertIsNone(normalize_phone_digits("ext. -"))
+        self.assertIsNone(normalize_phone_digits(None))
+
+    def test_suffix_is_last_eight_digits(self):
+        self.assertEqual(phone_suffix("50371234567"), "71234567")
+        self.assertEqual(phone_suffix("2345"), "2345")
+        self.assertIsNone(phone_suffix(None))
+
+    def test_apply_phone_number_sets_digit_columns(self):
+        phone = ClientPhone()
+        apply_phone_number(phone, "+503 7123-4567")
+
+        self.assertEqual(phone.phone_number, "+503 7123-4567")
+        self.assertEqual(phone.phone_digits, "50371234567")
+        self.assertEqual(phone.phone_suffix, "71234567")
+
+
+class ClientPhoneLookupTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test", RESPONSE_CACHE_ENABLED=False)
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        self.app.register_blueprint(clients_bp)
+        self.app.cli.add_command(clients_cli)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Client(id=1, name="Ana", phones=[self._phone(1, "+503 7123-4567", is_primary=True)]),
+            Client(id=2, name="Beto", phones=[self._phone(2, "7123-4567"), self._phone(3, "2222-0000", is_primary=True)]),
+            Client(id=3, name="Carla", phones=[self._phone(4, "7999-1111")]),
+            Client(id=4, name="Borrada", is_deleted=True, phones=[self._phone(5, "7123-4567")]),
+        ])
+        db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _phone(self, phone_id, number, is_primary=False):
+        phone = ClientPhone(id=phone_id, is_primary=is_primary)
+        apply_phone_number(phone, number)
+        return phone
+
+    def _search(self, q):
+        query = apply_common_filters(Client.query.filter_by(is_deleted=False), q)
+        return [client.id for client in query.order_by(Client.id)]
+
+    def test_full_number_matches_exactly_before_suffix(self):
+        response = self.client.get("/clients/by-phone/503 7123 4567", headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["digits"], "50371234567")
+        self.assertEqual(
+            [(item["client_id"], item["phone_id"], item["match"]) for item in body["items"]],
+            [(1, 1, "exact"), (2, 2, "suffix")],
+        )
+
+    def test_local_number_matches_prefixed_phone_by_suffix(self):
+        response = self.client.get("/clients/by-phone/71234567", headers=self.headers)
+
+        items = response.get_json()["items"]
+        self.assertEqual([(item["client_id"], item["match"]) for item in items], [(2, "exact"), (1, "suffix")])
+        self.assertNotIn(4, [item["client_id"] for item in items])
+
+    def test_lookup_without_digits_is_rejected(self):
+        response = self.client.get("/clients/by-phone/abc", headers=self.headers)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Phone digits are required"})
+
+    def test_search_matches_phone_digits_by_prefix_or_local_suffix(self):
+        self.assertEqual(self._search("7123-4567"), [1, 2])
+        self.assertEqual(self._search("7123"), [1, 2])
+        self.assertEqual(self._search("503"), [1])
+        self.assertEqual(self._search("2222"), [2])
+        # Digits in the middle of a number are not searched.
+        self.assertEqual(self._search("4567"), [])
+
+    def test_search_phone_patterns_have_no_leading_wildcard(self):
+        patterns = []
+
+        def record(conn, cursor, statement, parameters, *args):
+            if "client_phones" in statement:
+                patterns.extend(value for value in parameters if isinstance(value, str) and "7123" in value)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            self._search("7123")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        # The name ILIKE keeps its wildcards; the two phone patterns must not
+        # start with one, or the phone_digits/phone_suffix indexes go unused.
+        self.assertEqual(sorted(patterns), ["%7123%", "7123%", "7123%"])
+
+    def test_search_still_matches_names(self):
+        self.assertEqual(self._search("carl"), [3])
+        self.assertEqual(self._search("B"), [2])
+
+    def test_backfill_fills_missing_digit_columns(self):
+        db.session.add(ClientPhone(id=6, client_id=3, phone_number="(503) 7555-0000"))
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=["clients", "backfill-phone-digits", "--batch-size", "2"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Backfilled 6 client phones", result.output)
+        db.session.expire_all()
+        phone = db.session.get(ClientPhone, 6)
+        self.assertEqual((phone.phone_digits, phone.phone_suffix), ("50375550000", "75550000"))
+
+
+if __name__ == "__main__":
+    unittest.main()
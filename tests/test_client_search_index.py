@@ -0,0 +1,76 @@
+import unittest
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+
+module_path = Path(__file__).resolve().parents[1] / "app" / "services" / "client_search.py"
+module_spec = spec_from_file_location("client_search_under_test", module_path)
+client_search_module = module_from_spec(module_spec)
+module_spec.loader.exec_module(client_search_module)
+ClientSearchIndex = client_search_module.ClientSearchIndex
+normalize_search_text = client_search_module.normalize_search_text
+
+
+class FakeClientRow:
+    def __init__(self, client_id, name, document_id=None, email=None):
+        self.id = client_id
+        self.name = name
+        self.document_id = document_id
+        self.email = email
+
+
+def build_index():
+    index = ClientSearchIndex()
+    index.rebuild([
+        FakeClientRow(1, "José Pérez", "01234567-8", "jose@example.com"),
+        FakeClientRow(2, "Josefina Núñez", "09876543-2", "fina@example.com"),
+        FakeClientRow(3, "Carlos Joseph", None, None),
+        FakeClientRow(4, "Ana María López", "11112222-3", "ana@example.com"),
+    ])
+    return index
+
+
+class ClientSearchIndexTests(unittest.TestCase):
+    def test_normalize_strips_accents_and_punctuation(self):
+        self.assertEqual(normalize_search_text("  José  Núñez-Pérez "), "jose nunez perez")
+
+    def test_accent_insensitive_match_ranks_exact_name_first(self):
+        results = build_index().search("jose perez")
+
+        self.assertEqual(results[0]["id"], 1)
+        self.assertEqual(results[0]["name"], "José Pérez")
+
+    def test_prefix_matches_rank_above_infix_matches(self):
+        results = build_index().search("jose")
+
+        self.assertEqual([item["id"] for item in results], [1, 2, 3])
+
+    def test_short_query_matches_word_prefixes(self):
+        results = build_index().search("nu")
+
+        self.assertEqual([item["id"] for item in results], [2])
+
+    def test_document_id_prefix_ignores_separators(self):
+        results = build_index().search("012345678")
+
+        self.assertEqual(results[0]["id"], 1)
+
+    def test_fuzzy_fallback_tolerates_typos(self):
+        results = build_index().search("josefna")
+
+        self.assertEqual(results[0]["id"], 2)
+
+    def test_upsert_and_remove_keep_index_current(self):
+        index = build_index()
+
+        index.upsert(3, "Carlos Martínez")
+        self.assertNotIn(3, [item["id"] for item in index.search("joseph")])
+        self.assertEqual([item["id"] for item in index.search("martinez")], [3])
+
+        index.remove(1)
+        self.assertNotIn(1, [item["id"] for item in index.search("jose")])
+        self.assertEqual(index.search("01234567"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import threading
+import unittest
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.clients import search
+from app.modules.clients.routes import clients_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.client import Client
+
+
+class ClientSearchRouteTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        # Shared-cache memory database, so the background build sees the rows from its own connection.
+        self.app.config.update(
+            SQLALCHEMY_DATABASE_URI="sqlite:///file:client_search_route?mode=memory&cache=shared&uri=true",
+            JWT_SECRET_KEY="test",
+            RESPONSE_CACHE_ENABLED=False,
+        )
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        self.app.register_blueprint(clients_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Client(id=1, name="José Pérez", document_id="01234567-8"),
+            Client(id=2, name="Josefina Núñez"),
+            Client(id=3, name="Ana López", email="jose@example.com"),
+            Client(id=4, name="José Borrado", is_deleted=True),
+        ])
+        db.session.commit()
+        search.client_search_index.rebuild([])
+        search.client_search_index.is_built = False
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+
+    def tearDown(self):
+        thread = search._build_state["thread"]
+        if thread is not None:
+            thread.join(5)
+        search._build_state["thread"] = None
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_first_search_answers_from_sql_and_builds_in_background(self):
+        statements = []
+        request_thread = threading.get_ident()
+
+        def record(conn, cursor, statement, *args):
+            if threading.get_ident() == request_thread:
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            response = self.client.get("/clients/search?q=jos", headers=self.headers)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.get_json()["items"]], [1, 2, 3])
+        self.assertIsNotNone(search._build_state["thread"])
+        # The request itself ran only the LIMITed fallback query.
+        self.assertEqual(len([statement for statement in statements if "FROM clients" in statement]), 1)
+        self.assertIn("LIMIT", statements[-1])
+
+    def test_search_uses_index_once_built(self):
+        self.client.get("/clients/search?q=jos", headers=self.headers)
+        search._build_state["thread"].join(5)
+
+        self.assertTrue(search.client_search_index.is_built)
+        response = self.client.get("/clients/search?q=jose perez", headers=self.headers)
+
+        self.assertEqual(response.get_json()["items"][0]["id"], 1)
+
+    def test_fallback_scores_match_index_tiers(self):
+        items = search.search_clients_sql("01234567", limit=5)
+
+        self.assertEqual([(item["id"], item["score"]) for item in items], [(1, search.SCORE_DOCUMENT_PREFIX)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import gzip
+import unittest
+import zlib
+
+from flask import Flask, Response, jsonify
+
+from app.extensions.compression import init_compression
+
+
+class CompressionTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(COMPRESSION_MIN_BYTES=200, COMPRESSION_LEVEL=6)
+        init_compression(self.app)
+
+        @self.app.route("/large")
+        def large():
+            response = jsonify([{"id": index, "name": f"Cliente {index}"} for index in range(100)])
+            response.set_etag("abc")
+            return response
+
+        @self.app.route("/small")
+        def small():
+            return jsonify({"status": "ok"})
+
+        @self.app.route("/stream")
+        def stream():
+            return Response((f'{{"id":{index}}}\n' for index in range(3)), mimetype="application/x-ndjson")
+
+        self.client = self.app.test_client()
+        self.gzip_headers = {"Accept-Encoding": "gzip"}
+
+    def test_large_json_is_gzipped_when_accepted(self):
+        plain = self.client.get("/large")
+        compressed = self.client.get("/large", headers=self.gzip_headers)
+
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(compressed.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", compressed.headers["Vary"])
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+        self.assertLess(len(compressed.data), len(plain.data))
+        self.assertEqual(compressed.headers["ETag"], 'W/"abc"')
+
+    def test_body_below_threshold_is_left_alone(self):
+        response = self.client.get("/small", headers=self.gzip_headers)
+
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_streamed_chunks_are_compressed_incrementally(self):
+        response = self.client.get("/stream", headers=self.gzip_headers, buffered=False)
+        decompressor = zlib.decompressobj(31)
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        chunks = [decompressor.decompress(chunk) for chunk in response.response]
+        response.close()
+
+        self.assertEqual(chunks[0], b'{"id":0}\n')
+        self.assertEqual(b"".join(chunks), b'{"id":0}\n{"id":1}\n{"id":2}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+
+from datetime import datetime
+
+from flask import Flask, jsonify
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, event
+
+from app.extensions.conditional_get import conditional_get, conditional_get_stats, validator_cache
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+
+
+metadata = MetaData()
+settings_table = Table(
+    "conditional_get_settings",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", String(50)),
+    Column("updated_at", DateTime),
+)
+
+
+class ConditionalGetTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        init_response_cache(self.app)
+        validator_cache.clear()
+        self.view_calls = 0
+
+        @self.app.route("/settings")
+        @conditional_get(settings_table)
+        def settings():
+            self.view_calls += 1
+            rows = db.session.execute(settings_table.select()).all()
+            return jsonify([row.value for row in rows])
+
+        @self.app.route("/settings/<int:setting_id>")
+        @conditional_get(settings_table)
+        def setting(setting_id):
+            self.view_calls += 1
+            row = db.session.execute(settings_table.select().where(settings_table.c.id == setting_id)).first()
+            if row is None:
+                return jsonify({"error": "Not found"}), 404
+            return jsonify({"id": row.id, "value": row.value})
+
+        with self.app.app_context():
+            metadata.create_all(db.engine)
+            db.session.execute(
+                settings_table.insert(), [{"id": 1, "value": "a", "updated_at": datetime(2026, 1, 2, 3, 4, 5)}]
+            )
+            db.session.commit()
+        self.client = self.app.test_client()
+
+    def test_matching_etag_returns_304_without_running_view(self):
+        first = self.client.get("/settings")
+        second = self.client.get("/settings", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(self.view_calls, 1)
+
+    def test_content_change_produces_new_etag(self):
+        first = self.client.get("/settings")
+        with self.app.app_context():
+            db.session.execute(settings_table.update().values(value="b"))
+            db.session.commit()
+        second = self.client.get("/settings", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(second.get_json(), ["b"])
+
+    def test_revalidation_hit_runs_no_queries(self):
+        etag = self.client.get("/settings").headers["ETag"]
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            event.listen(db.engine, "before_cursor_execute", record)
+            try:
+                response = self.client.get("/settings", headers={"If-None-Match": etag})
+            finally:
+                event.remove(db.engine, "before_cursor_execute", record)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(statements, [])
+
+    def test_unknown_etag_still_gets_304_when_body_matches(self):
+        etag = self.client.get("/settings").headers["ETag"]
+        validator_cache.clear()
+
+        response = self.client.get("/settings", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.view_calls, 2)
+
+    def test_detail_etag_covers_only_that_item(self):
+        first = self.client.get("/settings/1")
+        other = self.client.get("/settings/2")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(other.status_code, 404)
+        self.assertNotIn("ETag", other.headers)
+
+    def test_star_matches_only_existing_items(self):
+        existing = self.client.get("/settings/1", headers={"If-None-Match": "*"})
+        missing = self.client.get("/settings/2", headers={"If-None-Match": "*"})
+
+        self.assertEqual(existing.status_code, 304)
+        self.assertEqual(missing.status_code, 404)
+
+    def test_last_modified_comes_from_updated_at(self):
+        first = self.client.get("/settings")
+        second = self.client.get("/settings", headers={"If-Modified-Since": first.headers["Last-Modified"]})
+
+        self.assertEqual(first.headers["Last-Modified"], "Fri, 02 Jan 2026 03:04:05 GMT")
+        self.assertEqual(second.status_code, 304)
+
+    def test_stats_count_not_modified_responses(self):
+        before = conditional_get_stats.stats()["endpoints"].get("settings", {"requests": 0, "not_modified": 0})
+        etag = self.client.get("/settings").headers["ETag"]
+        self.client.get("/settings", headers={"If-None-Match": etag})
+
+        after = conditional_get_stats.stats()["endpoints"]["settings"]
+        self.assertEqual(after["requests"] - before["requests"], 2)
+        self.assertEqual(after["not_modified"] - before["not_modified"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, exc, text
+
+from app.extensions.db_pool import TimedQueuePool, instrument_pool, pool_stats, pool_status
+
+
+class PoolInstrumentationTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        pool_stats.reset()
+        self.engines = []
+
+    def tearDown(self):
+        for engine in self.engines:
+            engine.dispose()
+        os.remove(self.path)
+
+    def _engine(self, pre_ping, ping_idle_seconds=60.0, **options):
+        engine = create_engine(f"sqlite:///{self.path}", poolclass=TimedQueuePool, **options)
+        instrument_pool(engine, pre_ping, ping_idle_seconds)
+        self.engines.append(engine)
+        return engine
+
+    def _query(self, engine, times):
+        for _ in range(times):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+    def test_adaptive_mode_pings_only_idle_connections(self):
+        self._query(self._engine("adaptive", ping_idle_seconds=60), 10)
+        stats = pool_stats.stats()
+        self.assertEqual((stats["checkouts"], stats["pings"], stats["pings_skipped"]), (10, 0, 10))
+
+        pool_stats.reset()
+        self._query(self._engine("adaptive", ping_idle_seconds=0), 10)
+        stats = pool_stats.stats()
+        self.assertEqual((stats["checkouts"], stats["pings"], stats["pings_skipped"]), (10, 10, 0))
+
+    def test_failed_ping_replaces_the_connection(self):
+        engine = self._engine("adaptive", ping_idle_seconds=0)
+        self._query(engine, 1)
+        do_ping = engine.dialect.do_ping
+        failures = []
+
+        def flaky_ping(dbapi_connection):
+            if not failures:
+                failures.append(True)
+                raise engine.dialect.dbapi.OperationalError("server has gone away")
+            return do_ping(dbapi_connection)
+
+        engine.dialect.do_ping = flaky_ping
+        self._query(engine, 1)
+        stats = pool_stats.stats()
+        self.assertEqual((stats["ping_failures"], stats["invalidations"], stats["connects"]), (1, 1, 2))
+
+    def test_reports_overflow_in_use_and_timeouts(self):
+        engine = self._engine("false", pool_size=1, max_overflow=1, pool_timeout=0.05)
+        first = engine.connect()
+        second = engine.connect()
+        try:
+            status = pool_status(engine)
+            self.assertEqual((status["checked_out"], status["overflow"], status["size"]), (2, 1, 1))
+            with self.assertRaises(exc.TimeoutError):
+                engine.connect()
+        finally:
+            first.close()
+            second.close()
+        stats = pool_stats.stats()
+        self.assertEqual((stats["checkouts"], stats["timeouts"], stats["pings"]), (2, 1, 0))
+        self.assertGreaterEqual(stats["max_wait_ms"], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from types import SimpleNamespace
+
+from app.modules.laundry.v2.services.header_changes import (
+    DELIVERY_LINE,
+    SERVICE_TYPE_LINE,
+    plan_header_patch,
+)
+
+
+def _service(**overrides):
+    values = {"service_label": "NORMAL", "fulfillment_type": "WALK_IN", "notes": None}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class PlanHeaderPatchTests(unittest.TestCase):
+    def test_notes_only_edit_recomputes_no_order_items(self):
+        plan = plan_header_patch(_service(), {"expected_updated_at": "x", "notes": "Sin almidon"})
+
+        self.assertEqual(plan.column_changes, {"notes": "Sin almidon"})
+        self.assertEqual(plan.lines, set())
+
+    def test_resending_current_values_is_not_a_change(self):
+        plan = plan_header_patch(_service(), {"service_label": " normal ", "fulfillment_type": "WALK_IN"})
+
+        self.assertFalse(plan.has_changes)
+
+    def test_each_line_follows_its_own_inputs(self):
+        self.assertEqual(plan_header_patch(_service(), {"service_label": "EXPRESS"}).lines, {SERVICE_TYPE_LINE})
+        self.assertEqual(plan_header_patch(_service(), {"fulfillment_type": "DELIVERY"}).lines, {DELIVERY_LINE})
+        self.assertEqual(plan_header_patch(_service(), {"distance_km": "4.5"}).lines, {DELIVERY_LINE})
+        self.assertEqual(plan_header_patch(_service(), {"manual_delivery_fee": 0}).lines, {DELIVERY_LINE})
+
+    def test_invalid_values_raise(self):
+        with self.assertRaises(ValueError):
+            plan_header_patch(_service(), {"service_label": "URGENT"})
+        with self.assertRaises(ValueError):
+            plan_header_patch(_service(), {"fulfillment_type": "SHIPPING"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, decode_token
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from app.extensions.db import db
+from app.extensions.password_hashing import init_password_hashing
+from app.extensions.response_cache import init_response_cache
+from app.modules.auth.routes import auth_bp
+from app.modules.menus.routes import menu_bp
+from app.modules.users.routes import user_bp
+from app.services.identity import PERMISSIONS_VERSION_CLAIM, ROLE_CLAIM, identity_cache
+import models  # noqa: F401  (registers every table for create_all)
+from models.menu import Menu
+from models.role import Role
+from models.user import User
+
+
+class IdentityClaimsTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test", RESPONSE_CACHE_ENABLED=False)
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        init_password_hashing(self.app)
+        for blueprint in (auth_bp, menu_bp, user_bp):
+            self.app.register_blueprint(blueprint)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        admin = Role(id=1, name="admin", description="test")
+        clerk = Role(id=2, name="clerk", description="test")
+        db.session.add_all([admin, clerk])
+        db.session.add(User(id=1, username="ana", password=generate_password_hash("pw"), role_id=2, name="Ana"))
+        db.session.add_all([
+            Menu(id=1, key="home", label="Inicio", path="/home", roles=[admin, clerk]),
+            Menu(id=2, key="users", label="Usuarios", path="/users", roles=[admin]),
+        ])
+        db.session.commit()
+        identity_cache.clear()
+        self.client = self.app.test_client()
+
+        response = self.client.post("/auth/login", json={"username": "ana", "password": "pw"})
+        self.tokens = response.get_json()
+        self.headers = {"Authorization": f"Bearer {self.tokens['access_token']}"}
+
+        self.statements = []
+        event.listen(db.engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(db.engine, "before_cursor_execute", self._record)
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def _identity_queries(self):
+        return [statement for statement in self.statements if "FROM users" in statement]
+
+    def test_access_token_carries_role_and_permissions_version(self):
+        claims = decode_token(self.tokens["access_token"])
+        self.assertEqual(claims[ROLE_CLAIM], 2)
+        self.assertIn(PERMISSIONS_VERSION_CLAIM, claims)
+
+        response = self.client.post("/auth/refresh", headers={"Authorization": f"Bearer {self.tokens['refresh_token']}"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(decode_token(response.get_json()["access_token"])[ROLE_CLAIM], 2)
+
+    def test_role_only_endpoints_skip_identity_queries(self):
+        response = self.client.get("/menus", headers=self.headers)
+        self.assertEqual([menu["key"] for menu in response.get_json()], ["home"])
+        self.assertEqual(self.client.get("/users/shortcuts", headers=self.headers).status_code, 200)
+        response = self.client.put("/users/1/force-password", headers=self.headers, json={"new_password": "x"})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self._identity_queries(), [])
+
+    def test_role_change_invalidates_claim(self):
+        db.session.get(User, 1).role_id = 1
+        db.session.commit()
+        self.statements.clear()
+
+        for _ in range(2):
+            response = self.client.get("/menus", headers=self.headers)
+            self.assertEqual([menu["key"] for menu in response.get_json()], ["home", "users"])
+        # One lookup after the change, then served from the identity cache.
+        self.assertEqual(len(self._identity_queries()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+
+from app.extensions.compression import init_compression
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.menus.routes import menu_bp
+from app.modules.menus.tree import menu_trees
+from app.services.identity import identity_claims
+import models  # noqa: F401  (registers every table for create_all)
+from models.menu import Menu
+from models.role import Role
+from models.user import User
+
+
+class MenuTreeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test")
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        self.app.register_blueprint(menu_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        admin = Role(id=1, name="admin", description="test")
+        clerk = Role(id=2, name="clerk", description="test")
+        db.session.add_all([admin, clerk])
+        db.session.add_all([
+            User(id=1, username="admin", password="x", role_id=1, name="Admin"),
+            User(id=2, username="clerk", password="x", role_id=2, name="Clerk"),
+        ])
+        db.session.add_all([
+            Menu(id=1, key="home", label="Inicio", path="/home", order=0, roles=[admin, clerk]),
+            Menu(id=2, key="settings", label="Ajustes", order=1, roles=[admin]),
+            Menu(id=3, key="users", label="Usuarios", path="/users", order=2, parent_id=2, roles=[admin]),
+        ])
+        db.session.commit()
+        menu_trees.invalidate()
+        self.client = self.app.test_client()
+        self.headers = {
+            role_id: {"Authorization": f"Bearer {create_access_token(identity=role_id, additional_claims=identity_claims(role_id))}"}
+            for role_id in (1, 2)
+        }
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _keys(self, role_id):
+        return [(node["key"], [child["key"] for child in node["children"]]) for node in self.client.get("/menus", headers=self.headers[role_id]).get_json()]
+
+    def test_builds_each_role_tree_once_and_serves_it_without_queries(self):
+        self.assertEqual(self._keys(1), [("home", []), ("settings", ["users"])])
+        self.assertEqual(self._keys(2), [("home", [])])
+        builds = menu_trees.builds
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            self.assertEqual(self._keys(1), [("home", []), ("settings", ["users"])])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+        self.assertEqual(statements, [])
+        self.assertEqual(menu_trees.builds, builds)
+
+    def test_etag_revalidation(self):
+        first = self.client.get("/menus", headers=self.headers[2])
+        self.assertEqual(first.headers["Cache-Control"], "no-cache")
+        etag = first.headers["ETag"]
+
+        response = self.client.get("/menus", headers={**self.headers[2], "If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        other = self.client.get("/menus", headers={**self.headers[1], "If-None-Match": etag})
+        self.assertEqual(other.status_code, 200)
+
+    def test_gzipped_response_revalidates_with_its_weak_etag(self):
+        self.app.config.update(COMPRESSION_MIN_BYTES=1)
+        init_compression(self.app)
+        headers = {**self.headers[1], "Accept-Encoding": "gzip"}
+
+        first = self.client.get("/menus", headers=headers)
+        self.assertEqual(first.headers["Content-Encoding"], "gzip")
+        etag = first.headers["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        response = self.client.get("/menus", headers={**headers, "If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+    def test_role_assignment_rebuilds_tree(self):
+        etag = self.client.get("/menus", headers=self.headers[2]).headers["ETag"]
+        menu = db.session.get(Menu, 2)
+        menu.roles.append(db.session.get(Role, 2))
+        db.session.commit()
+
+        response = self.client.get("/menus", headers={**self.headers[2], "If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._keys(2), [("home", []), ("settings", [])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.services.order_totals import mark_order_totals_dirty, refresh_order_totals, refresh_pending_order_totals
+import models  # noqa: F401  (registers every table for create_all)
+from models.laundry_service import LaundryService
+from models.laundry_service_extra import LaundryServiceExtra
+from models.order_item import OrderItem
+
+
+EDITED_AT = datetime(2024, 5, 1, 18, 30, 15)
+
+
+class OrderTotalsTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.execute(LaundryService.__table__.insert(), [
+            {
+                "id": service_id,
+                "client_id": 1,
+                "client_address_id": 1,
+                "scheduled_pickup_at": EDITED_AT,
+                "created_by_user_id": 1,
+                "updated_at": EDITED_AT,
+            }
+            for service_id in (1, 2)
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _add_item(self, service_id, applied_price):
+        db.session.add(OrderItem(
+            laundry_service_id=service_id,
+            service_id=1,
+            quantity=1,
+            catalog_price=applied_price,
+            applied_price=applied_price,
+        ))
+
+    def test_refresh_sums_lines_of_the_given_service_only(self):
+        self._add_item(1, Decimal("7.50"))
+        self._add_item(1, Decimal("3.00"))
+        self._add_item(2, Decimal("99.00"))
+        db.session.add(LaundryServiceExtra(
+            laundry_service_id=1, extra_id=1, quantity=2, unit_price=Decimal("1.25"), subtotal=Decimal("2.50"),
+        ))
+        service = db.session.get(LaundryService, 1)
+
+        refresh_order_totals(1)
+        db.session.commit()
+
+        self.assertEqual(
+            (service.subtotal, service.extras_total, service.grand_total),
+            (Decimal("10.50"), Decimal("2.50"), Decimal("13.00")),
+        )
+        self.assertEqual(db.session.get(LaundryService, 2).grand_total, Decimal("0.00"))
+
+    def test_refresh_keeps_updated_at_and_handles_removed_lines(self):
+        self._add_item(1, Decimal("4.00"))
+        refresh_order_totals(1)
+        db.session.commit()
+
+        OrderItem.query.filter(OrderItem.laundry_service_id == 1).delete(synchronize_session=False)
+        refresh_order_totals(1)
+        db.session.commit()
+
+        service = db.session.get(LaundryService, 1)
+        self.assertEqual(service.grand_total, Decimal("0.00"))
+        self.assertEqual(service.updated_at, EDITED_AT)
+
+    def test_pending_refresh_runs_one_update_for_every_marked_service(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.startswith("UPDATE laundry_services"):
+                statements.append(statement)
+
+        self._add_item(1, Decimal("4.00"))
+        mark_order_totals_dirty(1)
+        self._add_item(1, Decimal("1.00"))
+        mark_order_totals_dirty(1, 2, None)
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            refresh_pending_order_totals()
+            refresh_pending_order_totals()
+            db.session.commit()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(db.session.get(LaundryService, 1).grand_total, Decimal("5.00"))
+
+    def test_rollback_discards_marked_services(self):
+        self._add_item(1, Decimal("4.00"))
+        mark_order_totals_dirty(1)
+        db.session.rollback()
+
+        self.assertNotIn("order_totals_dirty_services", db.session.info)
+
+
+if __name__ == "__main__":
+    unittest.main()
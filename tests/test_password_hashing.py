@@ -0,0 +1,113 @@
+import time
+import unittest
+
+import eventlet
+from eventlet import tpool
+from flask import Flask
+from flask_jwt_extended import JWTManager
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.extensions.db import db
+from app.extensions.password_hashing import init_password_hashing, password_hasher
+from app.modules.auth.routes import auth_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.role import Role
+from models.user import User
+
+
+PASSWORD = "s3cret"
+PASSWORD_HASH = generate_password_hash(PASSWORD)
+
+
+class PasswordHashingTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(
+            SQLALCHEMY_DATABASE_URI="sqlite://",
+            JWT_SECRET_KEY="test",
+            PASSWORD_HASH_MAX_CONCURRENCY=2,
+            PASSWORD_HASH_WAIT_SECONDS=0.05,
+        )
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_password_hashing(self.app)
+        self.app.register_blueprint(auth_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(Role(id=1, name="admin", description="test"))
+        db.session.add(User(id=1, username="ana", password=PASSWORD_HASH, role_id=1, name="Ana"))
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        password_hasher.configure()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _login(self, password=PASSWORD):
+        return self.client.post("/auth/login", json={"username": "ana", "password": password})
+
+    def test_hashes_and_verifies_in_pool_with_metrics(self):
+        self.assertEqual(self._login().status_code, 200)
+        self.assertEqual(self._login("wrong").status_code, 401)
+        self.assertTrue(check_password_hash(password_hasher.hash("nueva"), "nueva"))
+
+        stats = password_hasher.stats()
+        self.assertEqual(stats["mode"], "thread")
+        self.assertEqual((stats["verified"], stats["hashed"], stats["in_flight"]), (2, 1, 0))
+        self.assertGreater(stats["max_run_ms"], 0)
+
+    def test_login_gets_503_when_every_slot_is_busy(self):
+        for _ in range(password_hasher.max_concurrency):
+            password_hasher._slots.acquire()
+        try:
+            response = self._login()
+        finally:
+            for _ in range(password_hasher.max_concurrency):
+                password_hasher._slots.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+        self.assertEqual(password_hasher.stats()["rejected_busy"], 1)
+        self.assertEqual(self._login().status_code, 200)
+
+    def test_queue_pings_keep_answering_during_login_burst(self):
+        def burst(verify):
+            # A socket ping loop sharing the hub with eight login password checks.
+            gaps = []
+            done = []
+
+            def pinger():
+                last = time.monotonic()
+                while not done:
+                    eventlet.sleep(0.005)
+                    now = time.monotonic()
+                    gaps.append(now - last)
+                    last = now
+
+            ping = eventlet.spawn(pinger)
+            eventlet.sleep(0)
+            pool = eventlet.GreenPool()
+            results = list(pool.imap(lambda _: verify(PASSWORD_HASH, PASSWORD), range(8)))
+            done.append(True)
+            ping.wait()
+            self.assertEqual(results, [True] * 8)
+            return max(gaps)
+
+        # Inline, each PBKDF2 run stops the hub for its whole duration.
+        single = time.monotonic()
+        check_password_hash(PASSWORD_HASH, PASSWORD)
+        single = time.monotonic() - single
+        self.assertGreaterEqual(burst(check_password_hash), single * 0.8)
+
+        password_hasher.configure(mode="eventlet", max_concurrency=2)
+        try:
+            self.assertLess(burst(password_hasher.verify), max(single * 0.5, 0.02))
+        finally:
+            tpool.killall()
+        self.assertEqual(password_hasher.stats()["verified"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from flask import Flask
+
+from app.api.preferences import minimal_response, prefers_minimal, requested_return
+
+
+class PreferHeaderTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def _requested(self, *values):
+        headers = [("Prefer", value) for value in values]
+        with self.app.test_request_context("/", method="PATCH", headers=headers):
+            return requested_return()
+
+    def test_return_preference_is_parsed(self):
+        self.assertIsNone(self._requested())
+        self.assertEqual(self._requested("return=minimal"), "minimal")
+        self.assertEqual(self._requested('respond-async, Return="Representation"'), "representation")
+        self.assertEqual(self._requested("wait=10", "return=minimal; foo=bar"), "minimal")
+        self.assertIsNone(self._requested("return=nothing"))
+
+    def test_minimal_response_reports_the_applied_preference(self):
+        with self.app.test_request_context("/", method="POST", headers={"Prefer": "return=minimal"}):
+            self.assertTrue(prefers_minimal())
+            response = minimal_response({"id": 7}, 201)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json(), {"id": 7})
+        self.assertEqual(response.headers["Preference-Applied"], "return=minimal")
+        self.assertIn("Prefer", response.headers["Vary"])
+
+
+if __name__ == "__main__":
+    unittest.main()
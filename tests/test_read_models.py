@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.modules.billing.transactions.read_model import map_transaction_row
+from app.modules.laundry.deliveries.read_model import map_delivery_row
+from app.modules.laundry.services.read_model import map_compact_row
+from schemas.laundry_delivery_schema import LaundryDeliverySchema
+from schemas.laundry_service_schema import LaundryServiceCompactSchema
+from schemas.transaction_schema import TransactionSchema
+
+
+CREATED_AT = datetime(2024, 5, 1, 18, 30, 15)
+
+
+class ReadModelMapperTests(unittest.TestCase):
+    """Core-row mappers must produce exactly what the ORM schemas dump."""
+
+    def test_compact_row_matches_compact_schema(self):
+        service = SimpleNamespace(
+            id=7,
+            client_id=3,
+            client_address_id=4,
+            scheduled_pickup_at=datetime(2024, 5, 2, 15, 0, 0),
+            pending_order=2,
+            status="PENDING",
+            service_label="EXPRESS",
+            fulfillment_type="WALK_IN",
+            transaction_id=None,
+            created_by_user_id=1,
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+            client=SimpleNamespace(id=3, name="José Pérez"),
+            client_address=SimpleNamespace(id=4, client_id=3, address_text="Colonia Escalón"),
+            created_by_user=SimpleNamespace(name="Caja 1"),
+            subtotal=Decimal("14.5"),
+            extras_total=Decimal("3.00"),
+            grand_total=Decimal("17.50"),
+        )
+        row = SimpleNamespace(
+            **{key: value for key, value in vars(service).items() if key not in ("client", "client_address", "created_by_user")},
+            client_ref_id=3,
+            client_name="José Pérez",
+            address_ref_id=4,
+            address_client_id=3,
+            address_text="Colonia Escalón",
+            created_by_ref_id=1,
+            created_by_name="Caja 1",
+        )
+
+        self.assertEqual(map_compact_row(row), LaundryServiceCompactSchema().dump(service))
+
+    def test_transaction_row_omits_missing_relations_like_schema(self):
+        transaction = SimpleNamespace(
+            id=9,
+            user_id=1,
+            transaction_type="IN",
+            payment_type_id=2,
+            category_id=None,
+            detail="Servicio 7",
+            amount=Decimal("12.50"),
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+            client_id=None,
+            user=SimpleNamespace(name="Caja 1"),
+            payment_type=SimpleNamespace(name="Efectivo"),
+            category=None,
+            client=None,
+        )
+        row = SimpleNamespace(
+            **{key: value for key, value in vars(transaction).items() if key not in ("user", "payment_type", "category", "client")},
+            user_ref_id=1,
+            user_name="Caja 1",
+            payment_type_ref_id=2,
+            payment_type_name="Efectivo",
+            category_ref_id=None,
+            category_name=None,
+            client_ref_id=None,
+            client_name=None,
+        )
+
+        self.assertEqual(map_transaction_row(row), TransactionSchema().dump(transaction))
+
+    def test_delivery_row_matches_delivery_schema(self):
+        row = SimpleNamespace(
+            id=5,
+            laundry_service_id=7,
+            created_by_user_id=1,
+            assigned_to_user_id=None,
+            scheduled_delivery_at=datetime(2024, 5, 3, 1, 0, 0),
+            delivered_at=None,
+            status="PENDING",
+            cancel_note=None,
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+        )
+
+        self.assertEqual(map_delivery_row(row), LaundryDeliverySchema().dump(row))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.services.reference_resolver import ReferenceResolver
+import models  # noqa: F401  (registers every table for create_all)
+from models.extra import Extra
+from models.garment_type import GarmentType
+
+
+class ReferenceResolverTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([Extra(id=extra_id, name=f"Extra {extra_id}", default_price=1) for extra_id in range(1, 31)])
+        db.session.add_all([GarmentType(id=garment_id, name=f"Prenda {garment_id}") for garment_id in (1, 2)])
+        db.session.commit()
+        db.session.expunge_all()
+
+        self.statements = []
+        event.listen(db.engine, "before_cursor_execute", self._record)
+
+    def tearDown(self):
+        event.remove(db.engine, "before_cursor_execute", self._record)
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def test_loads_each_model_with_a_single_query(self):
+        references = (
+            ReferenceResolver()
+            .collect(Extra, list(range(1, 31)) + [99])
+            .collect(GarmentType, ["1", 2, None])
+            .load()
+        )
+
+        self.assertEqual(len(self.statements), 2)
+        self.assertEqual(references.queries, 2)
+        self.assertEqual(references.get(Extra, 30).name, "Extra 30")
+        self.assertEqual(references.get(GarmentType, "1").name, "Prenda 1")
+        self.assertIsNone(references.get(Extra, 99))
+        self.assertIsNone(references.get(Extra, "abc"))
+        self.assertEqual(len(self.statements), 2)
+
+    def test_uncollected_id_is_loaded_on_demand(self):
+        references = ReferenceResolver().load()
+
+        self.assertEqual(references.get(GarmentType, 2).name, "Prenda 2")
+        self.assertEqual(references.queries, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
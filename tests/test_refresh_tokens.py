@@ -0,0 +1,98 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask_jwt_extended import JWTManager
+from sqlalchemy import event, select
+from werkzeug.security import generate_password_hash
+
+from app.extensions.db import db
+from app.extensions.password_hashing import init_password_hashing
+from app.modules.auth.routes import auth_bp
+from app.modules.auth.token_store import purge_expired_refresh_tokens, purge_stats, revoked_tokens
+import models  # noqa: F401  (registers every table for create_all)
+from models.refresh_token import RefreshToken
+from models.role import Role
+from models.user import User
+
+
+NOW = datetime(2024, 5, 1, 12, 0, 0)
+
+
+class RefreshTokenStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test")
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_password_hashing(self.app)
+        self.app.register_blueprint(auth_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(Role(id=1, name="admin", description="test"))
+        db.session.add(User(id=1, username="ana", password=generate_password_hash("pw"), role_id=1, name="Ana"))
+        db.session.commit()
+        revoked_tokens.clear()
+        purge_stats.reset()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _statements(self, fn):
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            result = fn()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+        return result, statements
+
+    def test_logout_revokes_and_caches_the_jti(self):
+        refresh_token = self.client.post("/auth/login", json={"username": "ana", "password": "pw"}).get_json()["refresh_token"]
+        headers = {"Authorization": f"Bearer {refresh_token}"}
+        self.assertEqual(self.client.post("/auth/refresh", headers=headers).status_code, 200)
+        self.assertEqual(self.client.post("/auth/logout", headers=headers).status_code, 200)
+        self.assertTrue(db.session.execute(select(RefreshToken.revoked)).scalar())
+
+        response, statements = self._statements(lambda: self.client.post("/auth/refresh", headers=headers))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual([statement for statement in statements if "refresh_tokens" in statement], [])
+        self.assertEqual(revoked_tokens.stats(), {"entries": 1, "hits": 1})
+
+    def test_purges_expired_tokens_in_batches(self):
+        db.session.execute(RefreshToken.__table__.insert(), [
+            {"jti": f"jti-{index}", "user_id": 1, "expires_at": NOW + timedelta(hours=hours), "revoked": revoked}
+            for index, (hours, revoked) in enumerate(
+                [(-5, False), (-4, True), (-3, False), (-2, False), (-1, True), (1, True), (2, False)]
+            )
+        ])
+        db.session.commit()
+
+        deleted, statements = self._statements(lambda: purge_expired_refresh_tokens(batch_size=2, now=NOW))
+        self.assertEqual(deleted, 5)
+        self.assertEqual(sum(statement.startswith("DELETE") for statement in statements), 3)
+        remaining = db.session.execute(select(RefreshToken.jti).order_by(RefreshToken.jti)).scalars().all()
+        self.assertEqual(remaining, ["jti-5", "jti-6"])
+
+        stats = purge_stats.stats()
+        self.assertEqual((stats["runs"], stats["deleted"], stats["last_deleted"]), (1, 5, 5))
+        self.assertIsNotNone(stats["last_duration_ms"])
+
+
+class AppFactoryTests(unittest.TestCase):
+    def test_create_app_starts_no_purge_thread(self):
+        from app import create_app
+
+        create_app()
+
+        self.assertNotIn("refresh-token-purge", [thread.name for thread in threading.enumerate()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from flask import Flask
+from sqlalchemy import Column, ForeignKey, Integer, String, Table, create_engine, update
+from sqlalchemy.orm import Session, declarative_base, relationship
+
+# The session hooks are process-wide, so exercise the module the app registers.
+from app.extensions import response_cache as response_cache_module
+from app.extensions.response_cache import ResponseCache
+
+Base = declarative_base()
+
+item_tags = Table(
+    "item_tags",
+    Base.metadata,
+    Column("item_id", ForeignKey("items.id"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id"), primary_key=True),
+)
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    tags = relationship("Tag", secondary=item_tags)
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_lru_evicts_least_recently_used_and_counts(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "A", 1)
+        cache.set("b", "B", 1)
+        self.assertEqual(cache.get("a"), "A")
+        cache.set("c", "C", 1)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "C")
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (2, 1))
+
+    def test_expired_and_oversized_entries_are_not_served(self):
+        cache = ResponseCache(ttl_seconds=-1, max_body_bytes=10)
+        cache.set("a", "A", 1)
+        cache.set("big", "B", 11)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+class TableVersionHookTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        response_cache_module.init_response_cache(Flask(__name__))
+        cls.engine = create_engine("sqlite://")
+        Base.metadata.create_all(cls.engine)
+
+    def setUp(self):
+        self.versions = response_cache_module.table_versions
+
+    def test_commit_bumps_written_tables_only(self):
+        before = self.versions.get(("items", "tags"))
+        with Session(self.engine) as session:
+            session.add(Item(name="a"))
+            session.commit()
+
+        self.assertEqual(self.versions.get(("items", "tags")), (before[0] + 1, before[1]))
+
+    def test_rollback_does_not_bump(self):
+        before = self.versions.get(("items",))
+        with Session(self.engine) as session:
+            session.add(Item(name="b"))
+            session.flush()
+            session.rollback()
+
+        self.assertEqual(self.versions.get(("items",)), before)
+
+    def test_bulk_statements_and_association_rows_bump(self):
+        with Session(self.engine) as session:
+            item = Item(name="c")
+            session.add_all([item, Tag()])
+            session.commit()
+            before = self.versions.get(("items", "item_tags"))
+
+            session.execute(update(Item).values(name="d"))
+            item.tags.append(session.query(Tag).first())
+            session.commit()
+
+        after = self.versions.get(("items", "item_tags"))
+        self.assertGreater(after[0], before[0])
+        self.assertGreater(after[1], before[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
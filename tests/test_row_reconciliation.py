@@ -0,0 +1,50 @@
+import unittest
+from decimal import Decimal
+
+from app.services.row_reconciliation import reconcile_rows
+
+
+def _key(row):
+    return row["extra_id"]
+
+
+FIELDS = ("quantity", "unit_price")
+
+
+class ReconcileRowsTests(unittest.TestCase):
+    def setUp(self):
+        self.existing = [
+            {"id": 10, "extra_id": 1, "quantity": 2, "unit_price": Decimal("1.25")},
+            {"id": 11, "extra_id": 2, "quantity": 1, "unit_price": Decimal("4.00")},
+        ]
+
+    def test_identical_payload_produces_no_statements(self):
+        desired = [{"extra_id": 1, "quantity": 2, "unit_price": Decimal("1.25")}, {"extra_id": 2, "quantity": 1, "unit_price": Decimal("4.00")}]
+
+        reconciliation = reconcile_rows(self.existing, desired, _key, FIELDS)
+
+        self.assertFalse(reconciliation.has_changes)
+        self.assertIsNone(reconciliation.summary())
+
+    def test_changed_row_keeps_id_and_updates_only_changed_fields(self):
+        desired = [{"extra_id": 1, "quantity": 3, "unit_price": Decimal("1.25")}, {"extra_id": 3, "quantity": 1, "unit_price": Decimal("2.00")}]
+
+        reconciliation = reconcile_rows(self.existing, desired, _key, FIELDS)
+
+        self.assertEqual(reconciliation.updates, [{"id": 10, "quantity": 3}])
+        self.assertEqual(reconciliation.inserts, [{"extra_id": 3, "quantity": 1, "unit_price": Decimal("2.00")}])
+        self.assertEqual(reconciliation.deletes, [11])
+        self.assertEqual(reconciliation.summary(), {"inserted": 1, "updated_ids": [10], "deleted_ids": [11]})
+
+    def test_duplicate_existing_keys_are_collapsed(self):
+        existing = self.existing + [{"id": 12, "extra_id": 1, "quantity": 5, "unit_price": Decimal("1.25")}]
+        desired = [{"extra_id": 1, "quantity": 2, "unit_price": Decimal("1.25")}]
+
+        reconciliation = reconcile_rows(existing, desired, _key, FIELDS)
+
+        self.assertEqual(reconciliation.updates, [])
+        self.assertEqual(reconciliation.deletes, [11, 12])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from decimal import Decimal
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.extensions.db import db
+from app.modules.laundry.service_type_surcharge_rules import (
+    resolve_client_service_type_surcharge,
+    resolve_client_service_type_surcharges,
+)
+import models  # noqa: F401  (registers every table for create_all)
+from models.client_service_type_surcharge_rule import ClientServiceTypeSurchargeRule
+from models.global_setting import GlobalSetting
+
+
+class ServiceTypeSurchargesTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://")
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(GlobalSetting(key="express_service_surcharge", name="Express", value="3.00"))
+        db.session.add_all([
+            ClientServiceTypeSurchargeRule(client_id=1, service_label="EXPRESS", amount=Decimal("1.50")),
+            ClientServiceTypeSurchargeRule(client_id=2, service_label="EXPRESS", amount=Decimal("9.00"), is_active=False),
+            ClientServiceTypeSurchargeRule(client_id=3, service_label="NORMAL", amount=Decimal("0.75")),
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_batch_matches_single_lookups_in_two_queries(self):
+        pairs = [(1, "EXPRESS"), (2, "express"), (3, "NORMAL"), (4, "NORMAL"), (5, "EXPRESS")]
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            surcharges = resolve_client_service_type_surcharges(pairs)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        self.assertEqual(len(statements), 2)
+        for client_id, service_label in pairs:
+            self.assertEqual(
+                surcharges[(client_id, service_label.upper())],
+                resolve_client_service_type_surcharge(client_id, service_label),
+            )
+        self.assertEqual(surcharges[(1, "EXPRESS")], Decimal("1.50"))
+
+
+if __name__ == "__main__":
+    unittest.main()
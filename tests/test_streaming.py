@@ -0,0 +1,134 @@
+import json
+import unittest
+
+from flask import Flask, jsonify
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event
+
+from app.api.streaming import iter_query_by_key, requested_stream_format, stream_items
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.clients.phone_numbers import apply_phone_number
+from app.modules.clients.routes import clients_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.client import Client, ClientAddress, ClientPhone
+
+
+ROWS = [{"id": index, "name": f"row {index}", "tags": ["a", "b"], "note": None} for index in range(1, 8)]
+
+
+class StreamingTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test", RESPONSE_CACHE_ENABLED=False)
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        self.app.register_blueprint(clients_bp)
+
+        @self.app.route("/rows")
+        def rows():
+            stream_format = requested_stream_format()
+            if stream_format:
+                return stream_items(iter(ROWS), dict, stream_format, batch_size=3)
+            return jsonify(ROWS)
+
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        for client_id in range(1, 8):
+            phone = ClientPhone(is_primary=True)
+            apply_phone_number(phone, f"7000-000{client_id}")
+            db.session.add(Client(
+                id=client_id,
+                name=f"Cliente {client_id}",
+                phones=[phone],
+                addresses=[ClientAddress(address_text=f"Casa {client_id}")],
+            ))
+        db.session.add(Client(id=8, name="Borrado", is_deleted=True))
+        db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_streamed_array_matches_buffered_body(self):
+        buffered = self.client.get("/rows")
+        streamed = self.client.get("/rows?stream=json")
+
+        self.assertTrue(streamed.is_streamed)
+        self.assertEqual(streamed.mimetype, "application/json")
+        self.assertEqual(streamed.get_data(), buffered.get_data().rstrip(b"\n"))
+
+    def test_empty_stream_is_valid_json(self):
+        with self.app.test_request_context():
+            array = stream_items(iter([]), dict, "json")
+            enveloped = stream_items(iter([]), dict, "json", envelope={"pages": 1})
+
+            self.assertEqual(array.get_data(), b"[]")
+            self.assertEqual(json.loads(enveloped.get_data()), {"pages": 1, "items": [], "total": 0})
+
+    def test_ndjson_writes_one_item_per_line(self):
+        response = self.client.get("/rows", headers={"Accept": "application/x-ndjson"})
+
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        body = response.get_data(as_text=True)
+        self.assertTrue(body.endswith("\n"))
+        lines = body.split("\n")[:-1]
+        self.assertEqual([json.loads(line) for line in lines], ROWS)
+        self.assertTrue(all("\n" not in line and line for line in lines))
+
+    def test_client_export_matches_buffered_envelope(self):
+        for detail in ("false", "true"):
+            with self.subTest(detail=detail):
+                buffered = self.client.get(f"/clients?per_page=0&detail={detail}", headers=self.headers)
+                streamed = self.client.get(f"/clients?per_page=0&detail={detail}&stream=json", headers=self.headers)
+
+                self.assertTrue(streamed.is_streamed)
+                self.assertEqual(streamed.get_json(), buffered.get_json())
+                self.assertEqual(streamed.get_json()["total"], 7)
+
+    def test_lite_export_matches_buffered_envelope(self):
+        buffered = self.client.get("/clients/lite?per_page=0", headers=self.headers)
+        streamed = self.client.get("/clients/lite?per_page=0&stream=json", headers=self.headers)
+
+        self.assertEqual(streamed.get_json(), buffered.get_json())
+
+    def test_iter_query_by_key_pages_across_batch_boundaries(self):
+        query = Client.query.filter_by(is_deleted=False)
+        for batch_size in (1, 2, 3, 7, 10):
+            with self.subTest(batch_size=batch_size):
+                ids = [client.id for client in iter_query_by_key(query, Client.id, batch_size=batch_size)]
+                self.assertEqual(ids, list(range(1, 8)))
+
+        descending = [client.id for client in iter_query_by_key(query, Client.id, batch_size=3, descending=True)]
+        self.assertEqual(descending, list(range(7, 0, -1)))
+
+    def test_iter_query_by_key_stops_after_a_short_batch(self):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            if "FROM clients" in statement:
+                statements.append(statement)
+
+        query = Client.query.filter_by(is_deleted=False).with_entities(Client.id)
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            list(iter_query_by_key(query, Client.id, batch_size=3))
+            batches_for_partial_tail = len(statements)
+            statements.clear()
+            list(iter_query_by_key(query, Client.id, batch_size=7))
+            batches_for_exact_fit = len(statements)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+        self.assertEqual(batches_for_partial_tail, 3)
+        # A full last batch needs one more (empty) query to know it was the last.
+        self.assertEqual(batches_for_exact_fit, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,413 @@
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import Session
+
+from app.extensions.activity_log import activity_log
+from app.extensions.db import db
+from app.extensions.response_cache import init_response_cache
+from app.modules.laundry.v2.services.routes import laundry_service_v2_bp
+import models  # noqa: F401  (registers every table for create_all)
+from models.catalog_service_legacy import CatalogServiceLegacy
+from models.client import Client, ClientAddress
+from models.extra import Extra
+from models.laundry_activity_log import LaundryActivityLog
+from models.laundry_service import LaundryService
+from models.laundry_service_extra import LaundryServiceExtra
+from models.order_item import OrderItem
+from models.role import Role
+from models.service_category_legacy import ServiceCategoryLegacy
+from models.user import User
+
+
+PICKUP_AT = "2024-05-01T09:00:00"
+DELIVERY_SERVICE_ID = 1
+SURCHARGE_SERVICE_ID = 2
+IRONING_SERVICE_ID = 3
+
+
+class V2ServiceRouteTestCase(unittest.TestCase):
+    """A v2 laundry services app on SQLite with the catalogs every write route resolves."""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI="sqlite://", JWT_SECRET_KEY="test", RESPONSE_CACHE_ENABLED=False)
+        db.init_app(self.app)
+        JWTManager(self.app)
+        init_response_cache(self.app)
+        activity_log.configure(mode="sync")
+        self.app.register_blueprint(laundry_service_v2_bp)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add(Role(id=1, name="admin", description="test"))
+        db.session.add(User(id=1, username="ana", password="x", role_id=1, name="Ana"))
+        db.session.add(Client(id=1, name="Cliente", addresses=[ClientAddress(id=1, address_text="Casa")]))
+        db.session.add_all([
+            ServiceCategoryLegacy(id=1, name="Entrega"),
+            ServiceCategoryLegacy(id=2, name="Recargo"),
+            ServiceCategoryLegacy(id=3, name="Planchado"),
+        ])
+        db.session.add_all([
+            CatalogServiceLegacy(id=DELIVERY_SERVICE_ID, category_id=1, name="Entrega", pricing_mode="DELIVERY"),
+            CatalogServiceLegacy(id=SURCHARGE_SERVICE_ID, category_id=2, name="Recargo", pricing_mode="FIXED"),
+            CatalogServiceLegacy(id=IRONING_SERVICE_ID, category_id=3, name="Planchado", pricing_mode="FIXED"),
+        ])
+        db.session.add_all([
+            Extra(id=1, name="Suavizante", default_price=Decimal("1.00")),
+            Extra(id=2, name="Bolsa", default_price=Decimal("0.50")),
+        ])
+        db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+        self.statements = []
+
+    def tearDown(self):
+        self.stop_recording()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(" ".join(statement.split()))
+
+    def start_recording(self):
+        self.statements.clear()
+        event.listen(db.engine, "before_cursor_execute", self._record)
+
+    def stop_recording(self):
+        if event.contains(db.engine, "before_cursor_execute", self._record):
+            event.remove(db.engine, "before_cursor_execute", self._record)
+
+    def writes_to(self, table):
+        return [
+            statement for statement in self.statements
+            if statement.startswith((f"INSERT INTO {table} ", f"UPDATE {table} ", f"DELETE FROM {table} "))
+        ]
+
+    def create_service(self, **fields):
+        payload = {
+            "client_id": 1,
+            "client_address_id": 1,
+            "scheduled_pickup_at": PICKUP_AT,
+            "status": "PENDING",
+            "service_label": "NORMAL",
+            **fields,
+        }
+        response = self.client.post("/v2/laundry_services", json=payload, headers=self.headers)
+        self.assertEqual(response.status_code, 201, response.get_json())
+        return response.get_json()
+
+    def revision(self, service_id):
+        db.session.expire_all()
+        return db.session.get(LaundryService, service_id).updated_at.isoformat()
+
+    def patch_commercial_detail(self, service_id, **fields):
+        return self.client.patch(
+            f"/v2/laundry_services/{service_id}/commercial-detail",
+            json={"expected_updated_at": self.revision(service_id), **fields},
+            headers=self.headers,
+        )
+
+    def extra_rows(self, service_id):
+        return db.session.execute(
+            select(LaundryServiceExtra.id, LaundryServiceExtra.extra_id, LaundryServiceExtra.quantity)
+            .where(LaundryServiceExtra.laundry_service_id == service_id)
+            .order_by(LaundryServiceExtra.extra_id)
+        ).all()
+
+
+class CommercialDetailReconciliationTests(V2ServiceRouteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service_id = self.create_service()["id"]
+        response = self.patch_commercial_detail(
+            self.service_id,
+            extras=[
+                {"extra_id": 1, "quantity": 2, "unit_price": "1.00"},
+                {"extra_id": 2, "quantity": 1, "unit_price": "0.50"},
+            ],
+            order_items=[{"service_id": IRONING_SERVICE_ID, "quantity": 1, "unit_catalog_price": "3.00"}],
+        )
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.original_rows = self.extra_rows(self.service_id)
+
+    def test_resending_the_same_lines_writes_nothing(self):
+        self.start_recording()
+        response = self.patch_commercial_detail(
+            self.service_id,
+            extras=[
+                {"extra_id": "1", "quantity": 2, "unit_price": "1.00"},
+                {"extra_id": 2, "quantity": 1, "unit_price": "0.50"},
+            ],
+            order_items=[{"service_id": IRONING_SERVICE_ID, "quantity": 1, "unit_catalog_price": "3.00"}],
+        )
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(response.get_json()["changes"], {"order_items": None, "extras": None})
+        self.assertEqual(self.writes_to("laundry_service_extras"), [])
+        self.assertEqual(self.writes_to("order_items"), [])
+        self.assertEqual(self.extra_rows(self.service_id), self.original_rows)
+
+    def test_changed_lines_keep_their_ids(self):
+        kept_id = self.original_rows[0].id
+        self.start_recording()
+        response = self.patch_commercial_detail(
+            self.service_id,
+            extras=[{"extra_id": "1", "quantity": 5, "unit_price": "1.00"}],
+        )
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(
+            response.get_json()["changes"],
+            {"order_items": None, "extras": {"inserted": 0, "updated_ids": [kept_id], "deleted_ids": [self.original_rows[1].id]}},
+        )
+        self.assertEqual([tuple(row) for row in self.extra_rows(self.service_id)], [(kept_id, 1, 5)])
+        writes = self.writes_to("laundry_service_extras")
+        self.assertEqual([statement.split()[0] for statement in writes], ["DELETE", "UPDATE"])
+        db.session.expire_all()
+        self.assertEqual(db.session.get(LaundryService, self.service_id).extras_total, Decimal("5.00"))
+
+    def test_string_and_int_ids_are_the_same_extra(self):
+        response = self.patch_commercial_detail(
+            self.service_id,
+            extras=[
+                {"extra_id": "1", "quantity": 1, "unit_price": "1.00"},
+                {"extra_id": 1, "quantity": 2, "unit_price": "1.00"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Duplicate extra_id in extras payload"})
+        self.assertEqual(self.extra_rows(self.service_id), self.original_rows)
+
+    def test_non_numeric_extra_id_is_rejected(self):
+        response = self.patch_commercial_detail(
+            self.service_id,
+            extras=[{"extra_id": "uno", "quantity": 1, "unit_price": "1.00"}],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "extra_id must be an integer"})
+
+
+class HeaderPatchTests(V2ServiceRouteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service_id = self.create_service()["id"]
+
+    def patch_header(self, **fields):
+        return self.client.patch(
+            f"/v2/laundry_services/{self.service_id}/header",
+            json={"expected_updated_at": self.revision(self.service_id), **fields},
+            headers=self.headers,
+        )
+
+    def test_notes_only_patch_leaves_order_items_alone(self):
+        self.start_recording()
+        response = self.patch_header(notes="Sin almidon", service_label="NORMAL", fulfillment_type="WALK_IN")
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(self.writes_to("order_items"), [])
+        self.assertEqual(len(self.writes_to("laundry_services")), 1)
+        db.session.expire_all()
+        self.assertEqual(db.session.get(LaundryService, self.service_id).notes, "Sin almidon")
+
+    def test_fulfillment_change_rewrites_only_the_delivery_line(self):
+        self.start_recording()
+        response = self.patch_header(fulfillment_type="DELIVERY", manual_delivery_fee="2.50")
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        writes = self.writes_to("order_items")
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith("UPDATE order_items"))
+        delivery = OrderItem.query.filter_by(laundry_service_id=self.service_id, service_id=DELIVERY_SERVICE_ID).one()
+        self.assertEqual(delivery.applied_price, Decimal("2.50"))
+        self.assertEqual(db.session.get(LaundryService, self.service_id).grand_total, Decimal("2.50"))
+
+    def test_unchanged_header_writes_nothing(self):
+        self.start_recording()
+        response = self.patch_header(service_label="NORMAL")
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual([statement for statement in self.statements if not statement.startswith("SELECT")], [])
+
+
+class CreateTransactionTests(V2ServiceRouteTestCase):
+    def count(self, model):
+        return db.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_failing_nested_row_rolls_back_the_whole_create(self):
+        response = self.client.post(
+            "/v2/laundry_services",
+            json={
+                "client_id": 1,
+                "client_address_id": 1,
+                "scheduled_pickup_at": PICKUP_AT,
+                "status": "PENDING",
+                "service_label": "NORMAL",
+                "order_items": [{"service_id": IRONING_SERVICE_ID, "quantity": 1, "unit_catalog_price": "3.00"}],
+                "extras": [{"extra_id": 99, "quantity": 1, "unit_price": "1.00"}],
+            },
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Extra not found"})
+        for model in (LaundryService, OrderItem, LaundryServiceExtra, LaundryActivityLog):
+            self.assertEqual(self.count(model), 0, model.__tablename__)
+        # The queue slot was not consumed either.
+        self.assertEqual(self.create_service()["pending_order"], 1)
+
+    def test_successful_create_commits_once(self):
+        commits = []
+
+        def record_commit(session):
+            commits.append(session)
+
+        event.listen(Session, "after_commit", record_commit)
+        try:
+            created = self.create_service(
+                order_items=[{"service_id": IRONING_SERVICE_ID, "quantity": 2, "unit_catalog_price": "3.00"}],
+                extras=[{"extra_id": 1, "quantity": 1, "unit_price": "1.00"}],
+            )
+        finally:
+            event.remove(Session, "after_commit", record_commit)
+
+        self.assertEqual(len(commits), 1)
+        service = db.session.get(LaundryService, created["id"])
+        self.assertEqual(
+            (service.subtotal, service.extras_total, service.grand_total),
+            (Decimal("6.00"), Decimal("1.00"), Decimal("7.00")),
+        )
+        self.assertEqual(self.count(OrderItem), 3)
+        self.assertEqual(self.count(LaundryActivityLog), 1)
+
+
+class BulkIntakeTests(V2ServiceRouteTestCase):
+    def setUp(self):
+        super().setUp()
+        db.session.add(Client(id=2, name="Otro", addresses=[ClientAddress(id=2, address_text="Oficina")]))
+        db.session.commit()
+        # Enables the broadcast; post_bulk patches the queue emits to count them.
+        self.app.extensions["socketio"] = mock.Mock()
+
+    def row(self, **fields):
+        return {
+            "client_id": 1,
+            "client_address_id": 1,
+            "scheduled_pickup_at": PICKUP_AT,
+            "status": "PENDING",
+            "service_label": "NORMAL",
+            **fields,
+        }
+
+    def post_bulk(self, rows):
+        with mock.patch("app.modules.laundry.v2.services.routes.emit_queue_updated") as emit:
+            response = self.client.post("/v2/laundry_services/bulk", json={"services": rows}, headers=self.headers)
+        self.emits = emit.call_args_list
+        return response
+
+    def test_all_rows_accepted_is_201_with_consecutive_queue_slots(self):
+        self.create_service()
+        self.start_recording()
+        response = self.post_bulk([self.row(), self.row(client_id=2, client_address_id=2), self.row(status="IN_PROGRESS"), self.row()])
+        self.stop_recording()
+
+        self.assertEqual(response.status_code, 201, response.get_json())
+        body = response.get_json()
+        self.assertEqual(body["created"], 4)
+        self.assertEqual([item["index"] for item in body["items"]], [0, 1, 2, 3])
+        self.assertEqual([item["pending_order"] for item in body["items"]], [2, 3, None, 4])
+        self.assertEqual(len(self.writes_to("order_items")), 1)
+        self.assertEqual(OrderItem.query.count(), 2 * 5)
+        # One broadcast for the request: the global queue plus one per touched status.
+        self.assertEqual(
+            [call.kwargs["statuses"] for call in self.emits],
+            [None, ["IN_PROGRESS"], ["PENDING"]],
+        )
+
+    def test_partial_success_is_207_with_per_index_errors(self):
+        response = self.post_bulk([
+            self.row(),
+            self.row(client_id=99),
+            self.row(client_address_id=2),
+            "not an object",
+            self.row(status="LOST"),
+            self.row(),
+        ])
+
+        self.assertEqual(response.status_code, 207, response.get_json())
+        items = response.get_json()["items"]
+        self.assertEqual([item["status"] for item in items], [201, 404, 400, 400, 400, 201])
+        self.assertEqual(items[1]["error"], "Client not found")
+        self.assertEqual(items[2]["error"], "Address does not belong to client")
+        self.assertEqual(items[3]["error"], "Each service must be an object")
+        self.assertIn("status", items[4]["error"])
+        self.assertEqual([items[0]["pending_order"], items[5]["pending_order"]], [1, 2])
+        self.assertEqual(LaundryService.query.count(), 2)
+
+    def test_no_accepted_rows_is_400_and_writes_nothing(self):
+        response = self.post_bulk([self.row(client_id=99), self.row(client_address_id=2)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["created"], 0)
+        self.assertEqual([item["index"] for item in response.get_json()["items"]], [0, 1])
+        self.assertEqual(LaundryService.query.count(), 0)
+        self.assertEqual(self.emits, [])
+
+    def test_request_shape_and_size_are_checked(self):
+        self.app.config["BULK_INTAKE_MAX_SERVICES"] = 2
+
+        self.assertEqual(self.post_bulk([]).status_code, 400)
+        too_many = self.post_bulk([self.row(), self.row(), self.row()])
+        self.assertEqual(too_many.status_code, 400)
+        self.assertEqual(too_many.get_json(), {"error": "A bulk intake can hold at most 2 services"})
+
+    def enforce_foreign_keys(self):
+        # SQLite leaves foreign keys unchecked unless asked; MySQL always checks them.
+        db.session.execute(text("PRAGMA foreign_keys=ON"))
+        db.session.commit()
+
+    def test_unknown_transaction_is_reported_per_row(self):
+        self.enforce_foreign_keys()
+
+        response = self.post_bulk([self.row(), self.row(transaction_id=999), self.row()])
+
+        self.assertEqual(response.status_code, 207, response.get_json())
+        items = response.get_json()["items"]
+        self.assertEqual([item["status"] for item in items], [201, 404, 201])
+        self.assertEqual(items[1]["error"], "Transaction not found")
+        self.assertEqual(LaundryService.query.count(), 2)
+
+    def test_foreign_key_failure_rolls_back_and_reports_409(self):
+        self.enforce_foreign_keys()
+        # A still-valid token for a user that no longer exists: created_by_user_id breaks its foreign key.
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='99')}"}
+
+        with self.assertLogs(self.app.logger, "ERROR"):
+            response = self.post_bulk([self.row(), self.row(client_id=99)])
+
+        self.assertEqual(response.status_code, 409)
+        body = response.get_json()
+        self.assertEqual((body["error"], body["created"]), ("The services could not be stored", 0))
+        self.assertEqual([item["status"] for item in body["items"]], [409, 404])
+        for model in (LaundryService, OrderItem, LaundryActivityLog):
+            self.assertEqual(model.query.count(), 0, model.__tablename__)
+        self.assertEqual(self.emits, [])
+        # The session was rolled back and keeps working.
+        self.headers = {"Authorization": f"Bearer {create_access_token(identity='1')}"}
+        self.assertEqual(self.post_bulk([self.row()]).status_code, 201)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Production entry point: `gunicorn -c gunicorn.conf.py wsgi:application`.
+
+By default (SOCKETIO_ASYNC_MODE=threading) the app is served from gunicorn's
+gthread worker. With SOCKETIO_ASYNC_MODE=eventlet the standard library is
+monkey patched before the app, PyMySQL or any thread is imported, so
+database queries and WebSocket traffic yield to other green threads instead
+of blocking the worker. Anything that does not yield (CPU work, SQLite)
+runs to completion first, so under a busy HTTP load Socket.IO acks wait
+behind it; compare both modes with benchmarks/serving_load_test.py before
+switching.
+"""
+import os
+
+if os.getenv("SOCKETIO_ASYNC_MODE", "threading").strip().lower() == "eventlet":
+    import eventlet
+
+    eventlet.monkey_patch()
+
+from app import create_app  # noqa: E402  (must come after monkey patching)
+from app.modules.auth.token_store import init_refresh_token_store  # noqa: E402
+from app.modules.clients.search import start_client_search_build  # noqa: E402
+
+application = create_app()
+
+# Background work that only a serving process needs. /clients/search answers
+# from SQL until the index build finishes.
+if application.config["CLIENT_SEARCH_WARMUP"]:
+    start_client_search_build(application)
+init_refresh_token_store(application)